@@ -0,0 +1,108 @@
+"""
+Benchmark for BookingDTO construction.
+
+Compares pydantic validation (`BookingDTO(**values)`, what the mapper uses)
+against the unvalidated public `BookingDTO.model_construct`: DTO construction
+throughput and memory held by 100k DTOs, plus end-to-end mapping throughput.
+
+    python -m benchmarks.bench_dto [records]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from pms_integration.dtos.booking_dto import BookingDTO
+from pms_integration.services.mapper import GenericJsonMapper
+
+CONFIG = {
+    "field_mappings": {
+        "booking_id": "$.id",
+        "guest_name": "$.guest",
+        "room_type": "$.room",
+        "check_in": {"path": "$.start", "transform": "parse_date"},
+        "check_out": {"path": "$.end", "transform": "parse_date"},
+        "total_amount": "$.amount",
+        "status": {"path": "$.status", "transform": "map_status"},
+    },
+    "status_mappings": {"CONFIRMED": "confirmed"},
+    "validation_rules": {
+        "required_fields": ["booking_id", "guest_name", "check_in", "check_out"],
+        "fields": {
+            "total_amount": {"type": "decimal", "min": 0},
+            "status": {"type": "enum", "allowed": ["confirmed"]},
+        },
+    },
+}
+
+
+def raw_record(i: int) -> dict:
+    start = datetime(2025, 7, 1, 14) + timedelta(days=i % 300)
+    return {
+        "id": f"B{i:07}",
+        "guest": f"Guest {i}",
+        "room": "Deluxe",
+        "start": start.isoformat(),
+        "end": (start + timedelta(days=3)).isoformat(),
+        "amount": 120.5 + i % 100,
+        "status": "CONFIRMED",
+    }
+
+
+def mapped_record(i: int) -> dict:
+    start = datetime(2025, 7, 1, 14) + timedelta(days=i % 300)
+    return {
+        "booking_id": f"B{i:07}",
+        "guest_name": f"Guest {i}",
+        "room_type": "Deluxe",
+        "check_in": start,
+        "check_out": start + timedelta(days=3),
+        "total_amount": Decimal("120.50"),
+        "status": "confirmed",
+    }
+
+
+def run(label: str, fn, items: list) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    elapsed = time.perf_counter() - start
+    rate = len(items) / elapsed
+    print(f"{label:<18} {len(items):>8} records  {rate:>12,.0f} records/sec")
+    return rate
+
+
+def retained(fn, items: list) -> int:
+    gc.collect()
+    tracemalloc.start()
+    dtos = [fn(item) for item in items]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del dtos
+    return size
+
+
+def main(n: int = 100000) -> None:
+    mapped = [mapped_record(i) for i in range(n)]
+    raws = [raw_record(i) for i in range(n)]
+    builders = (
+        ("validate", lambda values: BookingDTO(**values)),
+        ("model_construct", lambda values: BookingDTO.model_construct(**values)),
+    )
+
+    rates = [run(label, fn, mapped) for label, fn in builders]
+    print(f"ratio              {rates[1] / rates[0]:.1f}x\n")
+
+    run("map", GenericJsonMapper(CONFIG).map, raws)
+    print()
+
+    for label, fn in builders:
+        size = retained(fn, mapped)
+        print(f"{label:<18} {size / n * 100000 / 2**20:>8.1f} MiB per 100k DTOs")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
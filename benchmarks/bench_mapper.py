@@ -0,0 +1,65 @@
+"""
+Micro-benchmark for GenericJsonMapper field extraction.
+
+Compares the compiled mapping plan against re-parsing every JSONPath
+expression per record (the pre-compilation behaviour).
+
+    python -m benchmarks.bench_mapper [records]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+from jsonpath_ng import parse as jsonpath_parse
+from pms_integration.services.mapper import GenericJsonMapper
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+CONFIG_PATH = BASE_DIR / "pms_configs" / "sample_pms_v1.json"
+PAYLOAD_PATH = BASE_DIR / "mock_data" / "mock_pms_bookings_payload.json"
+
+
+def legacy_map_fields(mapper: GenericJsonMapper, raw: dict) -> dict:
+    def extract(path):
+        result = jsonpath_parse(path).find(raw)
+        return result[0].value if result else None
+
+    mapped = {}
+    for field, config in mapper.config["field_mappings"].items():
+        if isinstance(config, str):
+            mapped[field] = extract(config)
+        elif "template" in config:
+            fields = {k: extract(v) for k, v in config["fields"].items()}
+            mapped[field] = config["template"].format(**fields)
+        else:
+            value = extract(config["path"])
+            if transform := config.get("transform"):
+                value = mapper.transforms[transform](value)
+            mapped[field] = value
+    return mapped
+
+
+def run(label: str, fn, records: list) -> float:
+    start = time.perf_counter()
+    for raw in records:
+        fn(raw)
+    elapsed = time.perf_counter() - start
+    rate = len(records) / elapsed
+    print(f"{label:<10} {len(records):>8} records  {rate:>12,.0f} records/sec")
+    return rate
+
+
+def main(n: int = 20000) -> None:
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    sample = json.loads(PAYLOAD_PATH.read_text(encoding="utf-8"))[0]
+    records = [sample] * n
+
+    mapper = GenericJsonMapper(config)
+    before = run("legacy", lambda raw: legacy_map_fields(mapper, raw), records)
+    after = run("compiled", mapper._map_fields, records)
+    print(f"speedup    {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
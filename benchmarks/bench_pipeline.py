@@ -0,0 +1,244 @@
+"""
+Benchmark suite for the ingestion pipeline.
+
+Runs synthetic reservations (benchmarks.generator) through each stage of the
+pipeline with the `pms_configs/sample_pms_v1.json` mapping:
+
+    map       JSONPath extraction (compiled field plan)
+    validate  raw schema, business rules and sanitization
+    dto       BookingDTO construction
+    upsert    BookingIngestor.save_bookings, in batches of 500
+    api       bookings API pages (keyset pagination + fast serializer)
+
+and prints records/sec, p50/p99 per-record latency and query counts. For the
+batched stages (upsert, api) a record's latency is its batch time divided by
+the batch size. Writes go to a throwaway test database.
+
+Results are compared against benchmarks/baseline.json (recorded with the same
+parameters via --save-baseline); --check exits non-zero when a stage is
+slower than the baseline by more than --tolerance or issues more queries.
+
+    python -m benchmarks.bench_pipeline [records] [--invalid-ratio 0.05]
+        [--guests 1000] [--room-types 5] [--save-baseline] [--check]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pms_integration.settings")
+django.setup()
+
+from benchmarks.generator import generate_bookings  # noqa: E402
+from django.db import connection  # noqa: E402
+from pms_integration.exceptions import PMSIntegrationError  # noqa: E402
+from pms_integration.models.booking import Booking  # noqa: E402
+from pms_integration.models.hotel import Hotel, PMSConfig  # noqa: E402
+from pms_integration.serializers.booking_serializer import (  # noqa: E402
+    FastBookingSerializer,
+)
+from pms_integration.services.ingestor import BookingIngestor  # noqa: E402
+from pms_integration.services.mapper import GenericJsonMapper  # noqa: E402
+from pms_integration.services.metrics import QueryCounter  # noqa: E402
+from pms_integration.views.pagination import KeysetPaginator  # noqa: E402
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+CONFIG_PATH = BASE_DIR / "pms_configs" / "sample_pms_v1.json"
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+UPSERT_BATCH = 500
+API_PAGE_SIZE = 100
+
+
+class StageResult:
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies: List[float] = []
+        self.elapsed = 0.0
+        self.queries = 0
+
+    def time(self, fn: Callable, *args, records: int = 1):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.elapsed += elapsed
+            self.latencies.extend([elapsed / records] * records)
+
+    def summary(self) -> Dict[str, float]:
+        latencies = sorted(self.latencies)
+        n = len(latencies)
+        return {
+            "records": n,
+            "records_per_sec": round(n / self.elapsed) if self.elapsed else 0,
+            "p50_us": round(latencies[n // 2] * 1e6, 2) if n else 0,
+            "p99_us": round(latencies[min(n - 1, n * 99 // 100)] * 1e6, 2) if n else 0,
+            "queries": self.queries,
+        }
+
+
+def run_mapping(
+    mapper: GenericJsonMapper, raws: List[dict]
+) -> Tuple[Dict[str, StageResult], list]:
+    stages = {name: StageResult(name) for name in ("map", "validate", "dto")}
+    validator = mapper.validator
+    dtos = []
+
+    def validate(raw, mapped):
+        validator.validate_raw_schema(raw)
+        return validator.sanitize_data(validator.validate_business_rules(mapped))
+
+    for raw in raws:
+        try:
+            mapped = stages["map"].time(mapper._map_fields, raw)
+            mapped = stages["validate"].time(validate, raw, mapped)
+            dtos.append(stages["dto"].time(mapper._build_dto, mapped))
+        except PMSIntegrationError:
+            continue
+    return stages, dtos
+
+
+def run_upsert(hotel: Hotel, dtos: list) -> StageResult:
+    stage = StageResult("upsert")
+    ingestor = BookingIngestor(hotel.id)
+    counter = QueryCounter()
+    with connection.execute_wrapper(counter):
+        for i in range(0, len(dtos), UPSERT_BATCH):
+            batch = dtos[i : i + UPSERT_BATCH]
+            stage.time(ingestor.save_bookings, batch, records=len(batch))
+    stage.queries = counter.count
+    return stage
+
+
+def run_api(hotel: Hotel) -> StageResult:
+    stage = StageResult("api")
+    paginator = KeysetPaginator(API_PAGE_SIZE)
+    serializer = FastBookingSerializer()
+    bookings = serializer.values(
+        Booking.objects.filter(hotel=hotel), "updated_at", "id"
+    ).order_by("-updated_at", "-id")
+
+    def render_page(cursor):
+        rows, next_cursor = paginator.paginate(bookings, cursor)
+        return serializer.serialize(rows), next_cursor
+
+    counter = QueryCounter()
+    cursor = None
+    with connection.execute_wrapper(counter):
+        while True:
+            start = time.perf_counter()
+            data, cursor = render_page(cursor)
+            elapsed = time.perf_counter() - start
+            stage.elapsed += elapsed
+            stage.latencies.extend([elapsed / max(len(data), 1)] * len(data))
+            if not cursor:
+                break
+    stage.queries = counter.count
+    return stage
+
+
+def run(args) -> Dict[str, Dict[str, float]]:
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    mapper = GenericJsonMapper(config)
+    raws = list(
+        generate_bookings(
+            args.records, args.invalid_ratio, args.guests, args.room_types, args.seed
+        )
+    )
+
+    stages, dtos = run_mapping(mapper, raws)
+
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        pms_config = PMSConfig.objects.create(
+            name="bench", version="v1", config_file_path=str(CONFIG_PATH)
+        )
+        hotel = Hotel.objects.create(name="Bench Hotel", pms_config=pms_config)
+        stages["upsert"] = run_upsert(hotel, dtos)
+        stages["api"] = run_api(hotel)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    return {name: stage.summary() for name, stage in stages.items()}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Prints results next to the baseline; returns the regressions found."""
+    regressions = []
+    print(
+        f"{'stage':<10} {'records':>8} {'records/sec':>12} {'p50 us':>9} "
+        f"{'p99 us':>9} {'queries':>8} {'vs baseline':>12}"
+    )
+    for name, result in results.items():
+        base = baseline.get(name)
+        delta = ""
+        if base and base["records_per_sec"]:
+            change = result["records_per_sec"] / base["records_per_sec"] - 1
+            delta = f"{change:+.1%}"
+            if change < -tolerance:
+                regressions.append(f"{name}: {delta} records/sec")
+            if result["queries"] > base["queries"]:
+                regressions.append(
+                    f"{name}: {result['queries']} queries (baseline {base['queries']})"
+                )
+        print(
+            f"{name:<10} {result['records']:>8} {result['records_per_sec']:>12,} "
+            f"{result['p50_us']:>9.2f} {result['p99_us']:>9.2f} "
+            f"{result['queries']:>8} {delta:>12}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("records", type=int, nargs="?", default=10000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.05)
+    parser.add_argument("--guests", type=int, default=1000)
+    parser.add_argument("--room-types", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    params = {
+        "records": args.records,
+        "invalid_ratio": args.invalid_ratio,
+        "guests": args.guests,
+        "room_types": args.room_types,
+        "seed": args.seed,
+    }
+    results = run(args)
+
+    baseline = {}
+    if BASELINE_PATH.exists():
+        stored = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+        if stored["params"] == params:
+            baseline = stored["stages"]
+        else:
+            print("Baseline was recorded with different parameters; not comparing\n")
+
+    regressions = compare(results, baseline, args.tolerance)
+
+    if args.save_baseline:
+        BASELINE_PATH.write_text(
+            json.dumps({"params": params, "stages": results}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print(f"\nBaseline saved to {BASELINE_PATH}")
+
+    if regressions:
+        print("\nRegressions:\n  " + "\n  ".join(regressions))
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
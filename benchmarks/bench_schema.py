@@ -0,0 +1,89 @@
+"""
+Micro-benchmark for DataValidator raw schema validation.
+
+Compares jsonschema.validate() per record (the previous behaviour, which
+re-checks the schema and builds a validator on every call) against the
+validator compiled once per config, record by record and in batch mode.
+
+    python -m benchmarks.bench_schema [records]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+from jsonschema import validate as jsonschema_validate
+from pms_integration.services.data_validator import DataValidator
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PAYLOAD_PATH = BASE_DIR / "mock_data" / "mock_pms_bookings_payload.json"
+
+RAW_DATA_SCHEMA = {
+    "type": "object",
+    "required": ["reservation", "guest"],
+    "properties": {
+        "reservation": {
+            "type": "object",
+            "required": ["confirmationNumber", "roomStay", "reservationStatus"],
+            "properties": {
+                "confirmationNumber": {"type": "string"},
+                "roomStay": {
+                    "type": "object",
+                    "required": ["timeSpan"],
+                    "properties": {
+                        "timeSpan": {
+                            "type": "object",
+                            "required": ["start", "end"],
+                            "properties": {
+                                "start": {"type": "string"},
+                                "end": {"type": "string"},
+                            },
+                        }
+                    },
+                },
+                "reservationStatus": {
+                    "type": "object",
+                    "properties": {"code": {"type": "string"}},
+                },
+            },
+        },
+        "guest": {
+            "type": "object",
+            "properties": {"profile": {"type": "object"}},
+        },
+    },
+}
+
+
+def report(label: str, elapsed: float, n: int) -> None:
+    print(f"{label:<10} {n:>8} records  {elapsed / n * 1e6:>8.2f} us/record")
+
+
+def main(n: int = 10000) -> None:
+    sample = json.loads(PAYLOAD_PATH.read_text(encoding="utf-8"))[0]
+    records = [sample] * n
+    validator = DataValidator({"raw_data_schema": RAW_DATA_SCHEMA})
+
+    start = time.perf_counter()
+    for raw in records:
+        jsonschema_validate(instance=raw, schema=RAW_DATA_SCHEMA)
+    legacy = time.perf_counter() - start
+    report("legacy", legacy, n)
+
+    start = time.perf_counter()
+    for raw in records:
+        validator.validate_raw_schema(raw)
+    compiled = time.perf_counter() - start
+    report("compiled", compiled, n)
+
+    start = time.perf_counter()
+    validator.validate_raw_schema_many(records)
+    batch = time.perf_counter() - start
+    report("batch", batch, n)
+
+    print(f"speedup    {legacy / compiled:.1f}x (batch {legacy / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
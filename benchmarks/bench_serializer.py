@@ -0,0 +1,88 @@
+"""
+Benchmark for the bookings API serializer.
+
+Serializes 10k and 100k bookings read from a throwaway test database with
+the DRF `BookingSerializer` and with `FastBookingSerializer` (`.values()`
+plus precomputed per-field converters), including the query, and checks
+that both render the same JSON bytes.
+
+    python -m benchmarks.bench_serializer [records ...]
+"""
+
+import os
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pms_integration.settings")
+django.setup()
+
+from django.db import connection  # noqa: E402
+from pms_integration.models.booking import Booking  # noqa: E402
+from pms_integration.models.hotel import Hotel, PMSConfig  # noqa: E402
+from pms_integration.serializers.booking_serializer import (  # noqa: E402
+    BookingSerializer,
+    FastBookingSerializer,
+)
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+
+def create_bookings(hotel: Hotel, n: int) -> None:
+    Booking.objects.filter(hotel=hotel).delete()
+    Booking.objects.bulk_create(
+        (
+            Booking(
+                hotel=hotel,
+                booking_id=f"B{i:07}",
+                guest_name=f"Guest {i}",
+                check_in=date(2025, 1, 1) + timedelta(days=i % 365),
+                check_out=date(2025, 1, 4) + timedelta(days=i % 365),
+                status="confirmed",
+                total_amount=Decimal(120 + i % 1000) / 4,
+            )
+            for i in range(n)
+        ),
+        batch_size=5000,
+    )
+
+
+def run(label: str, fn, n: int):
+    start = time.perf_counter()
+    data = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<6} {n:>8} records  {n / elapsed:>12,.0f} records/sec")
+    return data, n / elapsed
+
+
+def main(sizes) -> None:
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        pms_config = PMSConfig.objects.create(
+            name="bench", version="v1", config_file_path="pms_configs/bench.json"
+        )
+        hotel = Hotel.objects.create(name="Bench Hotel", pms_config=pms_config)
+        bookings = Booking.objects.filter(hotel=hotel).order_by("-updated_at", "-id")
+        fast = FastBookingSerializer()
+
+        for n in sizes:
+            create_bookings(hotel, n)
+            drf, drf_rate = run(
+                "drf", lambda: BookingSerializer(bookings.all(), many=True).data, n
+            )
+            data, fast_rate = run(
+                "fast", lambda: fast.serialize(fast.values(bookings)), n
+            )
+            renderer = JSONRenderer()
+            same = renderer.render(drf) == renderer.render(data)
+            print(f"speedup {fast_rate / drf_rate:.1f}x, identical output: {same}\n")
+            if not same:
+                sys.exit(1)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10000, 100000])
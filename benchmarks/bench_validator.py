@@ -0,0 +1,127 @@
+"""
+Micro-benchmark for DataValidator.validate_business_rules.
+
+Compares the compiled validation plan against interpreting
+`validation_rules` for every record (the pre-compilation behaviour).
+
+    python -m benchmarks.bench_validator [records]
+"""
+
+import re
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from pms_integration.exceptions import PMSBusinessRuleError
+from pms_integration.services.data_validator import DataValidator
+
+CONFIG = {
+    "validation_rules": {
+        "required_fields": ["booking_id", "guest_name", "check_in", "check_out"],
+        "fields": {
+            "guest_email": {"type": "email"},
+            "check_in": {"type": "date"},
+            "check_out": {"type": "date"},
+            "total_amount": {"type": "decimal", "min": 0, "max": 999999.99},
+            "status": {
+                "type": "enum",
+                "allowed": ["confirmed", "pending", "cancelled", "checked_in"],
+            },
+        },
+        "business_rules": {"max_booking_days": 365},
+    }
+}
+
+RECORD = {
+    "booking_id": "ABC123",
+    "guest_name": "John Doe",
+    "guest_email": "john.doe@example.com",
+    "check_in": "2025-07-05T14:00:00",
+    "check_out": "2025-07-07T10:00:00",
+    "total_amount": "200.00",
+    "status": "confirmed",
+}
+
+
+def legacy_parse_date(value, fmt):
+    if not value or not isinstance(value, str):
+        return None
+    formats = {
+        "ISO8601": "%Y-%m-%dT%H:%M:%S",
+        "YYYY-MM-DD": "%Y-%m-%d",
+        "DD/MM/YYYY": "%d/%m/%Y",
+        "MM/DD/YYYY": "%m/%d/%Y",
+    }
+    pattern = formats.get(fmt)
+    if not pattern:
+        return None
+    try:
+        return datetime.strptime(value, pattern).date()
+    except ValueError:
+        return None
+
+
+def legacy_validate(validation_rules: dict, mapped_data: dict) -> dict:
+    errors = []
+    for field in validation_rules.get("required_fields", []):
+        if not mapped_data.get(field):
+            errors.append(f"Required field '{field}' is missing or empty")
+
+    for field, rules in validation_rules.get("fields", {}).items():
+        val = mapped_data.get(field)
+        if rules.get("type") == "date":
+            if not legacy_parse_date(val, rules.get("format", "ISO8601")):
+                errors.append(f"Invalid date format for field '{field}': {val}")
+        elif rules.get("type") == "decimal":
+            try:
+                amount = Decimal(str(val))
+                if "min" in rules and amount < Decimal(str(rules["min"])):
+                    errors.append(f"{field} below minimum value")
+                if "max" in rules and amount > Decimal(str(rules["max"])):
+                    errors.append(f"{field} exceeds maximum value")
+            except (InvalidOperation, TypeError):
+                errors.append(f"{field} must be a valid decimal")
+        elif rules.get("type") == "enum":
+            if val not in rules.get("allowed", []):
+                errors.append(f"Invalid value for '{field}': {val}")
+        elif rules.get("type") == "email":
+            pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+            if val and not re.match(pattern, val):
+                errors.append(f"Invalid email format: {val}")
+
+    check_in = legacy_parse_date(mapped_data.get("check_in"), "ISO8601")
+    check_out = legacy_parse_date(mapped_data.get("check_out"), "ISO8601")
+    if check_in and check_out:
+        if check_out <= check_in:
+            errors.append("Check-out date must be after check-in date")
+        max_days = validation_rules.get("business_rules", {}).get(
+            "max_booking_days", 365
+        )
+        if (check_out - check_in).days > max_days:
+            errors.append(f"Booking duration exceeds {max_days} days")
+
+    if errors:
+        raise PMSBusinessRuleError("; ".join(errors))
+    return mapped_data
+
+
+def run(label: str, fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn(RECORD)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {n:>8} records  {elapsed / n * 1e6:>8.2f} us/record")
+    return elapsed
+
+
+def main(n: int = 50000) -> None:
+    validator = DataValidator(CONFIG)
+    rules = CONFIG["validation_rules"]
+    before = run("legacy", lambda r: legacy_validate(rules, r), n)
+    after = run("compiled", validator.validate_business_rules, n)
+    print(f"speedup    {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,121 @@
+"""
+Synthetic PMS payload generator.
+
+Emits reservations in the shape `pms_configs/sample_pms_v1.json` maps (the
+shape of `mock_data/mock_pms_bookings_payload.json`), with a controllable
+share of invalid records, guest reuse and room-type cardinality. With
+`--properties N` records are spread over N property codes
+(`reservation.hotelCode`), as in a multi-property account export.
+
+    python -m benchmarks.generator 10000 --invalid-ratio 0.05 > bookings.json
+"""
+
+import argparse
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Iterator
+
+FIRST_NAMES = ["John", "Jane", "Ana", "Wei", "Omar", "Priya", "Lars", "Yuki", "Sam"]
+LAST_NAMES = ["Doe", "Smith", "Garcia", "Chen", "Haddad", "Patel", "Berg", "Sato"]
+STATUS_CODES = ["CONFIRMED", "CONFIRMED", "CONFIRMED", "CANCELLED", "CHECKED_IN"]
+
+# Ways a generated record can be invalid, and the stage that rejects it
+INVALID_KINDS = (
+    "missing_booking_id",  # required field
+    "unknown_status",  # unmapped status code
+    "check_out_before_check_in",  # business rule
+    "negative_amount",  # decimal bounds
+)
+
+
+def generate_bookings(
+    n: int,
+    invalid_ratio: float = 0.0,
+    guests: int = 1000,
+    room_types: int = 5,
+    seed: int = 0,
+    properties: int = 0,
+) -> Iterator[dict]:
+    """
+    Yields `n` raw reservations. About `invalid_ratio` of them are invalid
+    (spread over INVALID_KINDS); guest names are drawn from a pool of `guests`
+    distinct guests and room types from `room_types` codes.
+    """
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1, 14)
+    codes = [f"RT{i:03}" for i in range(room_types)]
+
+    for i in range(n):
+        guest = rng.randrange(guests)
+        first = FIRST_NAMES[guest % len(FIRST_NAMES)]
+        last = f"{LAST_NAMES[guest % len(LAST_NAMES)]}{guest}"
+        check_in = base + timedelta(days=rng.randrange(365), hours=rng.randrange(4))
+        check_out = check_in + timedelta(days=rng.randint(1, 14), hours=-4)
+        amount = f"{rng.uniform(80, 2500):.2f}"
+        status = rng.choice(STATUS_CODES)
+        booking_id = f"SYN{i:08}"
+
+        if rng.random() < invalid_ratio:
+            kind = INVALID_KINDS[i % len(INVALID_KINDS)]
+            if kind == "missing_booking_id":
+                booking_id = None
+            elif kind == "unknown_status":
+                status = "NO_SUCH_STATUS"
+            elif kind == "check_out_before_check_in":
+                check_out = check_in - timedelta(days=1)
+            else:
+                amount = "-10.00"
+
+        reservation = {
+            "roomStay": {
+                "timeSpan": {
+                    "start": check_in.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "end": check_out.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                },
+                "roomType": {"roomTypeCode": rng.choice(codes)},
+                "total": {"amountAfterTax": amount},
+            },
+            "reservationStatus": {"code": status},
+        }
+        if booking_id is not None:
+            reservation["confirmationNumber"] = booking_id
+        if properties:
+            reservation["hotelCode"] = f"H{i % properties:03}"
+
+        yield {
+            "reservation": reservation,
+            "guest": {
+                "profile": {
+                    "firstName": first,
+                    "lastName": last,
+                    "email": f"{first}.{last}@example.com".lower(),
+                }
+            },
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("records", type=int, nargs="?", default=1000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.0)
+    parser.add_argument("--guests", type=int, default=1000)
+    parser.add_argument("--room-types", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--properties", type=int, default=0)
+    args = parser.parse_args()
+
+    records = generate_bookings(
+        args.records,
+        args.invalid_ratio,
+        args.guests,
+        args.room_types,
+        args.seed,
+        args.properties,
+    )
+    json.dump(list(records), sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,3 +14,4 @@ class BookingDTO(BaseModel):
     check_out: datetime
     total_amount: Decimal | None = None
     status: BookingStatus
+    source_hash: str | None = None
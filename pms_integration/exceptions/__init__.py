@@ -26,3 +26,9 @@ class PMSBusinessRuleError(PMSIntegrationError):
     """Raised when domain-specific business rules are violated."""
 
     pass
+
+
+class SyncLeaseError(PMSIntegrationError):
+    """Raised when a hotel's sync lease is held by another worker or was lost."""
+
+    pass
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from pms_integration.models.hotel import Hotel
+from pms_integration.services.config_registry import mapper_registry
+from pms_integration.services.dead_letter import DeadLetterStore
+from pms_integration.services.ingestor import BookingIngestor
+
+
+class Command(BaseCommand):
+    help = "Replay dead-lettered bookings through the current PMS configuration"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hotel", type=int, action="append", help="Only replay these hotel ids"
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Also replay records rejected by the current config version",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        hotels = Hotel.objects.select_related("pms_config").filter(
+            rejected_bookings__isnull=False
+        )
+        if options["hotel"]:
+            hotels = hotels.filter(id__in=options["hotel"])
+        hotels = list(hotels.distinct())
+
+        if not hotels:
+            self.stdout.write(self.style.WARNING("No rejected bookings to replay"))
+            return
+
+        for hotel in hotels:
+            try:
+                mapper = mapper_registry.get_mapper(hotel.pms_config)
+                store = DeadLetterStore(hotel.id, batch_size=options["batch_size"])
+                counts = store.replay(
+                    mapper, BookingIngestor(hotel.id), force=options["force"]
+                )
+            except Exception as e:
+                self.stderr.write(
+                    self.style.ERROR(f"[Hotel {hotel.id}] Replay failed: {e}")
+                )
+                continue
+
+            self.stdout.write(
+                f"[Hotel {hotel.id}] Replayed: {counts['replayed']}, "
+                f"Superseded: {counts['superseded']}, "
+                f"Still rejected: {counts['rejected']}, Failed: {counts['failed']}"
+            )
+
+        self.stdout.write(self.style.SUCCESS("\nReplay completed."))
@@ -1,20 +1,192 @@
+import asyncio
 import json
 import logging
+import threading
+from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
+from time import perf_counter
+from typing import Optional
 
+from asgiref.sync import sync_to_async
 from django.core.management.base import BaseCommand
-from pms_integration.exceptions import PMSIntegrationError
+from django.db import close_old_connections, connection
+from django.utils import timezone
+from pms_integration.exceptions import SyncLeaseError
 from pms_integration.models.hotel import Hotel
+from pms_integration.models.sync_run import SyncRun, latest_sync_runs
+from pms_integration.models.sync_state import (
+    get_account_watermark,
+    get_watermark,
+    set_watermark,
+)
+from pms_integration.services.async_pms_client import (
+    AsyncPMSClient,
+    HTTPSession,
+    VendorLimiter,
+)
+from pms_integration.services.change_detector import ChangeDetector
+from pms_integration.services.config_registry import mapper_registry
+from pms_integration.services.db_writer import DBWriter
+from pms_integration.services.dead_letter import DeadLetterStore, config_version
+from pms_integration.services.fetch_coalescer import (
+    FetchCoalescer,
+    apartition,
+    partition,
+)
 from pms_integration.services.ingestor import BookingIngestor
+from pms_integration.services.leases import HotelLease, LeaseManager, default_owner
 from pms_integration.services.mapper import GenericJsonMapper
+from pms_integration.services.metrics import QueryCounter, StageTimer, peak_memory_kb
+from pms_integration.services.parallel_mapper import (
+    ParallelMapper,
+    create_process_pool,
+    map_in_chunks,
+)
+from pms_integration.services.pipeline import Pipeline
 from pms_integration.services.pms_client import PMSClient
+from pms_integration.services.scheduler import SyncScheduler
+
+# Records per chunk passed between pipeline stages, and chunks each queue holds
+PIPELINE_CHUNK_SIZE = 500
+PIPELINE_QUEUE_SIZE = 4
+
+
+def chunked(items, size):
+    items = iter(items)
+    while chunk := list(islice(items, size)):
+        yield chunk
+
+
+def new_counts():
+    return {
+        "inserted": 0,
+        "updated": 0,
+        "skipped": 0,
+        "failed": 0,
+        # error class -> [count, first message]
+        "rejects": {},
+    }
+
+
+@dataclass
+class HotelSync:
+    """State of one hotel's sync: pipeline services, counts and metrics."""
+
+    hotel: Hotel
+    mapper: GenericJsonMapper
+    detector: ChangeDetector
+    ingestor: BookingIngestor
+    dead_letters: DeadLetterStore
+    timer: StageTimer
+    queries: QueryCounter = field(default_factory=QueryCounter)
+    counts: dict = field(default_factory=new_counts)
+    started_at: datetime = field(default_factory=timezone.now)
+    lease: Optional[HotelLease] = None
+    write_failed: int = 0
+    # Start of the fetch the records came from, when it predates the sync
+    fetched_at: Optional[datetime] = None
 
 
 class Command(BaseCommand):
     help = "Sync booking data for all hotels using their PMS configuration"
+    writer = None
+    fetcher = None
+    leases = None
+    readers = Counter()  # source group -> hotels of this run reading it
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pms-url",
+            help="Fetch bookings over HTTP from this PMS endpoint (async client)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=5,
+            help="Max in-flight PMS requests per PMS vendor (with --pms-url)",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=["thread", "process"],
+            default="thread",
+            help="Map and validate records in-thread or on a process pool",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=5,
+            help="Hotel sync threads (thread mode) or mapping processes (process mode)",
+        )
+        parser.add_argument(
+            "--hotel-workers",
+            type=int,
+            help="Hotel sync threads in process mode (default: --workers)",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ignore watermarks and content hashes and re-ingest every record",
+        )
+        parser.add_argument(
+            "--schedule",
+            action="store_true",
+            help="Keep running, re-syncing each hotel when it is due (Ctrl-C stops)",
+        )
+        parser.add_argument(
+            "--min-interval",
+            type=float,
+            default=60.0,
+            help="Shortest re-sync interval per hotel in seconds (with --schedule)",
+        )
+        parser.add_argument(
+            "--max-interval",
+            type=float,
+            default=3600.0,
+            help="Longest re-sync interval per hotel in seconds (with --schedule)",
+        )
+        parser.add_argument(
+            "--vendor-limit",
+            action="append",
+            default=[],
+            metavar="VENDOR=N",
+            help="Concurrent hotel syncs for a PMS vendor (with --schedule)",
+        )
+        parser.add_argument(
+            "--max-syncs",
+            type=int,
+            help="Stop the scheduler after starting this many syncs",
+        )
+        parser.add_argument(
+            "--lease-ttl",
+            type=float,
+            help=(
+                "Claim each hotel through a database lease of this many seconds, "
+                "so several sync nodes can run side by side"
+            ),
+        )
+        parser.add_argument(
+            "--node-id",
+            default=default_owner(),
+            help="Lease owner name of this worker (default: host:pid)",
+        )
 
     def handle(self, *args, **options):
+        self.full = options["full"]
+        self.mode = "http" if options["pms_url"] else options["mode"]
+        self.process_pool = None
+        self.runs = {}  # hotel id -> latest SyncRun of this invocation
+        self.started_at = timezone.now()
+        # Hotels claimed by any node within this window were just synced
+        self.lease_window = (
+            timedelta(seconds=options["min_interval"]) if options["schedule"] else None
+        )
         hotels = Hotel.objects.select_related("pms_config").all()
 
         if not hotels:
@@ -25,7 +197,64 @@ class Command(BaseCommand):
             self.style.SUCCESS(f"Starting sync for {hotels.count()} hotels\n")
         )
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        workers = options["workers"]
+        if options["mode"] == "process":
+            # Hotels keep one sync thread each; mapping fans out to processes
+            self.process_pool = create_process_pool(workers)
+            workers = options["hotel_workers"] or workers
+        # One fetch per PMS source per run (per --min-interval when scheduling)
+        self.fetcher = FetchCoalescer(
+            ttl=options["min_interval"] if options["schedule"] else None
+        )
+        if connection.vendor == "sqlite":
+            # SQLite takes one writer at a time: queue the workers' writes
+            self.writer = DBWriter().start()
+        if options["lease_ttl"]:
+            self.leases = LeaseManager(
+                owner=options["node_id"], ttl=options["lease_ttl"], write=self.write
+            ).start()
+
+        self.plan_fetches(hotels)
+
+        # Largest hotels first, so the slowest syncs don't start last
+        durations = dict(latest_sync_runs().values_list("hotel_id", "duration_seconds"))
+        hotels = sorted(hotels, key=lambda h: durations.get(h.id, 0.0), reverse=True)
+
+        try:
+            if options["schedule"]:
+                self.run_scheduler(hotels, durations, workers, options)
+            elif options["pms_url"]:
+                asyncio.run(
+                    self.sync_hotels_http(
+                        list(hotels), options["pms_url"], options["concurrency"]
+                    )
+                )
+            else:
+                self.sync_hotels_threaded(hotels, workers)
+        finally:
+            if self.process_pool:
+                self.process_pool.shutdown()
+            if self.leases:
+                self.leases.close()
+            if self.writer:
+                self.writer.close()
+
+        stats = mapper_registry.stats()
+        self.stdout.write(
+            f"Config cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['size']} cached"
+        )
+        self.stdout.write(self.style.SUCCESS("\nAll sync tasks completed."))
+
+        runs = [self.runs[hotel_id] for hotel_id in sorted(self.runs)]
+        summary = {"runs": [run.summary() for run in runs], "config_cache": stats}
+        summary["fetch"] = self.fetcher.stats()
+        if self.writer:
+            summary["writer"] = self.writer.stats()
+        self.stdout.write(json.dumps(summary, indent=2))
+
+    def sync_hotels_threaded(self, hotels, workers=5):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
             futures = {
                 executor.submit(self.sync_hotel, hotel): hotel for hotel in hotels
             }
@@ -35,42 +264,430 @@ class Command(BaseCommand):
                 try:
                     future.result()
                 except Exception as e:
-                    self.stderr.write(
-                        self.style.ERROR(f"[Hotel {hotel.id}] Sync failed: {e}")
-                    )
+                    self.report_failure(hotel, e)
 
-        self.stdout.write(self.style.SUCCESS("\nAll sync tasks completed."))
+    async def sync_hotels_http(self, hotels, url, concurrency):
+        limiter = VendorLimiter(default_limit=concurrency)
+        async with HTTPSession() as session:
+            results = await asyncio.gather(
+                *(
+                    self.sync_hotel_http(hotel, url, session, limiter)
+                    for hotel in hotels
+                ),
+                return_exceptions=True,
+            )
+
+        for hotel, result in zip(hotels, results):
+            if isinstance(result, Exception):
+                self.report_failure(hotel, result)
+
+    def run_scheduler(self, hotels, durations, workers, options):
+        vendor_limits = {}
+        for limit in options["vendor_limit"]:
+            vendor, _, count = limit.rpartition("=")
+            vendor_limits[vendor] = int(count)
+
+        if options["pms_url"]:
+            sync = partial(
+                self.sync_hotel_over_http,
+                url=options["pms_url"],
+                concurrency=options["concurrency"],
+            )
+        else:
+            sync = self.sync_hotel
+
+        scheduler = SyncScheduler(
+            sync,
+            workers=workers,
+            vendor_limits=vendor_limits,
+            default_vendor_limit=options["concurrency"],
+            min_interval=options["min_interval"],
+            max_interval=options["max_interval"],
+            on_error=self.report_failure,
+        )
+        for hotel in hotels:
+            scheduler.add(hotel, durations.get(hotel.id, 0.0))
+
+        stop = threading.Event()
+        try:
+            scheduler.run(stop, max_syncs=options["max_syncs"])
+        except KeyboardInterrupt:
+            stop.set()
+            self.stdout.write("\nStopping scheduler, waiting for running syncs")
+
+    def sync_hotel_over_http(self, hotel, url, concurrency):
+        async def sync():
+            async with HTTPSession() as session:
+                limiter = VendorLimiter(default_limit=concurrency)
+                return await self.sync_hotel_http(hotel, url, session, limiter)
+
+        return asyncio.run(sync())
+
+    def report_failure(self, hotel, error):
+        if isinstance(error, SyncLeaseError):
+            self.stdout.write(f"[Hotel {hotel.id}] Skipped: {error}")
+            return
+        self.stderr.write(self.style.ERROR(f"[Hotel {hotel.id}] Sync failed: {error}"))
+
+    def claim_lease(self, hotel):
+        """
+        Claims the hotel's sync lease (None without --lease-ttl). Raises
+        SyncLeaseError if another node holds it, or claimed it since this run
+        started (within --min-interval when scheduling).
+        """
+        if self.leases is None:
+            return None
+        if self.lease_window is None:
+            claimed_after = self.started_at
+        else:
+            claimed_after = timezone.now() - self.lease_window
+        lease = self.leases.claim(hotel.id, claimed_after)
+        if lease is None:
+            raise SyncLeaseError("synced or being synced by another node")
+        return lease
+
+    def release_lease(self, lease):
+        if lease is not None:
+            self.leases.release(lease)
+
+    @contextmanager
+    def leased(self, hotel):
+        lease = self.claim_lease(hotel)
+        try:
+            yield lease
+        finally:
+            self.release_lease(lease)
+
+    def start_sync(self, hotel, lease=None):
+        # Shared, compiled mapper for this PMS config (raises if file is missing)
+        mapper = mapper_registry.get_mapper(hotel.pms_config)
+        timer = StageTimer()
+        return HotelSync(
+            hotel=hotel,
+            mapper=mapper,
+            detector=ChangeDetector(
+                hotel.id, mapper, skip_unchanged=not self.full, timer=timer
+            ),
+            ingestor=BookingIngestor(hotel.id, timer=timer, writer=self.writer),
+            dead_letters=DeadLetterStore(
+                hotel.id, config_version(mapper.config), timer=timer, writer=self.writer
+            ),
+            timer=timer,
+            lease=lease,
+        )
 
     def sync_hotel(self, hotel):
+        with self.leased(hotel) as lease:
+            return self.sync_leased_hotel(hotel, lease)
+
+    def sync_leased_hotel(self, hotel, lease=None):
         mock_data_path = Path("mock_data/mock_pms_bookings.json")  # hardcoded for now
-        config_path = Path(hotel.pms_config.config_file_path)
+        sync = self.start_sync(hotel, lease)
 
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
+        try:
+            client = PMSClient(str(mock_data_path))
+            source = ("file", str(mock_data_path.resolve()))
+            records = self.fetch_records(sync, source, client.iter_bookings)
+            self.ingest_pipelined(sync, records)
 
+            self.advance_watermark(sync)
+            self.report_counts(hotel, sync.counts)
+
+        except Exception as e:
+            self.record_run(sync, e)
+            raise RuntimeError(f"Error during sync for hotel {hotel.id}: {e}")
+        return self.record_run(sync)
+
+    async def sync_hotel_http(self, hotel, url, session, limiter):
+        lease = await sync_to_async(self.claim_lease)(hotel)
         try:
-            # Load PMS config
-            with config_path.open("r", encoding="utf-8") as f:
-                config = json.load(f)
+            return await self.sync_leased_hotel_http(
+                hotel, lease, url, session, limiter
+            )
+        finally:
+            await sync_to_async(self.release_lease)(lease)
 
-            # Load raw data from mock file
-            client = PMSClient(str(mock_data_path))
-            raw_bookings = client.fetch_bookings()
+    async def sync_leased_hotel_http(self, hotel, lease, url, session, limiter):
+        sync = self.start_sync(hotel, lease)
 
-            mapper = GenericJsonMapper(config)
-            ingestor = BookingIngestor(hotel.id)
+        try:
+            if self.full:
+                watermark = None
+            elif self.is_routed(sync):
+                # Shared export: fetch from the account's oldest watermark
+                watermark = await sync_to_async(get_account_watermark)(
+                    hotel.pms_config_id
+                )
+            else:
+                watermark = await sync_to_async(get_watermark)(hotel.id)
+            params = {"modified_since": watermark.isoformat()} if watermark else None
 
-            success, failed = 0, 0
-            for raw in raw_bookings:
-                try:
-                    dto = mapper.map(raw)
-                    ingestor.save_booking(dto)
-                    success += 1
-                except PMSIntegrationError as e:
-                    failed += 1
-                    logging.critical(f"[Hotel {hotel.id}] Skipped booking due to: {e}")
+            client = AsyncPMSClient(
+                url, session, vendor=hotel.pms_config.name, limiter=limiter
+            )
+            source = ("http", url, tuple(sorted((params or {}).items())))
+            # Off the shared sync thread: other hotels' pages map meanwhile
+            ingest = sync_to_async(self.ingest_page, thread_sensitive=False)
+            pages = partial(client.iter_pages, params)
+            async for page in self.afetch_pages(sync, source, pages):
+                await ingest(sync, page)
 
-            logging.info(f"[Hotel {hotel.id}] Synced: {success}, Failed: {failed}")
+            await sync_to_async(self.advance_watermark)(sync)
+            self.report_counts(hotel, sync.counts)
 
         except Exception as e:
+            await sync_to_async(self.record_run)(sync, e)
             raise RuntimeError(f"Error during sync for hotel {hotel.id}: {e}")
+        return await sync_to_async(self.record_run)(sync)
+
+    @staticmethod
+    def is_routed(sync):
+        """Whether the hotel takes its records out of a multi-property export."""
+        return bool(sync.mapper.property_key and sync.hotel.pms_property_id)
+
+    def source_group(self, hotel, mapper):
+        """Hotels of a run in the same group read the same PMS source."""
+        if mapper.property_key and hotel.pms_property_id:
+            # One multi-property export per account
+            return ("routed", hotel.pms_config_id)
+        if self.mode != "http" or self.full:
+            return ("all",)
+        return ("hotel", hotel.id)  # fetched from its own watermark
+
+    def plan_fetches(self, hotels):
+        """
+        Counts the hotels reading each source group, so that only sources
+        shared by two or more hotels of the run go through the fetcher.
+        """
+        self.readers = Counter()
+        self.properties = defaultdict(set)  # account -> routed property ids
+        for hotel in hotels:
+            try:
+                group = self.source_group(
+                    hotel, mapper_registry.get_mapper(hotel.pms_config)
+                )
+            except Exception:
+                continue  # reported by the hotel's own sync
+            self.readers[group] += 1
+            if group[0] == "routed":
+                self.properties[hotel.pms_config_id].add(hotel.pms_property_id)
+
+    def shared_key(self, sync, source):
+        """Fetcher key of `source` if other hotels of the run read it too."""
+        group = self.source_group(sync.hotel, sync.mapper)
+        if self.readers[group] < 2:
+            return None
+        return (source, *group)
+
+    def own_records(self, sync, records):
+        """The hotel's records of an unshared multi-property export."""
+        if not self.is_routed(sync):
+            return records
+        route, property_id = sync.mapper.extract_property_id, sync.hotel.pms_property_id
+        return (record for record in records if route(record) == property_id)
+
+    def fetch_records(self, sync, source, stream):
+        """
+        The hotel's records from `source`, read with `stream`. A source only
+        this hotel reads is streamed straight into mapping. Shared sources
+        are fetched once for the run: as one list, or split by property code
+        for hotels routed out of one multi-property export.
+        """
+        key = self.shared_key(sync, source)
+        if key is None:
+            return sync.timer.iterate("fetch", self.own_records(sync, stream()))
+
+        start = perf_counter()
+        if self.is_routed(sync):
+            # Split as read, keeping only the properties synced in this run
+            route = sync.mapper.extract_property_id
+            keep = self.properties[sync.hotel.pms_config_id]
+            partitions, fetched_at = self.fetcher.fetch(
+                key, lambda: partition(stream(), route, keep)
+            )
+            records = partitions.get(sync.hotel.pms_property_id, [])
+        else:
+            records, fetched_at = self.fetcher.fetch(key, lambda: list(stream()))
+        self.fetched(sync, fetched_at)
+        sync.timer.add("fetch", perf_counter() - start, len(records))
+        return records
+
+    async def afetch_pages(self, sync, source, pages):
+        """
+        `fetch_records` for paged async sources: yields the hotel's records
+        page by page as they arrive, or all at once when the source is shared.
+        """
+        key = self.shared_key(sync, source)
+        if key is None:
+            async for page in sync.timer.aiterate("fetch", pages(), size=len):
+                yield self.own_records(sync, page)
+            return
+
+        start = perf_counter()
+        if self.is_routed(sync):
+            route = sync.mapper.extract_property_id
+            keep = self.properties[sync.hotel.pms_config_id]
+            partitions, fetched_at = await self.fetcher.afetch(
+                key, lambda: apartition(pages(), route, keep)
+            )
+            records = partitions.get(sync.hotel.pms_property_id, [])
+        else:
+
+            async def load():
+                return [record async for page in pages() for record in page]
+
+            records, fetched_at = await self.fetcher.afetch(key, load)
+        self.fetched(sync, fetched_at)
+        sync.timer.add("fetch", perf_counter() - start, len(records))
+        yield records
+
+    @staticmethod
+    def fetched(sync, fetched_at):
+        # A cached payload may predate the sync: changes made in between
+        # must still be fetched next time
+        if fetched_at < sync.started_at:
+            sync.fetched_at = fetched_at
+
+    def record_run(self, sync, error=None):
+        finished_at = timezone.now()
+        counts = sync.counts
+        run = self.write(
+            SyncRun.objects.create,
+            hotel=sync.hotel,
+            started_at=sync.started_at,
+            finished_at=finished_at,
+            status=SyncRun.Status.FAILED if error else SyncRun.Status.SUCCESS,
+            mode=self.mode,
+            duration_seconds=(finished_at - sync.started_at).total_seconds(),
+            inserted=counts["inserted"],
+            updated=counts["updated"],
+            skipped=counts["skipped"],
+            failed=counts["failed"],
+            query_count=sync.queries.count,
+            peak_memory_kb=peak_memory_kb(),
+            stages=sync.timer.as_dict(),
+            error=str(error or ""),
+        )
+        self.runs[sync.hotel.id] = run
+        return run
+
+    def advance_watermark(self, sync):
+        """
+        Moves the hotel's watermark to the start of this sync (or of the
+        shared fetch its records came from, if earlier), unless some
+        bookings failed to write: an incremental fetch would not send them
+        again. Mapping rejects are kept in the dead-letter store instead.
+        """
+        if sync.write_failed:
+            logging.warning(
+                f"[Hotel {sync.hotel.id}] Watermark not advanced: "
+                f"{sync.write_failed} bookings failed to write"
+            )
+            return
+        self.write(set_watermark, sync.hotel.id, sync.fetched_at or sync.started_at)
+
+    def write(self, fn, *args, **kwargs):
+        """Runs a database write on the shared writer, if there is one."""
+        if self.writer is None:
+            return fn(*args, **kwargs)
+        return self.writer.call(fn, *args, **kwargs)
+
+    @staticmethod
+    def count_reject(counts, error, message):
+        counts["failed"] += 1
+        entry = counts["rejects"].setdefault(error, [0, message])
+        entry[0] += 1
+
+    def ingest(self, sync, raw_bookings):
+        """
+        Maps and writes the new or changed records of `raw_bookings`,
+        accumulating inserted/updated/skipped/failed counts on `sync`. Records
+        that fail mapping are kept in the hotel's dead-letter store for replay.
+        """
+        with connection.execute_wrapper(sync.queries):
+            self._ingest(sync, raw_bookings)
+
+    def ingest_page(self, sync, raw_bookings):
+        """`ingest` on a worker thread of the event loop's executor."""
+        close_old_connections()
+        try:
+            self.ingest(sync, raw_bookings)
+        finally:
+            close_old_connections()
+
+    def ingest_pipelined(self, sync, raw_bookings):
+        """
+        `ingest` with fetching, change detection and mapping, and writing
+        overlapped: each runs in its own thread, connected by bounded queues
+        of PIPELINE_CHUNK_SIZE records. All writes stay on this thread.
+        """
+        pipeline = Pipeline(queue_size=PIPELINE_QUEUE_SIZE, timer=sync.timer)
+        pipeline.add("fetch", lambda raws: chunked(raws, PIPELINE_CHUNK_SIZE))
+        pipeline.add("map", partial(self.map_stage, sync))
+        with connection.execute_wrapper(sync.queries):
+            pipeline.run(raw_bookings, ("write", partial(self.write_chunks, sync)))
+
+    def map_stage(self, sync, chunks):
+        # Runs in a pipeline thread, on its own database connection
+        try:
+            with connection.execute_wrapper(sync.queries):
+                yield from self.map_changed(sync, chain.from_iterable(chunks))
+        finally:
+            connection.close()
+
+    def _ingest(self, sync, raw_bookings):
+        self.write_chunks(sync, self.map_changed(sync, raw_bookings))
+
+    def map_changed(self, sync, raw_bookings):
+        """Maps the new or changed records; yields (accepted, rejected) chunks."""
+        records = sync.detector.changed(raw_bookings)
+        if self.process_pool:
+            parallel = ParallelMapper(self.process_pool, sync.mapper, timer=sync.timer)
+            return parallel.map(records, raw=itemgetter(0))
+        return map_in_chunks(sync.mapper, records, raw=itemgetter(0), timer=sync.timer)
+
+    def write_chunks(self, sync, chunks):
+        """Writes mapped chunks, dead-letters their rejects and counts both."""
+        counts = sync.counts
+        updates = set()
+
+        def mapped_bookings():
+            for accepted, rejected in chunks:
+                if sync.lease is not None:
+                    # Another node took the hotel over: stop writing
+                    sync.lease.check()
+                for (raw, digest, exists), reject in rejected:
+                    message = f"booking {reject.booking_id}: {reject.message}"
+                    self.count_reject(counts, reject.error, message)
+                    sync.dead_letters.add(raw, reject)
+
+                for (raw, digest, exists), dto in accepted:
+                    dto.source_hash = digest
+                    if exists:
+                        updates.add(dto.booking_id)
+                    yield dto
+
+        saved, write_errors = sync.ingestor.save_bookings(mapped_bookings())
+        sync.dead_letters.flush()
+        sync.write_failed += len(write_errors)
+        for dto, e in write_errors:
+            updates.discard(dto.booking_id)
+            message = f"booking {dto.booking_id}: {e}"
+            self.count_reject(counts, type(e).__name__, message)
+
+        counts["updated"] += len(updates)
+        counts["inserted"] += saved - len(updates)
+        counts["skipped"] = sync.detector.skipped
+
+    def report_counts(self, hotel, counts):
+        self.stdout.write(
+            f"[Hotel {hotel.id}] Inserted: {counts['inserted']}, "
+            f"Updated: {counts['updated']}, Skipped: {counts['skipped']}, "
+            f"Failed: {counts['failed']}"
+        )
+        # One line per error class instead of one per rejected record
+        for error, (count, sample) in counts["rejects"].items():
+            logging.critical(
+                f"[Hotel {hotel.id}] Skipped {count} bookings due to {error}, "
+                f"e.g. {sample}"
+            )
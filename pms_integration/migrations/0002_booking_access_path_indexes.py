@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pms_integration", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["hotel", "status", "check_in"],
+                name="booking_hotel_status_ci_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["hotel", "check_in", "check_out"], name="booking_hotel_stay_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["hotel", "check_out"], name="booking_hotel_co_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pms_integration", "0002_booking_access_path_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="hotelsyncstate",
+            name="data_version",
+            field=models.PositiveBigIntegerField(
+                default=0, help_text="Bumped whenever the ingestor writes bookings"
+            ),
+        ),
+    ]
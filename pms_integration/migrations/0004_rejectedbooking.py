@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pms_integration", "0003_hotelsyncstate_data_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RejectedBooking",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("booking_id", models.CharField(blank=True, max_length=100, null=True)),
+                (
+                    "payload_hash",
+                    models.CharField(
+                        help_text="Hash of the raw PMS record", max_length=64
+                    ),
+                ),
+                ("raw_data", models.JSONField()),
+                (
+                    "config_version",
+                    models.CharField(
+                        help_text="Hash of the PMS config that rejected the record",
+                        max_length=64,
+                    ),
+                ),
+                ("error", models.CharField(max_length=100)),
+                ("message", models.TextField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text="Last time the record was rejected by a sync",
+                    ),
+                ),
+                (
+                    "hotel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rejected_bookings",
+                        to="pms_integration.hotel",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("hotel", "payload_hash")},
+            },
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pms_integration", "0004_rejectedbooking"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("started_at", models.DateTimeField()),
+                ("finished_at", models.DateTimeField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("success", "Success"), ("failed", "Failed")],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "mode",
+                    models.CharField(
+                        help_text="thread, process or http", max_length=20
+                    ),
+                ),
+                ("duration_seconds", models.FloatField()),
+                ("inserted", models.PositiveIntegerField(default=0)),
+                ("updated", models.PositiveIntegerField(default=0)),
+                ("skipped", models.PositiveIntegerField(default=0)),
+                ("failed", models.PositiveIntegerField(default=0)),
+                ("query_count", models.PositiveIntegerField(default=0)),
+                (
+                    "peak_memory_kb",
+                    models.PositiveBigIntegerField(
+                        blank=True,
+                        help_text="Peak RSS of the sync process so far",
+                        null=True,
+                    ),
+                ),
+                (
+                    "stages",
+                    models.JSONField(
+                        default=dict,
+                        help_text="{stage: {seconds, records}} for each pipeline stage",
+                    ),
+                ),
+                ("error", models.TextField(blank=True, default="")),
+                (
+                    "hotel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sync_runs",
+                        to="pms_integration.hotel",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["hotel", "-started_at"],
+                        name="syncrun_hotel_started_idx",
+                    )
+                ],
+            },
+        ),
+    ]
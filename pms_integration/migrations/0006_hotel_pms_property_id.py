@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pms_integration", "0005_syncrun"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="hotel",
+            name="pms_property_id",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Property code of this hotel in a multi-property PMS export",
+                max_length=100,
+            ),
+        ),
+    ]
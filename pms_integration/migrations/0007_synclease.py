@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pms_integration", "0006_hotel_pms_property_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncLease",
+            fields=[
+                (
+                    "hotel",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="sync_lease",
+                        serialize=False,
+                        to="pms_integration.hotel",
+                    ),
+                ),
+                (
+                    "owner",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="Empty when released",
+                        max_length=255,
+                    ),
+                ),
+                ("expires_at", models.DateTimeField(blank=True, null=True)),
+                ("acquired_at", models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
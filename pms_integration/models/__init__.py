@@ -0,0 +1,8 @@
+from pms_integration.models.booking import Booking
+from pms_integration.models.guest import Guest
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.models.rejected_booking import RejectedBooking
+from pms_integration.models.room import Room
+from pms_integration.models.sync_lease import SyncLease
+from pms_integration.models.sync_run import SyncRun
+from pms_integration.models.sync_state import HotelSyncState
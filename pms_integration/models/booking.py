@@ -1,6 +1,7 @@
 from decimal import Decimal
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from pms_integration.models.guest import Guest
 from pms_integration.models.hotel import Hotel
 from pms_integration.models.room import Room
 
@@ -8,6 +9,7 @@ from pms_integration.models.room import Room
 class Booking(models.Model):
     hotel = models.ForeignKey(Hotel, on_delete=models.CASCADE, related_name="bookings")
     room = models.ForeignKey(Room, null=True, blank=True, on_delete=models.SET_NULL)
+    guest = models.ForeignKey(Guest, null=True, blank=True, on_delete=models.SET_NULL)
     booking_id = models.CharField(max_length=100)
     guest_name = models.CharField(max_length=255)
     check_in = models.DateField()
@@ -16,10 +18,33 @@ class Booking(models.Model):
     total_amount = models.DecimalField(
         max_digits=10, decimal_places=2, default=Decimal("0.00")
     )
+    source_hash = models.CharField(
+        max_length=64, blank=True, default="", help_text="Hash of the raw PMS record"
+    )
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ("hotel", "booking_id")
+        indexes = [
+            # Keyset pagination of the bookings API: (updated_at, id) descending
+            models.Index(
+                fields=["hotel", "-updated_at", "-id"], name="booking_hotel_updated_idx"
+            ),
+            models.Index(
+                fields=["hotel", "status", "-updated_at", "-id"],
+                name="booking_hotel_status_upd_idx",
+            ),
+            # Stay date filters, alone or combined with status
+            models.Index(
+                fields=["hotel", "status", "check_in"],
+                name="booking_hotel_status_ci_idx",
+            ),
+            models.Index(
+                fields=["hotel", "check_in", "check_out"],
+                name="booking_hotel_stay_idx",
+            ),
+            models.Index(fields=["hotel", "check_out"], name="booking_hotel_co_idx"),
+        ]
 
     def __str__(self):
         return f"Booking {self.booking_id} ({self.guest_name})"
@@ -31,5 +56,5 @@ def get_bookings_for_hotel(hotel_id: int):
     except ObjectDoesNotExist:
         return None, "Hotel not found"
 
-    bookings = Booking.objects.filter(hotel=hotel).order_by("-updated_at")
+    bookings = Booking.objects.filter(hotel=hotel).order_by("-updated_at", "-id")
     return bookings, None
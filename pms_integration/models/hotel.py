@@ -17,6 +17,12 @@ class Hotel(models.Model):
     pms_config = models.ForeignKey(
         PMSConfig, on_delete=models.PROTECT, related_name="hotels"
     )
+    pms_property_id = models.CharField(
+        max_length=100,
+        blank=True,
+        default="",
+        help_text="Property code of this hotel in a multi-property PMS export",
+    )
 
     def __str__(self):
         return self.name
@@ -0,0 +1,30 @@
+from django.db import models
+from pms_integration.models.hotel import Hotel
+
+
+class RejectedBooking(models.Model):
+    """A raw PMS record the sync could not map, kept for replay."""
+
+    hotel = models.ForeignKey(
+        Hotel, on_delete=models.CASCADE, related_name="rejected_bookings"
+    )
+    booking_id = models.CharField(max_length=100, null=True, blank=True)
+    payload_hash = models.CharField(
+        max_length=64, help_text="Hash of the raw PMS record"
+    )
+    raw_data = models.JSONField()
+    config_version = models.CharField(
+        max_length=64, help_text="Hash of the PMS config that rejected the record"
+    )
+    error = models.CharField(max_length=100)
+    message = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(
+        auto_now=True, help_text="Last time the record was rejected by a sync"
+    )
+
+    class Meta:
+        unique_together = ("hotel", "payload_hash")
+
+    def __str__(self):
+        return f"Rejected booking {self.booking_id} ({self.error})"
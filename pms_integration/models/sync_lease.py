@@ -0,0 +1,21 @@
+from django.db import models
+from pms_integration.models.hotel import Hotel
+
+
+class SyncLease(models.Model):
+    """
+    Claim on a hotel's sync by one worker (node and process), valid until
+    `expires_at` unless renewed by the worker's heartbeat.
+    """
+
+    hotel = models.OneToOneField(
+        Hotel, on_delete=models.CASCADE, primary_key=True, related_name="sync_lease"
+    )
+    owner = models.CharField(
+        max_length=255, blank=True, default="", help_text="Empty when released"
+    )
+    expires_at = models.DateTimeField(null=True, blank=True)
+    acquired_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Sync lease for hotel {self.hotel_id} ({self.owner or 'free'})"
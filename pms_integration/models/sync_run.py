@@ -0,0 +1,64 @@
+from django.db import models
+from pms_integration.models.hotel import Hotel
+
+
+class SyncRun(models.Model):
+    """Outcome and per-stage timings of one hotel's sync."""
+
+    class Status(models.TextChoices):
+        SUCCESS = "success"
+        FAILED = "failed"
+
+    hotel = models.ForeignKey(Hotel, on_delete=models.CASCADE, related_name="sync_runs")
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField()
+    status = models.CharField(max_length=20, choices=Status.choices)
+    mode = models.CharField(max_length=20, help_text="thread, process or http")
+    duration_seconds = models.FloatField()
+    inserted = models.PositiveIntegerField(default=0)
+    updated = models.PositiveIntegerField(default=0)
+    skipped = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    query_count = models.PositiveIntegerField(default=0)
+    peak_memory_kb = models.PositiveBigIntegerField(
+        null=True, blank=True, help_text="Peak RSS of the sync process so far"
+    )
+    stages = models.JSONField(
+        default=dict, help_text="{stage: {seconds, records}} for each pipeline stage"
+    )
+    error = models.TextField(blank=True, default="")
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["hotel", "-started_at"], name="syncrun_hotel_started_idx"
+            )
+        ]
+
+    def __str__(self):
+        return f"Sync of hotel {self.hotel_id} at {self.started_at} ({self.status})"
+
+    def summary(self) -> dict:
+        return {
+            "hotel_id": self.hotel_id,
+            "status": self.status,
+            "mode": self.mode,
+            "started_at": self.started_at.isoformat(),
+            "duration_seconds": round(self.duration_seconds, 6),
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "query_count": self.query_count,
+            "peak_memory_kb": self.peak_memory_kb,
+            "stages": self.stages,
+            "error": self.error,
+        }
+
+
+def latest_sync_runs():
+    """The most recent SyncRun of every hotel."""
+    latest = SyncRun.objects.filter(hotel_id=models.OuterRef("hotel_id")).order_by(
+        "-started_at", "-id"
+    )
+    return SyncRun.objects.filter(id=models.Subquery(latest.values("id")[:1]))
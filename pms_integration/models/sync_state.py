@@ -0,0 +1,69 @@
+from django.db import models
+from django.db.models import Count, F, Min, Q
+from pms_integration.models.hotel import Hotel
+
+
+class HotelSyncState(models.Model):
+    hotel = models.OneToOneField(
+        Hotel, on_delete=models.CASCADE, related_name="sync_state"
+    )
+    watermark = models.DateTimeField(
+        null=True, blank=True, help_text="Start time of the last successful sync"
+    )
+    data_version = models.PositiveBigIntegerField(
+        default=0, help_text="Bumped whenever the ingestor writes bookings"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Sync state for hotel {self.hotel_id} (watermark {self.watermark})"
+
+
+def get_watermark(hotel_id: int):
+    return (
+        HotelSyncState.objects.filter(hotel_id=hotel_id)
+        .values_list("watermark", flat=True)
+        .first()
+    )
+
+
+def get_account_watermark(pms_config_id: int):
+    """
+    Oldest watermark of the hotels routed out of one multi-property PMS
+    export (None while any of them has not synced), so that a single fetch
+    covers all of them.
+    """
+    result = (
+        Hotel.objects.filter(pms_config_id=pms_config_id)
+        .exclude(pms_property_id="")
+        .aggregate(
+            oldest=Min("sync_state__watermark"),
+            unsynced=Count("id", filter=Q(sync_state__watermark__isnull=True)),
+        )
+    )
+    return None if result["unsynced"] else result["oldest"]
+
+
+def set_watermark(hotel_id: int, watermark) -> None:
+    HotelSyncState.objects.update_or_create(
+        hotel_id=hotel_id, defaults={"watermark": watermark}
+    )
+
+
+def get_data_version(hotel_id: int) -> int:
+    return (
+        HotelSyncState.objects.filter(hotel_id=hotel_id)
+        .values_list("data_version", flat=True)
+        .first()
+    ) or 0
+
+
+def bump_data_version(hotel_id: int) -> None:
+    bump = F("data_version") + 1
+    if HotelSyncState.objects.filter(hotel_id=hotel_id).update(data_version=bump):
+        return
+    _, created = HotelSyncState.objects.get_or_create(
+        hotel_id=hotel_id, defaults={"data_version": 1}
+    )
+    if not created:
+        HotelSyncState.objects.filter(hotel_id=hotel_id).update(data_version=bump)
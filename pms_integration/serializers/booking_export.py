@@ -0,0 +1,37 @@
+import json
+from typing import Iterable, Iterator
+
+from django.db.models import QuerySet
+from pms_integration.serializers.booking_serializer import FastBookingSerializer
+
+_serializer = FastBookingSerializer()
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def export_rows(bookings: QuerySet, chunk_size: int) -> Iterator[Iterable[str]]:
+    """Encoded rows of `bookings`, one list per database fetch."""
+    chunk = []
+    # Rows converted exactly as the bookings list renders them
+    for row in _serializer.values(bookings).iterator(chunk_size=chunk_size):
+        chunk.append(_encode(_serializer.to_representation(row)))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def stream_json(bookings: QuerySet, chunk_size: int) -> Iterator[str]:
+    """`bookings` as one JSON array, emitted a chunk of rows at a time."""
+    yield "["
+    separator = ""
+    for chunk in export_rows(bookings, chunk_size):
+        yield separator + ",".join(chunk)
+        separator = ","
+    yield "]"
+
+
+def stream_ndjson(bookings: QuerySet, chunk_size: int) -> Iterator[str]:
+    """`bookings` as newline-delimited JSON, one object per line."""
+    for chunk in export_rows(bookings, chunk_size):
+        yield "\n".join(chunk) + "\n"
@@ -0,0 +1,20 @@
+from django.conf import settings
+from pms_integration.enums.status import BookingStatus
+from rest_framework import serializers
+
+
+class BookingQuerySerializer(serializers.Serializer):
+    """Validates the filter and pagination query params of the bookings API."""
+
+    status = serializers.ChoiceField(
+        choices=[s.value for s in BookingStatus], required=False
+    )
+    check_in_from = serializers.DateField(required=False)
+    check_in_to = serializers.DateField(required=False)
+    check_out_from = serializers.DateField(required=False)
+    check_out_to = serializers.DateField(required=False)
+    updated_since = serializers.DateTimeField(required=False)
+    cursor = serializers.CharField(required=False)
+    page_size = serializers.IntegerField(
+        required=False, min_value=1, max_value=settings.BOOKINGS_MAX_PAGE_SIZE
+    )
@@ -1,3 +1,8 @@
+from decimal import Context, Decimal
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.db import models
+from django.db.models import QuerySet
 from pms_integration.models.booking import Booking
 from rest_framework import serializers
 
@@ -13,3 +18,58 @@ class BookingSerializer(serializers.ModelSerializer):
             "status",
             "total_amount",
         ]
+
+
+def field_converter(field: models.Field) -> Optional[Callable]:
+    """
+    Converter from a database value of `field` to what the ModelSerializer
+    field DRF builds for it would render; None when the value is passed
+    through unchanged.
+    """
+    if isinstance(field, models.DecimalField):
+        # DRF quantizes to decimal_places with max_digits precision and
+        # formats without exponent
+        quantum = Decimal(1).scaleb(-field.decimal_places)
+        context = Context(prec=field.max_digits)
+        return lambda value: format(value.quantize(quantum, context=context), "f")
+    if isinstance(field, models.DateTimeField):
+        raise TypeError(f"No fast converter for datetime field {field.name!r}")
+    if isinstance(field, models.DateField):
+        return lambda value: value.isoformat()
+    if isinstance(field, (models.CharField, models.TextField)):
+        return None
+    raise TypeError(f"No fast converter for {type(field).__name__} {field.name!r}")
+
+
+class FastBookingSerializer:
+    """
+    Read-only fast path for BookingSerializer.
+
+    Fetches exactly the serializer's columns with `.values()` and converts
+    them with per-field converters computed once, instead of building DRF
+    field objects and calling `to_representation` for every row. Renders
+    the same output as BookingSerializer (see test_booking_serializer).
+    """
+
+    fields: List[str] = BookingSerializer.Meta.fields
+
+    def __init__(self):
+        self.converters: Dict[str, Callable] = {}
+        for name in self.fields:
+            converter = field_converter(Booking._meta.get_field(name))
+            if converter is not None:
+                self.converters[name] = converter
+
+    def values(self, queryset: QuerySet, *extra: str) -> QuerySet:
+        """`queryset` as dicts of the serialized columns plus `extra` ones."""
+        return queryset.values(*self.fields, *extra)
+
+    def to_representation(self, row: dict) -> dict:
+        data = {name: row[name] for name in self.fields}
+        for name, converter in self.converters.items():
+            if data[name] is not None:
+                data[name] = converter(data[name])
+        return data
+
+    def serialize(self, rows: Iterable[dict]) -> List[dict]:
+        return [self.to_representation(row) for row in rows]
@@ -0,0 +1,278 @@
+import asyncio
+import json
+import random
+import ssl
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from pms_integration.exceptions import PMSConnectionError
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Responses that never carry a body, whatever their headers say (RFC 9112 6.3)
+BODYLESS_STATUSES = frozenset({204, 304})
+
+Origin = Tuple[str, str, int]
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+@dataclass
+class HTTPResponse:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class HTTPSession:
+    """
+    Minimal asyncio HTTP/1.1 client with keep-alive connection pooling.
+
+    Connections are pooled per origin and capped at `max_connections_per_host`;
+    every request is bounded by `timeout` seconds.
+    """
+
+    def __init__(self, max_connections_per_host: int = 10, timeout: float = 10.0):
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self._idle: Dict[Origin, List[Connection]] = defaultdict(list)
+        self._slots: Dict[Origin, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "HTTPSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+    async def get(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> HTTPResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        origin = (scheme, parts.hostname, port)
+
+        query = "&".join(q for q in (parts.query, urlencode(params or {})) if q)
+        target = (parts.path or "/") + (f"?{query}" if query else "")
+        request = (
+            f"GET {target} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            "Accept: application/json\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        ).encode("latin-1")
+
+        slots = self._slots.setdefault(
+            origin, asyncio.Semaphore(self.max_connections_per_host)
+        )
+        async with slots:
+            async with asyncio.timeout(self.timeout):
+                while self._idle[origin]:
+                    # Pooled connections may have been closed by the server
+                    conn = self._idle[origin].pop()
+                    try:
+                        return await self._send(origin, conn, request)
+                    except (OSError, EOFError):
+                        continue
+                return await self._send(origin, await self._connect(origin), request)
+
+    async def _connect(self, origin: Origin) -> Connection:
+        scheme, host, port = origin
+        context = ssl.create_default_context() if scheme == "https" else None
+        return await asyncio.open_connection(host, port, ssl=context)
+
+    async def _send(
+        self, origin: Origin, conn: Connection, request: bytes
+    ) -> HTTPResponse:
+        reader, writer = conn
+        try:
+            writer.write(request)
+            await writer.drain()
+            method = request.split(b" ", 1)[0].decode("latin-1")
+            response, reusable = await self._read_response(reader, method)
+        except ValueError as e:
+            writer.close()
+            raise ConnectionError(f"Malformed HTTP response: {e}")
+        except BaseException:
+            writer.close()
+            raise
+
+        if reusable:
+            self._idle[origin].append(conn)
+        else:
+            writer.close()
+        return response
+
+    async def _read_response(
+        self, reader: asyncio.StreamReader, method: str = "GET"
+    ) -> Tuple[HTTPResponse, bool]:
+        version, status, headers = await self._read_head(reader)
+        while 100 <= status < 200:
+            # Interim response (e.g. 103 Early Hints): the final one follows
+            version, status, headers = await self._read_head(reader)
+
+        connection = headers.get("connection", "").lower()
+        reusable = (
+            connection == "keep-alive"
+            if version == "HTTP/1.0"
+            else connection != "close"
+        )
+
+        if method == "HEAD" or status in BODYLESS_STATUSES:
+            body = b""
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            body = bytearray()
+            while size := int((await reader.readline()).split(b";")[0], 16):
+                body += await reader.readexactly(size)
+                await reader.readexactly(2)
+            while (await reader.readline()).strip():
+                pass  # trailers
+            body = bytes(body)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        elif not reusable:
+            body = await reader.read()  # delimited by the server closing
+        else:
+            raise ValueError(
+                "no Content-Length or chunked body on a kept-alive connection"
+            )
+
+        return HTTPResponse(status, headers, body), reusable
+
+    @staticmethod
+    async def _read_head(
+        reader: asyncio.StreamReader,
+    ) -> Tuple[str, int, Dict[str, str]]:
+        status_line = (await reader.readline()).decode("latin-1").strip()
+        version, status, *_ = status_line.split(" ", 2)
+
+        headers = {}
+        while line := (await reader.readline()).decode("latin-1").strip():
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return version, int(status), headers
+
+
+class VendorLimiter:
+    """Per-PMS-vendor concurrency caps shared by all clients of a sync run."""
+
+    def __init__(self, default_limit: int = 5, limits: Optional[Dict[str, int]] = None):
+        self.default_limit = default_limit
+        self.limits = limits or {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def __call__(self, vendor: str) -> asyncio.Semaphore:
+        if vendor not in self._semaphores:
+            limit = self.limits.get(vendor, self.default_limit)
+            self._semaphores[vendor] = asyncio.Semaphore(limit)
+        return self._semaphores[vendor]
+
+
+class AsyncPMSClient:
+    """
+    Fetches reservations from a PMS HTTP API, page by page.
+
+    The endpoint may return a plain JSON array (single page) or an object
+    holding the page under `records_key` and the next cursor under
+    `cursor_key`. Failed requests are retried with jittered exponential
+    backoff.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        session: HTTPSession,
+        vendor: str = "default",
+        limiter: Optional[VendorLimiter] = None,
+        page_size: int = 500,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        records_key: str = "data",
+        cursor_key: str = "next_cursor",
+        cursor_param: str = "cursor",
+        limit_param: str = "limit",
+    ):
+        self.url = url
+        self.session = session
+        self.vendor = vendor
+        self.limiter = limiter or VendorLimiter()
+        self.page_size = page_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.records_key = records_key
+        self.cursor_key = cursor_key
+        self.cursor_param = cursor_param
+        self.limit_param = limit_param
+
+    async def iter_pages(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[List[Dict]]:
+        cursor = None
+        while True:
+            query = {self.limit_param: self.page_size, **(params or {})}
+            if cursor:
+                query[self.cursor_param] = cursor
+
+            payload = await self._get(query)
+            if isinstance(payload, list):
+                yield payload
+                return
+
+            records = payload.get(self.records_key) or []
+            yield records
+
+            cursor = payload.get(self.cursor_key)
+            if not cursor or not records:
+                return
+
+    async def iter_bookings(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict]:
+        async for page in self.iter_pages(params):
+            for record in page:
+                yield record
+
+    async def fetch_bookings(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict]:
+        return [record async for record in self.iter_bookings(params)]
+
+    async def _get(self, params: Dict[str, Any]) -> Any:
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.limiter(self.vendor):
+                    response = await self.session.get(self.url, params)
+            except (OSError, EOFError) as e:
+                error = PMSConnectionError(f"PMS request to {self.url} failed: {e!r}")
+            else:
+                if response.status in RETRY_STATUSES:
+                    error = PMSConnectionError(
+                        f"PMS responded with HTTP {response.status}: {self.url}"
+                    )
+                elif response.status >= 400:
+                    raise PMSConnectionError(
+                        f"PMS responded with HTTP {response.status}: {self.url}"
+                    )
+                else:
+                    try:
+                        return response.json()
+                    except ValueError as e:
+                        raise PMSConnectionError(
+                            f"Invalid JSON format in PMS response: {e}"
+                        )
+
+            if attempt < self.max_retries:
+                delay = min(self.max_backoff, self.backoff * 2**attempt)
+                await asyncio.sleep(random.uniform(0, delay))
+
+        raise error
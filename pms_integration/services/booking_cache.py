@@ -0,0 +1,35 @@
+import hashlib
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class BookingPageCache:
+    """
+    Caches serialized bookings API pages per hotel and query.
+
+    Keys embed the hotel's data version, so a sync that writes to the hotel
+    makes every cached page for it unreachable; stale entries then expire.
+    The backend is whichever Django cache `BOOKINGS_CACHE_ALIAS` points to.
+    """
+
+    def __init__(self, alias: Optional[str] = None, timeout: Optional[int] = None):
+        self.alias = alias or settings.BOOKINGS_CACHE_ALIAS
+        self.timeout = (
+            timeout if timeout is not None else settings.BOOKINGS_CACHE_TIMEOUT
+        )
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def key(self, hotel_id: int, version: int, query: str) -> str:
+        digest = hashlib.sha1(query.encode("utf-8")).hexdigest()
+        return f"bookings:{hotel_id}:v{version}:{digest}"
+
+    def get(self, hotel_id: int, version: int, query: str) -> Optional[Any]:
+        return self.cache.get(self.key(hotel_id, version, query))
+
+    def set(self, hotel_id: int, version: int, query: str, value: Any) -> None:
+        self.cache.set(self.key(hotel_id, version, query), value, self.timeout)
@@ -0,0 +1,70 @@
+import hashlib
+import json
+from itertools import islice
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from pms_integration.models.booking import Booking
+from pms_integration.services.mapper import GenericJsonMapper
+from pms_integration.services.metrics import StageTimer
+
+
+def content_hash(raw: dict, salt: str = "") -> str:
+    """Stable hash of a raw PMS record (key order and whitespace independent)."""
+    payload = json.dumps(raw, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256((salt + payload).encode("utf-8")).hexdigest()
+
+
+class ChangeDetector:
+    """
+    Filters raw PMS records down to the ones that are new or changed since
+    they were last ingested, by comparing content hashes stored on Booking.
+    With `skip_unchanged=False` every record is passed through (full resync).
+
+    The hash is salted with the mapping config, so a config change re-maps
+    every record on the next sync.
+    """
+
+    def __init__(
+        self,
+        hotel_id: int,
+        mapper: GenericJsonMapper,
+        skip_unchanged: bool = True,
+        batch_size: int = 500,
+        timer: Optional[StageTimer] = None,
+    ):
+        self.hotel_id = hotel_id
+        self.timer = timer
+        self.skip_unchanged = skip_unchanged
+        self.batch_size = batch_size
+        self.salt = content_hash(mapper.config)
+        self.extract_booking_id = mapper.extract_booking_id
+        self.skipped = 0
+
+    def changed(self, raw_bookings: Iterable[dict]) -> Iterator[Tuple[dict, str, bool]]:
+        """Yields (raw, content hash, already stored) for new or changed records."""
+        records = iter(raw_bookings)
+        while batch := list(islice(records, self.batch_size)):
+            start = perf_counter()
+            keyed = [
+                (raw, self.extract_booking_id(raw), content_hash(raw, self.salt))
+                for raw in batch
+            ]
+            stored = self._stored_hashes({booking_id for _, booking_id, _ in keyed})
+            if self.timer is not None:
+                self.timer.add("detect", perf_counter() - start, len(batch))
+
+            for raw, booking_id, digest in keyed:
+                unchanged = booking_id is not None and stored.get(booking_id) == digest
+                if unchanged and self.skip_unchanged:
+                    self.skipped += 1
+                    continue
+                yield raw, digest, booking_id in stored
+
+    def _stored_hashes(self, booking_ids: set) -> Dict[str, str]:
+        booking_ids.discard(None)
+        return dict(
+            Booking.objects.filter(
+                hotel_id=self.hotel_id, booking_id__in=booking_ids
+            ).values_list("booking_id", "source_hash")
+        )
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Tuple
+
+from pms_integration.models.hotel import PMSConfig
+from pms_integration.services.mapper import GenericJsonMapper
+
+
+@dataclass(frozen=True)
+class _Entry:
+    stamp: Tuple[int, int]
+    digest: str
+    config: dict
+    mapper: GenericJsonMapper
+
+
+class MapperRegistry:
+    """
+    Process-wide cache of parsed PMS configs and their compiled mappers.
+
+    Entries are keyed on the PMSConfig id and revalidated against the file's
+    mtime/size on every lookup; the file is only re-parsed when that stamp
+    changes, and the mapper is only rebuilt when the content hash changes.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_mapper(self, pms_config: PMSConfig) -> GenericJsonMapper:
+        return self._get(pms_config).mapper
+
+    def get_config(self, pms_config: PMSConfig) -> dict:
+        return self._get(pms_config).config
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def _get(self, pms_config: PMSConfig) -> _Entry:
+        path = Path(pms_config.config_file_path)
+        stamp = self._stamp(path)
+
+        with self._lock:
+            entry = self._entries.get(pms_config.id)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(pms_config.id)
+                self.hits += 1
+                return entry
+
+            content = path.read_bytes()
+            digest = hashlib.sha256(content).hexdigest()
+            if entry is not None and entry.digest == digest:
+                # Touched but unchanged: keep the compiled mapper
+                entry = _Entry(stamp, digest, entry.config, entry.mapper)
+                self.hits += 1
+            else:
+                config = json.loads(content)
+                entry = _Entry(stamp, digest, config, GenericJsonMapper(config))
+                self.misses += 1
+
+            self._entries[pms_config.id] = entry
+            self._entries.move_to_end(pms_config.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return entry
+
+    @staticmethod
+    def _stamp(path: Path) -> Tuple[int, int]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {path}")
+        return st.st_mtime_ns, st.st_size
+
+
+mapper_registry = MapperRegistry()
@@ -1,12 +1,60 @@
 import re
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from jsonschema import ValidationError
-from jsonschema import validate as jsonschema_validate
+from jsonschema import SchemaError, validators
+from jsonschema.exceptions import best_match
 from pms_integration.exceptions import PMSBusinessRuleError, PMSDataValidationError
 
+DATE_FORMATS = {
+    "ISO8601": "%Y-%m-%dT%H:%M:%S",
+    "YYYY-MM-DD": "%Y-%m-%d",
+    "DD/MM/YYYY": "%d/%m/%Y",
+    "MM/DD/YYYY": "%m/%d/%Y",
+}
+
+# Inputs of exactly this shape parse identically with fromisoformat, which is
+# much faster than strptime; anything else goes through strptime.
+_ISO_SHAPES = {
+    "ISO8601": re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}", re.ASCII),
+    "YYYY-MM-DD": re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII),
+}
+
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+DateParser = Callable[[Any], Optional[date]]
+
+# A compiled rule appends its error messages to `errors`; `parsed` holds dates
+# already parsed for this record so business rules don't parse them again.
+Check = Callable[[dict, List[str], Dict[str, Optional[date]]], None]
+
+
+def date_parser(fmt: str) -> DateParser:
+    pattern = DATE_FORMATS.get(fmt)
+    if not pattern:
+        return lambda value: None
+
+    shape = _ISO_SHAPES.get(fmt)
+    strptime = datetime.strptime
+
+    def parse(value: Any) -> Optional[date]:
+        # Fields mapped with the `parse_date` transform are already datetimes
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        if not value or not isinstance(value, str):
+            return None
+        try:
+            if shape is not None and shape.fullmatch(value):
+                return datetime.fromisoformat(value).date()
+            return strptime(value, pattern).date()
+        except ValueError:
+            return None
+
+    return parse
+
 
 class DataValidator:
     """Multi-stage data validation pipeline"""
@@ -14,65 +62,52 @@ class DataValidator:
     def __init__(self, pms_config: dict):
         self.raw_schema = pms_config.get("raw_data_schema")
         self.validation_rules = pms_config.get("validation_rules", {})
+        self._schema_validator = self._compile_schema(self.raw_schema)
+        self._checks = self._compile_rules(self.validation_rules)
 
     def validate_raw_schema(self, raw_data: dict) -> dict:
+        if self._schema_validator and not self._schema_validator.is_valid(raw_data):
+            raise self._schema_error(raw_data)
+        return raw_data
+
+    def validate_raw_schema_many(
+        self, records: List[dict]
+    ) -> Dict[int, PMSDataValidationError]:
+        """
+        Validates a page of raw records against the schema without raising;
+        returns the error of each invalid record keyed by its index.
+        """
+        if not self._schema_validator:
+            return {}
+        is_valid = self._schema_validator.is_valid
+        return {
+            index: self._schema_error(raw)
+            for index, raw in enumerate(records)
+            if not is_valid(raw)
+        }
+
+    def _schema_error(self, raw_data: dict) -> PMSDataValidationError:
+        # Same error jsonschema.validate() would have raised
+        error = best_match(self._schema_validator.iter_errors(raw_data))
+        return PMSDataValidationError(f"Raw schema validation failed: {str(error)}")
+
+    @staticmethod
+    def _compile_schema(schema: Optional[dict]):
+        """Checks `raw_data_schema` once and builds its validator."""
+        if not schema:
+            return None
+        validator_class = validators.validator_for(schema)
         try:
-            if self.raw_schema:
-                jsonschema_validate(instance=raw_data, schema=self.raw_schema)
-            return raw_data
-        except ValidationError as e:
-            raise PMSDataValidationError(f"Raw schema validation failed: {str(e)}")
+            validator_class.check_schema(schema)
+        except SchemaError as e:
+            raise PMSDataValidationError(f"Invalid raw_data_schema: {e.message}")
+        return validator_class(schema)
 
     def validate_business_rules(self, mapped_data: dict) -> dict:
-        errors = []
-
-        # Required field check
-        required_fields = self.validation_rules.get("required_fields", [])
-        for field in required_fields:
-            if not mapped_data.get(field):
-                errors.append(f"Required field '{field}' is missing or empty")
-
-        # Field-level validation
-        field_rules = self.validation_rules.get("fields", {})
-        for field, rules in field_rules.items():
-            val = mapped_data.get(field)
-
-            if rules.get("type") == "date":
-                parsed = self._parse_date(val, rules.get("format", "ISO8601"))
-                if not parsed:
-                    errors.append(f"Invalid date format for field '{field}': {val}")
-
-            elif rules.get("type") == "decimal":
-                try:
-                    amount = Decimal(str(val))
-                    if "min" in rules and amount < Decimal(str(rules["min"])):
-                        errors.append(f"{field} below minimum value")
-                    if "max" in rules and amount > Decimal(str(rules["max"])):
-                        errors.append(f"{field} exceeds maximum value")
-                except (InvalidOperation, TypeError):
-                    errors.append(f"{field} must be a valid decimal")
-
-            elif rules.get("type") == "enum":
-                if val not in rules.get("allowed", []):
-                    errors.append(f"Invalid value for '{field}': {val}")
-
-            elif rules.get("type") == "email":
-                pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-                if val and not re.match(pattern, val):
-                    errors.append(f"Invalid email format: {val}")
-
-        # Business logic
-        check_in = self._parse_date(mapped_data.get("check_in"), "ISO8601")
-        check_out = self._parse_date(mapped_data.get("check_out"), "ISO8601")
-        if check_in and check_out:
-            if check_out <= check_in:
-                errors.append("Check-out date must be after check-in date")
-
-            max_days = self.validation_rules.get("business_rules", {}).get(
-                "max_booking_days", 365
-            )
-            if (check_out - check_in).days > max_days:
-                errors.append(f"Booking duration exceeds {max_days} days")
+        errors: List[str] = []
+        parsed: Dict[str, Optional[date]] = {}
+        for check in self._checks:
+            check(mapped_data, errors, parsed)
 
         if errors:
             raise PMSBusinessRuleError("; ".join(errors))
@@ -91,21 +126,133 @@ class DataValidator:
         return sanitized
 
     def _parse_date(self, value: Optional[str], fmt: str) -> Optional[date]:
-        if not value or not isinstance(value, str):
-            return None
+        return date_parser(fmt)(value)
 
-        formats = {
-            "ISO8601": "%Y-%m-%dT%H:%M:%S",
-            "YYYY-MM-DD": "%Y-%m-%d",
-            "DD/MM/YYYY": "%d/%m/%Y",
-            "MM/DD/YYYY": "%m/%d/%Y",
-        }
+    def _compile_rules(self, validation_rules: dict) -> List[Check]:
+        """
+        Compiles `validation_rules` once into specialized checks: precompiled
+        regexes, Decimal bounds, frozenset enums and per-format date parsers.
+        """
+        checks: List[Check] = []
 
-        pattern = formats.get(fmt)
-        if not pattern:
-            return None
+        required_fields = tuple(validation_rules.get("required_fields", []))
+        if required_fields:
+            checks.append(self._required_check(required_fields))
 
+        for field, rules in validation_rules.get("fields", {}).items():
+            rule_type = rules.get("type")
+            if rule_type == "date":
+                checks.append(self._date_check(field, rules.get("format", "ISO8601")))
+            elif rule_type == "decimal":
+                checks.append(self._decimal_check(field, rules))
+            elif rule_type == "enum":
+                checks.append(self._enum_check(field, rules.get("allowed", [])))
+            elif rule_type == "email":
+                checks.append(self._email_check(field))
+
+        max_days = validation_rules.get("business_rules", {}).get(
+            "max_booking_days", 365
+        )
+        checks.append(self._stay_check(max_days))
+        return checks
+
+    @staticmethod
+    def _required_check(fields: tuple) -> Check:
+        def check(data, errors, parsed):
+            for field in fields:
+                if not data.get(field):
+                    errors.append(f"Required field '{field}' is missing or empty")
+
+        return check
+
+    @staticmethod
+    def _date_check(field: str, fmt: str) -> Check:
+        parse = date_parser(fmt)
+        cacheable = fmt == "ISO8601"
+
+        def check(data, errors, parsed):
+            val = data.get(field)
+            value = parse(val)
+            if cacheable:
+                parsed[field] = value
+            if not value:
+                errors.append(f"Invalid date format for field '{field}': {val}")
+
+        return check
+
+    @staticmethod
+    def _decimal_check(field: str, rules: dict) -> Check:
         try:
-            return datetime.strptime(value, pattern).date()
-        except ValueError:
-            return None
+            low = Decimal(str(rules["min"])) if "min" in rules else None
+            high = Decimal(str(rules["max"])) if "max" in rules else None
+        except (InvalidOperation, TypeError):
+            # An unusable bound fails every record, as it did when parsed inline
+            return lambda data, errors, parsed: errors.append(
+                f"{field} must be a valid decimal"
+            )
+
+        def check(data, errors, parsed):
+            try:
+                amount = Decimal(str(data.get(field)))
+                if low is not None and amount < low:
+                    errors.append(f"{field} below minimum value")
+                if high is not None and amount > high:
+                    errors.append(f"{field} exceeds maximum value")
+            except (InvalidOperation, TypeError):
+                errors.append(f"{field} must be a valid decimal")
+
+        return check
+
+    @staticmethod
+    def _enum_check(field: str, allowed: list) -> Check:
+        allowed_values = tuple(allowed)
+        try:
+            allowed_set = frozenset(allowed_values)
+        except TypeError:
+            allowed_set = allowed_values
+
+        def check(data, errors, parsed):
+            val = data.get(field)
+            try:
+                valid = val in allowed_set
+            except TypeError:  # unhashable value
+                valid = val in allowed_values
+            if not valid:
+                errors.append(f"Invalid value for '{field}': {val}")
+
+        return check
+
+    @staticmethod
+    def _email_check(field: str) -> Check:
+        match = EMAIL_PATTERN.match
+
+        def check(data, errors, parsed):
+            val = data.get(field)
+            if val and not (isinstance(val, str) and match(val)):
+                errors.append(f"Invalid email format: {val}")
+
+        return check
+
+    @staticmethod
+    def _stay_check(max_days: int) -> Check:
+        parse = date_parser("ISO8601")
+
+        def check(data, errors, parsed):
+            check_in = (
+                parsed["check_in"]
+                if "check_in" in parsed
+                else parse(data.get("check_in"))
+            )
+            check_out = (
+                parsed["check_out"]
+                if "check_out" in parsed
+                else parse(data.get("check_out"))
+            )
+            if check_in and check_out:
+                if check_out <= check_in:
+                    errors.append("Check-out date must be after check-in date")
+
+                if (check_out - check_in).days > max_days:
+                    errors.append(f"Booking duration exceeds {max_days} days")
+
+        return check
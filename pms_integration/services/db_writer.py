@@ -0,0 +1,150 @@
+import queue
+import threading
+from concurrent.futures import Future
+from contextlib import ExitStack
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.db import connection, transaction
+
+_STOP = object()
+
+WriteJob = Tuple[Callable, tuple, dict, Future, float, List[Callable]]
+
+
+class DBWriter:
+    """
+    Single database writer for concurrent hotel syncs.
+
+    Sync workers submit write jobs (callables doing ORM writes) instead of
+    opening their own write transactions. One thread, on its own connection,
+    runs them: whatever is queued when it becomes free, up to `max_group`
+    jobs, is written in one transaction (group commit) with a savepoint per
+    job, so a failing job only rolls back itself. A job's future resolves
+    once its group has committed. Queries of a job also go through the
+    execute wrappers (e.g. a sync's QueryCounter) of the thread that
+    submitted it.
+
+    With SQLite this replaces lock contention between workers ("database is
+    locked") with a queue, while mapping and change detection (reads) keep
+    running in parallel.
+    """
+
+    def __init__(self, max_group: int = 32):
+        self.max_group = max_group
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.jobs = 0
+        self.groups = 0
+        self.max_depth = 0
+        self.wait_seconds = 0.0
+        self.write_seconds = 0.0
+
+    def start(self) -> "DBWriter":
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Writes what is still queued, then stops the writer thread."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "DBWriter":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        future: Future = Future()
+        if threading.current_thread() is self._thread:
+            # A job writing more: it is already inside the writer's transaction
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        wrappers = list(connection.execute_wrappers)
+        self._queue.put((fn, args, kwargs, future, perf_counter(), wrappers))
+        with self._lock:
+            self.max_depth = max(self.max_depth, self._queue.qsize())
+        return future
+
+    def call(self, fn: Callable, *args, **kwargs) -> Any:
+        """Runs `fn` on the writer and waits for its group to commit."""
+        return self.submit(fn, *args, **kwargs).result()
+
+    @property
+    def depth(self) -> int:
+        """Write jobs waiting for the writer."""
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "jobs": self.jobs,
+                "groups": self.groups,
+                "depth": self.depth,
+                "max_depth": self.max_depth,
+                "avg_wait_ms": (
+                    round(self.wait_seconds / self.jobs * 1000, 3) if self.jobs else 0.0
+                ),
+                "write_seconds": round(self.write_seconds, 6),
+            }
+
+    def _run(self) -> None:
+        try:
+            stopping = False
+            while not stopping:
+                group: List[WriteJob] = []
+                job = self._queue.get()
+                while job is not _STOP:
+                    group.append(job)
+                    if len(group) >= self.max_group:
+                        break
+                    try:
+                        job = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                stopping = job is _STOP
+                if group:
+                    self._write_group(group)
+        finally:
+            connection.close()
+
+    def _write_group(self, group: List[WriteJob]) -> None:
+        start = perf_counter()
+        results = []
+        try:
+            with transaction.atomic():
+                for fn, args, kwargs, _, _, wrappers in group:
+                    try:
+                        with ExitStack() as stack:
+                            for wrapper in wrappers:
+                                stack.enter_context(connection.execute_wrapper(wrapper))
+                            with transaction.atomic():
+                                results.append((fn(*args, **kwargs), None))
+                    except Exception as e:
+                        results.append((None, e))
+        except Exception as e:  # the commit itself failed
+            results = [(None, e)] * len(group)
+
+        end = perf_counter()
+        with self._lock:
+            self.jobs += len(group)
+            self.groups += 1
+            self.write_seconds += end - start
+            self.wait_seconds += sum(
+                start - submitted for _, _, _, _, submitted, _ in group
+            )
+
+        for (_, _, _, future, *_), (result, error) in zip(group, results):
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
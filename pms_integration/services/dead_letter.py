@@ -0,0 +1,168 @@
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+from pms_integration.models.booking import Booking
+from pms_integration.models.rejected_booking import RejectedBooking
+from pms_integration.services.change_detector import content_hash
+from pms_integration.services.db_writer import DBWriter
+from pms_integration.services.ingestor import BookingIngestor
+from pms_integration.services.mapper import GenericJsonMapper, MappingReject
+from pms_integration.services.metrics import StageTimer
+from pms_integration.services.parallel_mapper import pair_accepted
+
+REJECT_UPDATE_FIELDS = ["booking_id", "config_version", "error", "message"]
+
+
+def config_version(config: dict) -> str:
+    """Version of a PMS config, as recorded on its rejects."""
+    return content_hash(config)
+
+
+class DeadLetterStore:
+    """
+    Keeps the raw PMS records a hotel's sync rejected, one row per distinct
+    payload, together with the config version and error that rejected them.
+
+    `replay` re-maps only those records through the current mapper, so a
+    config fix costs time proportional to the rejects rather than the feed.
+    """
+
+    def __init__(
+        self,
+        hotel_id: int,
+        version: str = "",
+        batch_size: int = 500,
+        timer: Optional[StageTimer] = None,
+        writer: Optional[DBWriter] = None,
+    ):
+        self.hotel_id = hotel_id
+        self.version = version
+        self.batch_size = batch_size
+        self.timer = timer
+        self.writer = writer
+        # payload hash -> reject; one row per payload per batch, or the
+        # upsert would hit the same row twice
+        self._pending: Dict[str, RejectedBooking] = {}
+
+    def add(self, raw: dict, reject: MappingReject) -> None:
+        payload_hash = content_hash(raw)
+        self._pending[payload_hash] = RejectedBooking(
+            hotel_id=self.hotel_id,
+            booking_id=reject.booking_id,
+            payload_hash=payload_hash,
+            raw_data=raw,
+            config_version=self.version,
+            error=reject.error,
+            message=reject.message,
+        )
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes buffered rejects; a payload rejected again updates its row."""
+        if not self._pending:
+            return
+        start = perf_counter()
+        rejects = list(self._pending.values())
+        if self.writer is None:
+            self._write(rejects)
+        else:
+            self.writer.call(self._write, rejects)
+        if self.timer is not None:
+            self.timer.add("dead_letter", perf_counter() - start, len(rejects))
+        self._pending = {}
+
+    @staticmethod
+    def _write(rejects: List[RejectedBooking]) -> None:
+        RejectedBooking.objects.bulk_create(
+            rejects,
+            update_conflicts=True,
+            unique_fields=["hotel", "payload_hash"],
+            update_fields=REJECT_UPDATE_FIELDS + ["updated_at"],
+        )
+
+    def replay(
+        self,
+        mapper: GenericJsonMapper,
+        ingestor: BookingIngestor,
+        force: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Replays dead-lettered records through `mapper` in batches. Records
+        that map and save are removed; records that still fail keep their row
+        with the new error. Unless `force` is set, records rejected by the
+        current config version are left alone, since they would fail again.
+
+        A record whose booking was written after it was last rejected is
+        superseded by that write and dropped instead of replayed.
+        """
+        version = config_version(mapper.config)
+        rejects = RejectedBooking.objects.filter(hotel_id=self.hotel_id)
+        if not force:
+            rejects = rejects.exclude(config_version=version)
+
+        counts = {"replayed": 0, "superseded": 0, "rejected": 0, "failed": 0}
+        last_id = 0
+        while batch := list(
+            rejects.filter(id__gt=last_id).order_by("id")[: self.batch_size]
+        ):
+            last_id = batch[-1].id
+            self._replay_batch(batch, mapper, ingestor, version, counts)
+        return counts
+
+    def _replay_batch(
+        self,
+        batch: List[RejectedBooking],
+        mapper: GenericJsonMapper,
+        ingestor: BookingIngestor,
+        version: str,
+        counts: Dict[str, int],
+    ) -> None:
+        written = dict(
+            Booking.objects.filter(
+                hotel_id=self.hotel_id,
+                booking_id__in={r.booking_id for r in batch if r.booking_id},
+            ).values_list("booking_id", "updated_at")
+        )
+        superseded, live = [], []
+        for record in batch:
+            updated_at = written.get(record.booking_id)
+            if updated_at is not None and updated_at > record.updated_at:
+                superseded.append(record)
+            else:
+                live.append(record)
+
+        dtos, map_rejects = mapper.map_many([record.raw_data for record in live])
+        accepted, rejected = pair_accepted(live, dtos, map_rejects)
+
+        # Same hash the change detector stores, so the next sync skips them
+        for record, dto in accepted:
+            dto.source_hash = content_hash(record.raw_data, version)
+        saved, write_errors = ingestor.save_bookings(dto for _, dto in accepted)
+
+        failed_ids = {dto.booking_id for dto, _ in write_errors}
+        done = superseded + [
+            record for record, dto in accepted if dto.booking_id not in failed_ids
+        ]
+        RejectedBooking.objects.filter(id__in=[record.id for record in done]).delete()
+
+        still_rejected = self._update_rejects(rejected, version)
+        RejectedBooking.objects.bulk_update(still_rejected, REJECT_UPDATE_FIELDS)
+
+        counts["replayed"] += saved
+        counts["superseded"] += len(superseded)
+        counts["rejected"] += len(still_rejected)
+        counts["failed"] += len(write_errors)
+
+    @staticmethod
+    def _update_rejects(
+        rejected: List[Tuple[RejectedBooking, MappingReject]], version: str
+    ) -> List[RejectedBooking]:
+        records = []
+        for record, reject in rejected:
+            record.booking_id = reject.booking_id
+            record.config_version = version
+            record.error = reject.error
+            record.message = reject.message
+            records.append(record)
+        return records
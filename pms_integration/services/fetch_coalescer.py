@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+Records = List[dict]
+Partitions = Dict[Optional[str], Records]
+Route = Callable[[dict], Optional[str]]
+
+
+@dataclass
+class _Flight:
+    future: Union[Future, asyncio.Future]
+    started_at: float
+    fetched_at: datetime  # wall-clock start of the load
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class FetchCoalescer:
+    """
+    Fetch layer shared by the hotel syncs of one command run.
+
+    Fetches are keyed on their source (file path, or URL and params). The
+    first caller of a key loads it; concurrent callers of the same key wait
+    for that load instead of starting their own (single-flight), and later
+    callers get the parsed payload from the cache, for `ttl` seconds or the
+    whole run. Failed loads are not cached.
+
+    Every fetch returns the payload with the time its load started: a hotel
+    served from the cache must not advance its watermark past that time.
+    Loaders may build any payload, e.g. a `partition` of a record stream.
+    """
+
+    def __init__(
+        self, ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.clock = clock
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.shared = 0
+
+    def fetch(self, key: Hashable, load: Callable[[], Any]) -> Tuple[Any, datetime]:
+        """
+        (payload of source `key`, when its load started), loaded with `load`
+        at most once at a time.
+        """
+        flight, leader = self._join(key, Future)
+        if leader:
+            try:
+                flight.future.set_result(load())
+            except BaseException as e:
+                flight.future.set_exception(e)
+        return flight.future.result(), flight.fetched_at
+
+    async def afetch(
+        self, key: Hashable, load: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, datetime]:
+        """`fetch` for async loaders, coalesced within the running event loop."""
+        loop = asyncio.get_running_loop()
+        flight, leader = self._join(key, loop.create_future)
+        if not flight.future.done() and (
+            not isinstance(flight.future, asyncio.Future)
+            or flight.future.get_loop() is not loop
+        ):
+            # In flight on another thread or event loop: load it ourselves
+            fetched_at = _now()
+            return await load(), fetched_at
+        if leader:
+            try:
+                flight.future.set_result(await load())
+            except asyncio.CancelledError:
+                flight.future.cancel()
+                raise
+            except Exception as e:
+                flight.future.set_exception(e)
+        if not flight.future.done():
+            await asyncio.shield(flight.future)
+        return flight.future.result(), flight.fetched_at
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"loads": self.loads, "shared": self.shared}
+
+    def _join(self, key: Hashable, new_future: Callable) -> tuple:
+        """Returns (flight for `key`, whether the caller has to load it)."""
+        now = self.clock()
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and not self._stale(flight, now):
+                self.shared += 1
+                return flight, False
+            flight = _Flight(new_future(), now, _now())
+            self._flights[key] = flight
+            self.loads += 1
+            return flight, True
+
+    def _stale(self, flight: _Flight, now: float) -> bool:
+        if not flight.future.done():
+            return False
+        if flight.future.cancelled() or flight.future.exception() is not None:
+            return True
+        return self.ttl is not None and now - flight.started_at > self.ttl
+
+
+def partition(
+    records: Iterable[dict], route: Route, keep: Optional[Collection] = None
+) -> Partitions:
+    """
+    Groups a record stream by `route(record)` (property code) as it is read,
+    keeping their order; with `keep`, only those groups are kept.
+    """
+    groups: Partitions = defaultdict(list)
+    _add(groups, records, route, keep)
+    return dict(groups)
+
+
+async def apartition(
+    pages: AsyncIterable[Records], route: Route, keep: Optional[Collection] = None
+) -> Partitions:
+    """`partition` for a stream of record pages."""
+    groups: Partitions = defaultdict(list)
+    async for page in pages:
+        _add(groups, page, route, keep)
+    return dict(groups)
+
+
+def _add(groups: Partitions, records: Iterable[dict], route: Route, keep) -> None:
+    for record in records:
+        group = route(record)
+        if keep is None or group in keep:
+            groups[group].append(record)
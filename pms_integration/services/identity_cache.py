@@ -0,0 +1,110 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from pms_integration.models.guest import Guest
+from pms_integration.models.room import Room
+
+GuestKey = Tuple[str, Optional[str]]
+
+GUEST_CACHE_SIZE = 10000
+
+
+class IdentityCache:
+    """
+    Per-sync identity map of resolved Guest and Room ids for one hotel.
+
+    Warmed on first use with one query for the hotel's rooms and one for the
+    guests of its bookings; afterwards only unseen keys reach the database.
+    Rooms (a handful per hotel) are kept unbounded, guests in an LRU of
+    `max_guests` entries. Lookups and updates are locked, so one cache can
+    be shared by the threads writing a hotel's bookings.
+
+    Ids are only valid while the rows exist: the ingestor adds them after
+    its write commits and clears the cache when a write fails.
+    """
+
+    def __init__(self, hotel_id: int, max_guests: int = GUEST_CACHE_SIZE):
+        self.hotel_id = hotel_id
+        self.max_guests = max_guests
+        self.hits = 0
+        self.misses = 0
+        self._rooms: Dict[str, int] = {}
+        self._guests: "OrderedDict[GuestKey, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._warmed = False
+
+    def warm(self) -> None:
+        with self._lock:
+            if self._warmed:
+                return
+            self._warmed = True
+        rooms = {}
+        for pk, room_type in (
+            Room.objects.filter(hotel_id=self.hotel_id)
+            .order_by("pk")
+            .values_list("pk", "room_type")
+        ):
+            rooms.setdefault(room_type, pk)
+        guests = {
+            (name, email): pk
+            for pk, name, email in Guest.objects.filter(booking__hotel_id=self.hotel_id)
+            .distinct()
+            .order_by("pk")
+            .values_list("pk", "name", "email")[: self.max_guests]
+        }
+        self.add_rooms(rooms)
+        self.add_guests(guests)
+
+    def get_rooms(self, room_types: Iterable[str]) -> Tuple[Dict[str, int], Set[str]]:
+        """Returns ({room_type: id} for cached types, uncached types)."""
+        self.warm()
+        found, missing = {}, set()
+        with self._lock:
+            for room_type in room_types:
+                if room_type in self._rooms:
+                    found[room_type] = self._rooms[room_type]
+                else:
+                    missing.add(room_type)
+            self._count(found, missing)
+        return found, missing
+
+    def get_guests(
+        self, keys: Iterable[GuestKey]
+    ) -> Tuple[Dict[GuestKey, int], Set[GuestKey]]:
+        """Returns ({key: id} for cached guests, uncached keys)."""
+        self.warm()
+        found, missing = {}, set()
+        with self._lock:
+            for key in keys:
+                pk = self._guests.get(key)
+                if pk is None:
+                    missing.add(key)
+                else:
+                    self._guests.move_to_end(key)
+                    found[key] = pk
+            self._count(found, missing)
+        return found, missing
+
+    def add_rooms(self, rooms: Dict[str, int]) -> None:
+        with self._lock:
+            for room_type, pk in rooms.items():
+                self._rooms.setdefault(room_type, pk)
+
+    def add_guests(self, guests: Dict[GuestKey, int]) -> None:
+        with self._lock:
+            self._guests.update(guests)
+            for key in guests:
+                self._guests.move_to_end(key)
+            while len(self._guests) > self.max_guests:
+                self._guests.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops cached ids; the cache is not warmed again."""
+        with self._lock:
+            self._rooms.clear()
+            self._guests.clear()
+
+    def _count(self, found: dict, missing: set) -> None:
+        self.hits += len(found)
+        self.misses += len(missing)
@@ -1,39 +1,234 @@
-from typing import Optional
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from django.db import transaction
 from pms_integration.dtos.booking_dto import BookingDTO
 from pms_integration.models.booking import Booking
 from pms_integration.models.guest import Guest
 from pms_integration.models.room import Room
+from pms_integration.models.sync_state import bump_data_version
+from pms_integration.services.db_writer import DBWriter
+from pms_integration.services.identity_cache import GuestKey, IdentityCache
+from pms_integration.services.metrics import StageTimer
+
+DEFAULT_ROOM_TYPE = "Standard"
+BOOKING_UPDATE_FIELDS = [
+    "room",
+    "guest",
+    "guest_name",
+    "check_in",
+    "check_out",
+    "status",
+    "total_amount",
+    "source_hash",
+    "updated_at",
+]
 
 
 class BookingIngestor:
-    def __init__(self, hotel_id: int):
+    def __init__(
+        self,
+        hotel_id: int,
+        timer: Optional[StageTimer] = None,
+        identities: Optional[IdentityCache] = None,
+        writer: Optional[DBWriter] = None,
+    ):
         self.hotel_id = hotel_id
+        self.timer = timer
+        # Batches are written on this writer's thread, when given
+        self.writer = writer
+        # Guest and room ids resolved by this ingestor (one per sync)
+        self.identities = identities or IdentityCache(hotel_id)
 
     def save_booking(self, dto: BookingDTO) -> Optional[Booking]:
         """
         Upserts a Booking for the given hotel.
         """
-        with transaction.atomic():
-            guest, _ = Guest.objects.get_or_create(
-                name=dto.guest_name, email=dto.guest_email or None
-            )
+        guest_key = self._guest_key(dto)
+        room_type = dto.room_type or DEFAULT_ROOM_TYPE
+        guests, _ = self.identities.get_guests([guest_key])
+        rooms, _ = self.identities.get_rooms([room_type])
+        try:
+            with transaction.atomic():
+                if guest_key not in guests:
+                    guests[guest_key] = Guest.objects.get_or_create(
+                        name=guest_key[0], email=guest_key[1]
+                    )[0].pk
+                if room_type not in rooms:
+                    rooms[room_type] = Room.objects.get_or_create(
+                        hotel_id=self.hotel_id, room_type=room_type
+                    )[0].pk
+
+                booking, created = Booking.objects.update_or_create(
+                    hotel_id=self.hotel_id,
+                    booking_id=dto.booking_id,
+                    defaults={
+                        "guest_id": guests[guest_key],
+                        "room_id": rooms[room_type],
+                        **self._booking_values(dto),
+                    },
+                )
+                bump_data_version(self.hotel_id)
+        except Exception:
+            self.identities.clear()
+            raise
+        self.identities.add_guests(guests)
+        self.identities.add_rooms(rooms)
+        return booking
+
+    def save_bookings(
+        self, dtos: Iterable[BookingDTO], batch_size: int = 500
+    ) -> Tuple[int, List[Tuple[BookingDTO, Exception]]]:
+        """
+        Upserts bookings in batches: guests and rooms come from the identity
+        cache, with one IN query per batch for the ones it has not seen, and
+        bookings are written with a single bulk upsert.
+
+        A batch that fails to write is retried record by record, so errors are
+        still reported per booking. Every committed write bumps the hotel's
+        data version. Returns (saved count, [(dto, error), ...]).
+        """
+        saved, failed = 0, []
+        batch: List[BookingDTO] = []
+        for dto in dtos:
+            batch.append(dto)
+            if len(batch) >= batch_size:
+                saved += self._save_batch(batch, failed)
+                batch = []
+        if batch:
+            saved += self._save_batch(batch, failed)
+        return saved, failed
+
+    def _save_batch(
+        self, batch: List[BookingDTO], failed: List[Tuple[BookingDTO, Exception]]
+    ) -> int:
+        if self.timer is None:
+            return self._submit_batch(batch, failed)
+        with self.timer.stage("write", len(batch)):
+            return self._submit_batch(batch, failed)
+
+    def _submit_batch(
+        self, batch: List[BookingDTO], failed: List[Tuple[BookingDTO, Exception]]
+    ) -> int:
+        if self.writer is None:
+            return self._write_batch(batch, failed)
+        try:
+            return self.writer.call(self._write_batch, batch, failed)
+        except Exception:
+            # The writer's group commit failed after the batch was written
+            self.identities.clear()
+            raise
 
-            room, _ = Room.objects.get_or_create(
-                hotel_id=self.hotel_id, room_type=dto.room_type or "Standard"
+    def _write_batch(
+        self, batch: List[BookingDTO], failed: List[Tuple[BookingDTO, Exception]]
+    ) -> int:
+        # Later records win, as they would with sequential upserts
+        unique = list({dto.booking_id: dto for dto in batch}.values())
+        try:
+            with transaction.atomic():
+                guests, rooms = self._bulk_upsert(unique)
+                bump_data_version(self.hotel_id)
+            self.identities.add_guests(guests)
+            self.identities.add_rooms(rooms)
+            return len(unique)
+        except Exception:
+            # Ids created in the rolled back transaction are gone
+            self.identities.clear()
+            saved = 0
+            for dto in unique:
+                try:
+                    self.save_booking(dto)
+                    saved += 1
+                except Exception as e:
+                    failed.append((dto, e))
+            return saved
+
+    def _bulk_upsert(
+        self, dtos: List[BookingDTO]
+    ) -> Tuple[Dict[GuestKey, int], Dict[str, int]]:
+        guests = self._resolve_guests({self._guest_key(dto) for dto in dtos})
+        rooms = self._resolve_rooms(
+            {dto.room_type or DEFAULT_ROOM_TYPE for dto in dtos}
+        )
+
+        Booking.objects.bulk_create(
+            [
+                Booking(
+                    hotel_id=self.hotel_id,
+                    booking_id=dto.booking_id,
+                    guest_id=guests[self._guest_key(dto)],
+                    room_id=rooms[dto.room_type or DEFAULT_ROOM_TYPE],
+                    **self._booking_values(dto),
+                )
+                for dto in dtos
+            ],
+            update_conflicts=True,
+            unique_fields=["hotel", "booking_id"],
+            update_fields=BOOKING_UPDATE_FIELDS,
+        )
+        return guests, rooms
+
+    def _resolve_guests(self, keys: set) -> Dict[GuestKey, int]:
+        cached, keys = self.identities.get_guests(keys)
+        if not keys:
+            return cached
+
+        def fetch():
+            names = {name for name, _ in keys}
+            return {
+                (name, email): pk
+                for pk, name, email in Guest.objects.filter(name__in=names)
+                .order_by("pk")
+                .values_list("pk", "name", "email")
+                .iterator()
+                if (name, email) in keys
+            }
+
+        resolved = fetch()
+        missing = keys - resolved.keys()
+        if missing:
+            Guest.objects.bulk_create(
+                [Guest(name=name, email=email) for name, email in missing],
+                ignore_conflicts=True,
             )
+            resolved = fetch()
+        return {**cached, **resolved}
 
-            booking, created = Booking.objects.update_or_create(
-                hotel_id=self.hotel_id,
-                booking_id=dto.booking_id,
-                defaults={
-                    "guest": guest,
-                    "room": room,
-                    "check_in": dto.check_in_date,
-                    "check_out": dto.check_out_date,
-                    "status": dto.status,
-                    "total_amount": dto.total_amount,
-                },
+    def _resolve_rooms(self, room_types: set) -> Dict[str, int]:
+        cached, room_types = self.identities.get_rooms(room_types)
+        if not room_types:
+            return cached
+
+        def fetch():
+            resolved = {}
+            for pk, room_type in (
+                Room.objects.filter(hotel_id=self.hotel_id, room_type__in=room_types)
+                .order_by("pk")
+                .values_list("pk", "room_type")
+            ):
+                resolved.setdefault(room_type, pk)
+            return resolved
+
+        resolved = fetch()
+        missing = room_types - resolved.keys()
+        if missing:
+            Room.objects.bulk_create(
+                [Room(hotel_id=self.hotel_id, room_type=t) for t in missing]
             )
-            return booking
+            resolved = fetch()
+        return {**cached, **resolved}
+
+    @staticmethod
+    def _guest_key(dto: BookingDTO) -> GuestKey:
+        return dto.guest_name, dto.guest_email or None
+
+    @staticmethod
+    def _booking_values(dto: BookingDTO) -> dict:
+        return {
+            "guest_name": dto.guest_name,
+            "check_in": dto.check_in.date(),
+            "check_out": dto.check_out.date(),
+            "status": dto.status.value,
+            "total_amount": dto.total_amount or Decimal("0.00"),
+            "source_hash": dto.source_hash or "",
+        }
@@ -0,0 +1,175 @@
+import logging
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, Optional
+
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from pms_integration.exceptions import SyncLeaseError
+from pms_integration.models.sync_lease import SyncLease
+
+logger = logging.getLogger(__name__)
+
+
+def default_owner() -> str:
+    """Lease owner id of this process: host and pid."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _run(fn: Callable, *args, **kwargs):
+    return fn(*args, **kwargs)
+
+
+@dataclass
+class HotelLease:
+    hotel_id: int
+    owner: str
+    expires_at: datetime
+    lost: threading.Event = field(default_factory=threading.Event)
+
+    def check(self) -> None:
+        """Raises SyncLeaseError if the lease was lost or has run out."""
+        if self.lost.is_set() or timezone.now() >= self.expires_at:
+            raise SyncLeaseError(
+                f"Lost the sync lease on hotel {self.hotel_id} ({self.owner})"
+            )
+
+
+class LeaseManager:
+    """
+    Database-backed hotel sync leases, so that sync workers on several
+    nodes or processes split the hotels between them.
+
+    A worker claims a hotel with a conditional UPDATE that only succeeds
+    when the lease is free or expired, so at most one worker holds it on any
+    backend. Held leases are renewed by a heartbeat thread every
+    `heartbeat_interval` seconds; a lease that is not renewed for `ttl`
+    seconds (the worker died or hung) can be taken over by another worker,
+    and its former holder sees it as lost.
+
+    Writes go through `write` (e.g. the sync command's single writer).
+    """
+
+    def __init__(
+        self,
+        owner: Optional[str] = None,
+        ttl: float = 60.0,
+        heartbeat_interval: Optional[float] = None,
+        write: Callable = _run,
+    ):
+        self.owner = owner or default_owner()
+        self.ttl = timedelta(seconds=ttl)
+        self.heartbeat_interval = heartbeat_interval or ttl / 3
+        self.write = write
+        self._held: Dict[int, HotelLease] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "LeaseManager":
+        self._thread = threading.Thread(
+            target=self._heartbeats, name="lease-heartbeat", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stops the heartbeat and releases the leases still held."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            held = list(self._held.values())
+        for lease in held:
+            self.release(lease)
+
+    def claim(
+        self, hotel_id: int, claimed_after: Optional[datetime] = None
+    ) -> Optional[HotelLease]:
+        """
+        Claims the hotel's lease; None if another worker holds it or, with
+        `claimed_after`, if anyone claimed it since then (it was just synced).
+        """
+        expires_at = self.write(self._claim, hotel_id, claimed_after)
+        if expires_at is None:
+            return None
+        lease = HotelLease(hotel_id, self.owner, expires_at)
+        with self._lock:
+            self._held[hotel_id] = lease
+        return lease
+
+    def release(self, lease: HotelLease) -> None:
+        with self._lock:
+            self._held.pop(lease.hotel_id, None)
+        self.write(
+            lambda: SyncLease.objects.filter(
+                hotel_id=lease.hotel_id, owner=self.owner
+            ).update(owner="", expires_at=None)
+        )
+
+    @contextmanager
+    def hold(
+        self, hotel_id: int, claimed_after: Optional[datetime] = None
+    ) -> Iterator[HotelLease]:
+        """Holds the hotel's lease for the block; raises if it is taken."""
+        lease = self.claim(hotel_id, claimed_after)
+        if lease is None:
+            raise SyncLeaseError(f"Hotel {hotel_id} is leased by another worker")
+        try:
+            yield lease
+        finally:
+            self.release(lease)
+
+    def heartbeat(self) -> None:
+        """Renews the held leases; marks the ones taken over as lost."""
+        with self._lock:
+            held = dict(self._held)
+        if not held:
+            return
+        kept, expires_at = self.write(self._renew, list(held))
+        for hotel_id, lease in held.items():
+            if hotel_id in kept:
+                lease.expires_at = expires_at
+            else:
+                lease.lost.set()
+
+    def _claim(
+        self, hotel_id: int, claimed_after: Optional[datetime]
+    ) -> Optional[datetime]:
+        now = timezone.now()
+        expires_at = now + self.ttl
+        SyncLease.objects.bulk_create(
+            [SyncLease(hotel_id=hotel_id)], ignore_conflicts=True
+        )
+        free = Q(owner="") | Q(expires_at__lt=now)
+        leases = SyncLease.objects.filter(free, hotel_id=hotel_id)
+        if claimed_after is not None:
+            leases = leases.filter(
+                Q(acquired_at__isnull=True) | Q(acquired_at__lt=claimed_after)
+            )
+        claimed = leases.update(
+            owner=self.owner, expires_at=expires_at, acquired_at=now
+        )
+        return expires_at if claimed else None
+
+    def _renew(self, hotel_ids):
+        expires_at = timezone.now() + self.ttl
+        mine = SyncLease.objects.filter(hotel_id__in=hotel_ids, owner=self.owner)
+        mine.update(expires_at=expires_at)
+        return set(mine.values_list("hotel_id", flat=True)), expires_at
+
+    def _heartbeats(self) -> None:
+        try:
+            while not self._stop.wait(self.heartbeat_interval):
+                try:
+                    self.heartbeat()
+                except Exception:
+                    logger.exception("Sync lease heartbeat failed")
+        finally:
+            connection.close()
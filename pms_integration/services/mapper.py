@@ -1,9 +1,77 @@
-from typing import Any, Dict
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from jsonpath_ng import parse as jsonpath_parse
 from pms_integration.dtos.booking_dto import BookingDTO
 from pms_integration.exceptions import PMSMappingError
 from pms_integration.services.data_validator import DataValidator
+from pms_integration.services.metrics import StageTimer
+
+# `$.a.b.c` paths are resolved with plain dict lookups instead of jsonpath_ng.
+# `where`/`wherenot` are jsonpath_ng keywords, so they always go through the parser.
+_SIMPLE_PATH = re.compile(r"^\$(\.[A-Za-z_][A-Za-z0-9_]*)+$")
+_JSONPATH_KEYWORDS = frozenset({"where", "wherenot"})
+
+Extractor = Callable[[dict], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class FieldPlan:
+    """A single compiled entry of `field_mappings`."""
+
+    name: str
+    resolve: Extractor
+
+
+class MappingReject(NamedTuple):
+    """A record rejected by `GenericJsonMapper.map_many`."""
+
+    index: int
+    booking_id: Optional[str]
+    error: str
+    message: str
+
+
+def compile_path(path: str) -> Extractor:
+    """Builds an extractor returning the first match of `path` (or None)."""
+    keys = tuple(path.split(".")[1:])
+    if _SIMPLE_PATH.match(path) and not _JSONPATH_KEYWORDS.intersection(keys):
+
+        def extract_keys(data: dict) -> Any:
+            for key in keys:
+                if not isinstance(data, dict):
+                    return None
+                data = data.get(key)
+            return data
+
+        return extract_keys
+
+    try:
+        expression = jsonpath_parse(path)
+    except Exception as e:
+        raise PMSMappingError(f"JSONPath '{path}' failed: {e}")
+
+    def extract_jsonpath(data: dict) -> Any:
+        try:
+            result = expression.find(data)
+            return result[0].value if result else None
+        except Exception as e:
+            raise PMSMappingError(f"JSONPath '{path}' failed: {e}")
+
+    return extract_jsonpath
+
+
+def parse_iso_datetime(value: Any) -> Optional[datetime]:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
 
 
 class GenericJsonMapper:
@@ -13,57 +81,163 @@ class GenericJsonMapper:
         self.config = config
         self.validator = DataValidator(config)
         self.status_mappings = config.get("status_mappings", {})
+        self.transforms: Dict[str, Callable[[Any], Any]] = {
+            "parse_date": parse_iso_datetime,
+            "map_status": self.status_mappings.get,
+        }
+        self.plan = self._compile(config.get("field_mappings", {}))
+        self._booking_id = next(
+            (f.resolve for f in self.plan if f.name == "booking_id"), None
+        )
+        # Path of the property code in multi-property exports
+        self.property_key = config.get("property_key")
+        self._property_id = (
+            compile_path(self.property_key) if self.property_key else None
+        )
 
     def map(self, raw: dict) -> BookingDTO:
         raw = self.validator.validate_raw_schema(raw)
+        return self._map_validated(raw)
 
-        mapped: Dict[str, Any] = {}
-        field_mappings = self.config.get("field_mappings", {})
+    def map_many(
+        self, raws: Iterable[dict], timer: Optional[StageTimer] = None
+    ) -> Tuple[List[BookingDTO], List[MappingReject]]:
+        """
+        Maps a batch of raw records without raising. Returns the DTOs of the
+        valid records (in input order) and a compact reject per invalid one,
+        including records whose mapping failed with an unexpected error.
 
-        for field, mapping_config in field_mappings.items():
-            try:
-                value = self._resolve_field(mapping_config, raw)
-                mapped[field] = value
-            except Exception as e:
-                raise PMSMappingError(f"Failed to map field '{field}': {e}")
+        With a `timer`, time spent in each mapping stage is added to it.
+        """
+        raws = raws if isinstance(raws, list) else list(raws)
+        if timer is None:
+            schema_errors = self.validator.validate_raw_schema_many(raws)
+            map_validated = self._map_validated
+        else:
+            with timer.stage("schema", len(raws)):
+                schema_errors = self.validator.validate_raw_schema_many(raws)
+            map_validated = partial(self._map_timed, timer=timer)
+
+        dtos: List[BookingDTO] = []
+        rejects: List[MappingReject] = []
+        for index, raw in enumerate(raws):
+            error = schema_errors.get(index)
+            if error is None:
+                try:
+                    dtos.append(map_validated(raw))
+                    continue
+                except Exception as e:  # reject the record, not the batch
+                    error = e
+            rejects.append(
+                MappingReject(
+                    index,
+                    self.extract_booking_id(raw),
+                    type(error).__name__,
+                    str(error),
+                )
+            )
+        return dtos, rejects
+
+    def extract_booking_id(self, raw: dict) -> Optional[str]:
+        """Best-effort booking id of a raw record, without validating it."""
+        if self._booking_id is None:
+            return None
+        try:
+            booking_id = self._booking_id(raw)
+        except Exception:
+            return None
+        return str(booking_id) if booking_id is not None else None
+
+    def extract_property_id(self, raw: dict) -> Optional[str]:
+        """Property code of a raw record, by the config's `property_key`."""
+        if self._property_id is None:
+            return None
+        try:
+            property_id = self._property_id(raw)
+        except Exception:
+            return None
+        return str(property_id) if property_id is not None else None
+
+    def _map_validated(self, raw: dict) -> BookingDTO:
+        mapped = self._map_fields(raw)
+        mapped = self.validator.validate_business_rules(mapped)
+        mapped = self.validator.sanitize_data(mapped)
+        return self._build_dto(mapped)
+
+    def _map_timed(self, raw: dict, timer: StageTimer) -> BookingDTO:
+        """`_map_validated`, adding the time of each stage to `timer`."""
+        start = perf_counter()
+        mapped = self._map_fields(raw)
+        extracted = perf_counter()
+        timer.add("extract", extracted - start)
 
         mapped = self.validator.validate_business_rules(mapped)
         mapped = self.validator.sanitize_data(mapped)
+        checked = perf_counter()
+        timer.add("rules", checked - extracted)
+
+        try:
+            return self._build_dto(mapped)
+        finally:
+            timer.add("dto", perf_counter() - checked)
 
+    def _build_dto(self, mapped: dict) -> BookingDTO:
         try:
             return BookingDTO(**mapped)
         except Exception as e:
             raise PMSMappingError(f"Failed to create BookingDTO: {e}")
 
-    def _resolve_field(self, config: Any, data: dict) -> Any:
+    def _map_fields(self, raw: dict) -> Dict[str, Any]:
+        mapped: Dict[str, Any] = {}
+        for field in self.plan:
+            try:
+                mapped[field.name] = field.resolve(raw)
+            except Exception as e:
+                raise PMSMappingError(f"Failed to map field '{field.name}': {e}")
+        return mapped
+
+    def _compile(self, field_mappings: dict) -> Tuple[FieldPlan, ...]:
+        """
+        Compiles `field_mappings` once into an immutable plan of extractors,
+        so JSONPath expressions are not re-parsed for every record.
+        """
+        plan = []
+        for field, mapping_config in field_mappings.items():
+            try:
+                plan.append(FieldPlan(field, self._compile_field(mapping_config)))
+            except Exception as e:
+                raise PMSMappingError(f"Failed to map field '{field}': {e}")
+        return tuple(plan)
+
+    def _compile_field(self, config: Any) -> Extractor:
         if isinstance(config, str):
-            return self._extract(data, config)
+            return compile_path(config)
 
         if isinstance(config, dict):
             if "template" in config and "fields" in config:
-                resolved_fields = {
-                    k: self._extract(data, v) for k, v in config["fields"].items()
-                }
-                return config["template"].format(**resolved_fields)
+                return self._compile_template(config["template"], config["fields"])
 
             if "path" in config:
-                value = self._extract(data, config["path"])
+                extract = compile_path(config["path"])
                 if transform := config.get("transform"):
-                    return self._apply_transform(value, transform)
-                return value
+                    apply = self._resolve_transform(transform)
+                    return lambda data: apply(extract(data))
+                return extract
 
         raise PMSMappingError("Invalid mapping configuration")
 
-    def _extract(self, data: dict, path: str) -> Any:
-        try:
-            result = jsonpath_parse(path).find(data)
-            return result[0].value if result else None
-        except Exception as e:
-            raise PMSMappingError(f"JSONPath '{path}' failed: {e}")
+    def _compile_template(self, template: str, fields: dict) -> Extractor:
+        render = template.format
+        extractors = tuple((k, compile_path(v)) for k, v in fields.items())
+
+        def resolve(data: dict) -> str:
+            return render(**{k: extract(data) for k, extract in extractors})
+
+        return resolve
+
+    def _resolve_transform(self, transform: str) -> Callable[[Any], Any]:
+        return self.transforms.get(transform, _identity)
+
 
-    def _apply_transform(self, value: Any, transform: str) -> Any:
-        if transform == "parse_date":
-            return self._parse_date(value, "ISO8601")
-        elif transform == "map_status":
-            return self.status_mappings.get(value, None)
-        return value
+def _identity(value: Any) -> Any:
+    return value
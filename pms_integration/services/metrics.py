@@ -0,0 +1,131 @@
+import sys
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+# Pipeline stages, in the order they run for a record
+STAGES = (
+    "fetch",
+    "detect",
+    "schema",
+    "extract",
+    "rules",
+    "dto",
+    "write",
+    "dead_letter",
+)
+
+
+class StageTimer:
+    """
+    Accumulates wall time and record counts per sync pipeline stage.
+
+    One timer is used per hotel sync, from the threads of its pipeline;
+    timings measured in mapping worker processes are merged in with `merge`.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.records: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float, records: int = 1) -> None:
+        with self._lock:
+            self.seconds[stage] += seconds
+            self.records[stage] += records
+
+    @contextmanager
+    def stage(self, stage: str, records: int = 1) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, perf_counter() - start, records)
+
+    def iterate(
+        self, stage: str, items: Iterable[Any], size: Optional[Callable] = None
+    ) -> Iterator[Any]:
+        """
+        Yields from `items`, timing only the time spent producing them.
+        Each item counts as one record, or as `size(item)` records.
+        """
+        items = iter(items)
+        while True:
+            start = perf_counter()
+            try:
+                item = next(items)
+            except StopIteration:
+                self.add(stage, perf_counter() - start, 0)
+                return
+            self.add(stage, perf_counter() - start, size(item) if size else 1)
+            yield item
+
+    async def aiterate(
+        self, stage: str, items: AsyncIterable[Any], size: Optional[Callable] = None
+    ) -> AsyncIterator[Any]:
+        """`iterate` for async iterables."""
+        items = aiter(items)
+        while True:
+            start = perf_counter()
+            try:
+                item = await anext(items)
+            except StopAsyncIteration:
+                self.add(stage, perf_counter() - start, 0)
+                return
+            self.add(stage, perf_counter() - start, size(item) if size else 1)
+            yield item
+
+    def merge(self, timings: Dict[str, Dict[str, float]]) -> None:
+        for stage, values in timings.items():
+            self.add(stage, values["seconds"], values["records"])
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        ordered = [s for s in STAGES if s in self.seconds]
+        ordered += sorted(set(self.seconds) - set(STAGES))
+        return {
+            stage: {
+                "seconds": round(self.seconds[stage], 6),
+                "records": self.records[stage],
+            }
+            for stage in ordered
+        }
+
+
+class QueryCounter:
+    """
+    Django `execute_wrapper` counting the queries run on a connection (or on
+    the connections of several threads it is installed on).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        with self._lock:
+            self.count += 1
+        return execute(sql, params, many, context)
+
+
+def peak_memory_kb() -> Optional[int]:
+    """Peak resident set size of this process so far, in KiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # bytes on macOS
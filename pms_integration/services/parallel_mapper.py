@@ -0,0 +1,140 @@
+import hashlib
+import json
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pms_integration.dtos.booking_dto import BookingDTO
+from pms_integration.enums.status import BookingStatus
+from pms_integration.services.mapper import GenericJsonMapper, MappingReject
+from pms_integration.services.metrics import StageTimer
+
+# Positional layout of the compact DTO tuples sent back by workers
+DTO_FIELDS = tuple(BookingDTO.model_fields)
+
+# ([(item, dto), ...], [(item, reject), ...]) for one chunk of input items
+MapChunk = Tuple[List[Tuple[Any, BookingDTO]], List[Tuple[Any, MappingReject]]]
+
+_worker_mappers: Dict[str, GenericJsonMapper] = {}
+
+
+def create_process_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool for mapping. Workers are spawned rather than forked, since
+    the sync command starts them from a multi-threaded process.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def map_in_chunks(
+    mapper: GenericJsonMapper,
+    items: Iterable[Any],
+    raw: Callable[[Any], dict] = lambda item: item,
+    chunk_size: int = 500,
+    timer: Optional[StageTimer] = None,
+) -> Iterator[MapChunk]:
+    """Maps `items` in this process with `map_many`, chunk by chunk."""
+    items = iter(items)
+    while chunk := list(islice(items, chunk_size)):
+        dtos, rejects = mapper.map_many([raw(item) for item in chunk], timer)
+        yield pair_accepted(chunk, dtos, rejects)
+
+
+def pair_accepted(
+    chunk: List[Any], dtos: List[BookingDTO], rejects: List[MappingReject]
+) -> MapChunk:
+    """Pairs `map_many` results back up with the input items they came from."""
+    rejected = [(chunk[reject.index], reject) for reject in rejects]
+    indexes = {reject.index for reject in rejects}
+    accepted = [item for index, item in enumerate(chunk) if index not in indexes]
+    return list(zip(accepted, dtos)), rejected
+
+
+class ParallelMapper:
+    """
+    Maps raw records on a process pool (schema validation, JSONPath
+    extraction, business rules and DTO construction all run in the workers).
+
+    Records are sent in chunks and results come back as compact tuples, in
+    input order, with at most `max_pending` chunks in flight, so callers can
+    keep writing from a single thread while mapping scales with cores.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        mapper: GenericJsonMapper,
+        chunk_size: int = 500,
+        max_pending: int = 4,
+        timer: Optional[StageTimer] = None,
+    ):
+        self.executor = executor
+        self.timer = timer
+        self.config = mapper.config
+        self.config_key = hashlib.sha256(
+            json.dumps(mapper.config, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending
+
+    def map(
+        self, items: Iterable[Any], raw: Callable[[Any], dict] = lambda item: item
+    ) -> Iterator[MapChunk]:
+        items = iter(items)
+        pending = deque()
+
+        def submit() -> bool:
+            chunk = list(islice(items, self.chunk_size))
+            if not chunk:
+                return False
+            future = self.executor.submit(
+                map_chunk,
+                self.config_key,
+                self.config,
+                [raw(item) for item in chunk],
+                self.timer is not None,
+            )
+            pending.append((chunk, future))
+            return True
+
+        while len(pending) < self.max_pending and submit():
+            pass
+
+        while pending:
+            chunk, future = pending.popleft()
+            rows, rejects, timings = future.result()
+            if timings:
+                self.timer.merge(timings)
+            submit()
+            yield pair_accepted(chunk, [to_dto(row) for row in rows], rejects)
+
+
+def map_chunk(
+    config_key: str, config: dict, raws: List[dict], timed: bool = False
+) -> Tuple[List[tuple], List[MappingReject], Optional[dict]]:
+    """
+    Worker entry point: maps a chunk into DTO tuples and rejects, plus the
+    chunk's stage timings when `timed`.
+    """
+    mapper = _worker_mappers.get(config_key)
+    if mapper is None:
+        mapper = _worker_mappers[config_key] = GenericJsonMapper(config)
+
+    timer = StageTimer() if timed else None
+    dtos, rejects = mapper.map_many(raws, timer)
+    return [to_row(dto) for dto in dtos], rejects, timer and timer.as_dict()
+
+
+def to_row(dto: BookingDTO) -> tuple:
+    row = tuple(getattr(dto, field) for field in DTO_FIELDS)
+    return tuple(v.value if isinstance(v, BookingStatus) else v for v in row)
+
+
+def to_dto(row: tuple) -> BookingDTO:
+    values = dict(zip(DTO_FIELDS, row))
+    # Validating is faster than pydantic's model_construct for this model
+    return BookingDTO(**values)
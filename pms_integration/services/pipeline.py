@@ -0,0 +1,139 @@
+import queue
+import threading
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from pms_integration.services.metrics import StageTimer
+
+_END = object()
+
+Stage = Callable[[Iterator[Any]], Iterator[Any]]
+
+
+class PipelineCancelled(Exception):
+    """Raised inside a stage when another stage of its pipeline has failed."""
+
+
+class Pipeline:
+    """
+    Runs a chain of iterator stages concurrently, each in its own thread,
+    connected by bounded queues, so a slow stage holds back the ones before
+    it (backpressure) instead of letting work pile up in memory.
+
+    Each stage is a function from an iterator of inputs to an iterator of
+    outputs; items are best passed in chunks to keep queue overhead low.
+    The sink consumes the last stage's outputs in the calling thread. When
+    any stage or the sink raises, the others are cancelled and `run` raises
+    that first error.
+
+    With a timer, the time each stage spends blocked on its queues is
+    recorded as `<stage>_wait`, with the items the stage produced (consumed,
+    for the sink) as its record count: the bottleneck stage is the one that
+    waits least.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 4,
+        timer: Optional[StageTimer] = None,
+        poll_interval: float = 0.1,
+    ):
+        self.queue_size = queue_size
+        self.timer = timer
+        self.poll_interval = poll_interval
+        self.stages: List[Tuple[str, Stage]] = []
+        self._cancelled = threading.Event()
+        self._errors: List[BaseException] = []
+
+    def add(self, name: str, stage: Stage) -> "Pipeline":
+        self.stages.append((name, stage))
+        return self
+
+    def run(self, source: Iterable[Any], sink: Tuple[str, Callable]) -> Any:
+        """
+        Feeds `source` through the stages into `sink` and returns the sink's
+        result. A pipeline runs once.
+        """
+        sink_name, consume = sink
+        queues = [queue.Queue(self.queue_size) for _ in self.stages]
+        inputs = [iter(source)] + [
+            self._drain(q, name) for q, (name, _) in zip(queues, self.stages[1:])
+        ]
+        threads = [
+            threading.Thread(
+                target=self._run_stage,
+                args=(name, stage, items, out),
+                name=f"pipeline-{name}",
+                daemon=True,
+            )
+            for (name, stage), items, out in zip(self.stages, inputs, queues)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            result = consume(self._drain(queues[-1], sink_name, count=True))
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            self._cancelled.set()
+            for thread in threads:
+                thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+        return result
+
+    def _run_stage(self, name: str, stage: Stage, items: Iterator, out: queue.Queue):
+        outputs = stage(items)
+        try:
+            for item in outputs:
+                self._put(out, item, name)
+            self._put(out, _END, name)
+        except PipelineCancelled:
+            pass
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            close = getattr(outputs, "close", None)
+            if close is not None:
+                close()
+
+    def _fail(self, error: BaseException) -> None:
+        if not isinstance(error, PipelineCancelled):
+            self._errors.append(error)
+        self._cancelled.set()
+
+    def _put(self, out: queue.Queue, item: Any, name: str) -> None:
+        start = perf_counter()
+        while True:
+            if self._cancelled.is_set():
+                raise PipelineCancelled
+            try:
+                out.put(item, timeout=self.poll_interval)
+                break
+            except queue.Full:
+                continue
+        self._waited(name, perf_counter() - start, int(item is not _END))
+
+    def _drain(
+        self, items: queue.Queue, name: str, count: bool = False
+    ) -> Iterator[Any]:
+        while True:
+            start = perf_counter()
+            while True:
+                if self._cancelled.is_set():
+                    raise PipelineCancelled
+                try:
+                    item = items.get(timeout=self.poll_interval)
+                    break
+                except queue.Empty:
+                    continue
+            self._waited(name, perf_counter() - start, count and item is not _END)
+            if item is _END:
+                return
+            yield item
+
+    def _waited(self, name: str, seconds: float, records: int) -> None:
+        if self.timer is not None:
+            self.timer.add(f"{name}_wait", seconds, records)
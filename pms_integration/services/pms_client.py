@@ -1,23 +1,109 @@
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, TextIO
 
 from pms_integration.exceptions import PMSConnectionError
 
+NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+
 
 class PMSClient:
     """
     Simulates an external PMS API by loading mock data from a JSON file.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, chunk_size: int = 64 * 1024):
         self.file_path = Path(file_path)
+        self.chunk_size = chunk_size
 
     def fetch_bookings(self) -> List[Dict]:
+        return list(self.iter_bookings())
+
+    def iter_bookings(self) -> Iterator[Dict]:
+        """
+        Yields reservations one at a time, so memory stays flat regardless of
+        the export size. Accepts a top-level JSON array or NDJSON.
+        """
         try:
-            with self.file_path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            # utf-8-sig: a byte order mark is dropped, also after seek(0)
+            with self.file_path.open("r", encoding="utf-8-sig") as f:
+                if self._is_ndjson(f):
+                    yield from self._iter_ndjson(f)
+                else:
+                    yield from self._iter_json_array(f)
         except FileNotFoundError:
             raise PMSConnectionError(f"Mock PMS data file not found: {self.file_path}")
         except json.JSONDecodeError as e:
             raise PMSConnectionError(f"Invalid JSON format in PMS file: {e}")
+
+    def _is_ndjson(self, f: TextIO) -> bool:
+        if self.file_path.suffix in NDJSON_SUFFIXES:
+            return True
+        # Decide on the first non-space character, however far in it is
+        head = ""
+        while not head:
+            chunk = f.read(self.chunk_size)
+            if not chunk:
+                break
+            head = chunk.lstrip()
+        f.seek(0)
+        return not head.startswith("[")
+
+    def _iter_ndjson(self, f: TextIO) -> Iterator[Dict]:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+    def _iter_json_array(self, f: TextIO) -> Iterator[Dict]:
+        decoder = json.JSONDecoder()
+        buffer, pos, eof = "", 0, False
+
+        def fill() -> bool:
+            nonlocal buffer, pos, eof
+            chunk = f.read(self.chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer, pos = buffer[pos:] + chunk, 0
+            return True
+
+        def next_char() -> Optional[str]:
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if not fill():
+                    return None
+
+        if next_char() != "[":
+            raise json.JSONDecodeError("Expected a top-level array", buffer, pos)
+        pos += 1
+
+        if next_char() == "]":
+            return
+
+        while True:
+            if next_char() is None:
+                raise json.JSONDecodeError("Unterminated array", buffer, pos)
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                complete = end < len(buffer) or eof
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if not complete:
+                fill()
+                continue
+
+            yield item
+            pos = end
+
+            sep = next_char()
+            if sep == "]":
+                return
+            if sep != ",":
+                raise json.JSONDecodeError("Expected ',' or ']'", buffer, pos)
+            pos += 1
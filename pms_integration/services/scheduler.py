@@ -0,0 +1,179 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from pms_integration.models.hotel import Hotel
+from pms_integration.models.sync_run import SyncRun
+
+
+@dataclass
+class HotelSchedule:
+    hotel: Hotel
+    vendor: str
+    interval: float
+    next_due: float = 0.0
+    last_duration: float = 0.0
+    failures: int = 0
+    syncs: int = 0
+
+
+class SyncScheduler:
+    """
+    Long-running per-hotel sync scheduler.
+
+    Hotels wait in a priority queue keyed on their next-due time. Due hotels
+    are started largest-first (by last sync duration), within `workers`
+    threads and a per-PMS-vendor concurrency cap.
+
+    After a sync the hotel's interval adapts to its change rate: it halves
+    when the sync wrote changes and doubles when it did not, within
+    [min_interval, max_interval], and is never shorter than `duration_factor`
+    times the sync's own duration. Failing hotels back off exponentially
+    (with jitter) from `min_interval` up to `max_backoff`.
+    """
+
+    def __init__(
+        self,
+        sync: Callable[[Hotel], SyncRun],
+        workers: int = 5,
+        vendor_limits: Optional[Dict[str, int]] = None,
+        default_vendor_limit: int = 5,
+        min_interval: float = 60.0,
+        max_interval: float = 3600.0,
+        max_backoff: float = 3600.0,
+        duration_factor: float = 4.0,
+        on_error: Optional[Callable[[Hotel, Exception], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.sync = sync
+        self.workers = workers
+        self.vendor_limits = vendor_limits or {}
+        self.default_vendor_limit = default_vendor_limit
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_backoff = max_backoff
+        self.duration_factor = duration_factor
+        self.on_error = on_error
+        self.clock = clock
+
+        self.schedules: Dict[int, HotelSchedule] = {}
+        self._queue: List[tuple] = []  # (next_due, seq, hotel_id)
+        self._ready: List[HotelSchedule] = []
+        self._seq = itertools.count()
+        self._active: Dict[str, int] = {}
+
+    def add(self, hotel: Hotel, last_duration: float = 0.0) -> None:
+        """Schedules `hotel`, due immediately."""
+        schedule = HotelSchedule(
+            hotel=hotel,
+            vendor=hotel.pms_config.name,
+            interval=self.min_interval,
+            next_due=self.clock(),
+            last_duration=last_duration,
+        )
+        self.schedules[hotel.id] = schedule
+        self._push(schedule)
+
+    def run(self, stop: threading.Event, max_syncs: Optional[int] = None) -> int:
+        """
+        Runs due syncs until `stop` is set (or `max_syncs` syncs have been
+        started), then waits for the running ones. Returns the syncs started.
+        """
+        started = 0
+        running: Dict[Future, HotelSchedule] = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while not stop.is_set():
+                slots = self.workers - len(running)
+                if max_syncs is not None:
+                    if started >= max_syncs:
+                        break
+                    slots = min(slots, max_syncs - started)
+
+                for schedule in self._take_due(slots):
+                    self._active[schedule.vendor] = (
+                        self._active.get(schedule.vendor, 0) + 1
+                    )
+                    running[executor.submit(self.sync, schedule.hotel)] = schedule
+                    started += 1
+
+                if running:
+                    done, _ = wait(
+                        running, timeout=self._wait_time(), return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        self._complete(running.pop(future), future)
+                else:
+                    stop.wait(self._wait_time())
+
+            for future in list(running):
+                future.exception()
+                self._complete(running.pop(future), future)
+        return started
+
+    def _push(self, schedule: HotelSchedule) -> None:
+        heapq.heappush(
+            self._queue, (schedule.next_due, next(self._seq), schedule.hotel.id)
+        )
+
+    def _take_due(self, slots: int) -> List[HotelSchedule]:
+        """Due hotels to start now, largest first, within vendor caps."""
+        now = self.clock()
+        while self._queue and self._queue[0][0] <= now:
+            _, _, hotel_id = heapq.heappop(self._queue)
+            if hotel_id in self.schedules:
+                self._ready.append(self.schedules[hotel_id])
+
+        self._ready.sort(key=lambda s: s.last_duration, reverse=True)
+        taken, waiting, active = [], [], dict(self._active)
+        for schedule in self._ready:
+            limit = self.vendor_limits.get(schedule.vendor, self.default_vendor_limit)
+            if len(taken) < slots and active.get(schedule.vendor, 0) < limit:
+                active[schedule.vendor] = active.get(schedule.vendor, 0) + 1
+                taken.append(schedule)
+            else:
+                waiting.append(schedule)
+        self._ready = waiting
+        return taken
+
+    def _wait_time(self) -> Optional[float]:
+        # Ready hotels are blocked on workers or vendor caps: wait for a sync
+        # to finish. Otherwise sleep until the next hotel is due.
+        if self._ready or not self._queue:
+            return None
+        return max(0.0, self._queue[0][0] - self.clock())
+
+    def _complete(self, schedule: HotelSchedule, future: Future) -> None:
+        self._active[schedule.vendor] -= 1
+        schedule.syncs += 1
+        error = future.exception()
+
+        if error is not None:
+            schedule.failures += 1
+            delay = self.backoff(schedule.failures)
+            if self.on_error:
+                self.on_error(schedule.hotel, error)
+        else:
+            run = future.result()
+            schedule.failures = 0
+            schedule.last_duration = run.duration_seconds
+            delay = self.next_interval(schedule, run)
+
+        schedule.next_due = self.clock() + delay
+        self._push(schedule)
+
+    def next_interval(self, schedule: HotelSchedule, run: SyncRun) -> float:
+        if run.inserted + run.updated:
+            interval = schedule.interval / 2
+        else:
+            interval = schedule.interval * 2
+        schedule.interval = min(self.max_interval, max(self.min_interval, interval))
+        return max(schedule.interval, self.duration_factor * run.duration_seconds)
+
+    def backoff(self, failures: int) -> float:
+        delay = min(self.max_backoff, self.min_interval * 2 ** (failures - 1))
+        return random.uniform(delay / 2, delay)
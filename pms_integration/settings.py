@@ -78,6 +78,20 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        "OPTIONS": {
+            # WAL lets readers (the API, change detection) run alongside the
+            # sync writer; IMMEDIATE takes the write lock when a transaction
+            # begins instead of failing to upgrade it mid-transaction
+            "init_command": (
+                "PRAGMA journal_mode=WAL;"
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA cache_size=-65536;"
+                "PRAGMA mmap_size=268435456"
+            ),
+            "transaction_mode": "IMMEDIATE",
+            "timeout": 20,
+        },
     }
 }
 
@@ -122,3 +136,20 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# Bookings API pagination
+
+BOOKINGS_PAGE_SIZE = 100
+
+BOOKINGS_MAX_PAGE_SIZE = 1000
+
+# Rows fetched per database round trip by the streaming bookings export
+
+BOOKINGS_EXPORT_CHUNK_SIZE = 2000
+
+# Cache alias and timeout (seconds) for serialized bookings API pages
+
+BOOKINGS_CACHE_ALIAS = "default"
+
+BOOKINGS_CACHE_TIMEOUT = 300
@@ -0,0 +1,48 @@
+"""Sync node processes for the multi-process lease test, on a file database."""
+
+import os
+import time
+
+
+def setup(db_path):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pms_integration.settings")
+    import django
+    from django.conf import settings
+
+    settings.DATABASES["default"]["NAME"] = db_path
+    django.setup()
+
+
+def create_hotels(db_path, count):
+    setup(db_path)
+    from django.core.management import call_command
+    from pms_integration.models.hotel import Hotel, PMSConfig
+
+    call_command("migrate", verbosity=0)
+    pms_config = PMSConfig.objects.create(
+        name="sample", version="v1", config_file_path="unused.json"
+    )
+    return [
+        Hotel.objects.create(name=f"Hotel {i}", pms_config=pms_config).id
+        for i in range(count)
+    ]
+
+
+def run_node(db_path, owner, hotel_ids, started_at, work_seconds):
+    """Syncs (sleeps on) each hotel it can lease; returns the hotels synced."""
+    setup(db_path)
+    from pms_integration.services.leases import LeaseManager
+
+    leases = LeaseManager(owner=owner, ttl=10).start()
+    synced = []
+    try:
+        for hotel_id in hotel_ids:
+            lease = leases.claim(hotel_id, claimed_after=started_at)
+            if lease is None:
+                continue
+            time.sleep(work_seconds)
+            synced.append(hotel_id)
+            leases.release(lease)
+    finally:
+        leases.close()
+    return synced
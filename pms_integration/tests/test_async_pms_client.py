@@ -0,0 +1,146 @@
+import asyncio
+import json
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from pms_integration.exceptions import PMSConnectionError
+from pms_integration.services.async_pms_client import AsyncPMSClient, HTTPSession
+
+MOCK_DATA_DIR = Path(__file__).resolve().parents[2] / "mock_data"
+RECORDS = [{"reservation": {"confirmationNumber": f"B{i:03}"}} for i in range(7)]
+
+
+class PagedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures_left = 0
+
+    def do_GET(self):
+        if PagedHandler.failures_left:
+            PagedHandler.failures_left -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        query = parse_qs(urlsplit(self.path).query)
+        offset = int(query.get("cursor", ["0"])[0])
+        limit = int(query["limit"][0])
+        page = RECORDS[offset : offset + limit]
+        next_offset = offset + limit
+        body = json.dumps(
+            {
+                "data": page,
+                "next_cursor": str(next_offset) if next_offset < len(RECORDS) else None,
+            }
+        ).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class NotModifiedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        # Kept alive, with neither Content-Length nor chunked encoding
+        self.send_response(304)
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class QuietFileHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def serve(handler):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def mock_data_server():
+    server = serve(partial(QuietFileHandler, directory=str(MOCK_DATA_DIR)))
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.fixture
+def paged_server():
+    server = serve(PagedHandler)
+    yield f"http://127.0.0.1:{server.server_port}/bookings"
+    server.shutdown()
+    PagedHandler.failures_left = 0
+
+
+def fetch(url, **kwargs):
+    async def run():
+        async with HTTPSession(timeout=5) as session:
+            client = AsyncPMSClient(url, session, **kwargs)
+            return [page async for page in client.iter_pages()]
+
+    return asyncio.run(run())
+
+
+def test_fetches_mock_data_file(mock_data_server):
+    pages = fetch(f"{mock_data_server}/mock_pms_bookings_payload.json")
+    expected = json.loads(
+        (MOCK_DATA_DIR / "mock_pms_bookings_payload.json").read_text()
+    )
+    assert pages == [expected]
+
+
+def test_follows_cursor_pages(paged_server):
+    pages = fetch(paged_server, page_size=3)
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [r for page in pages for r in page] == RECORDS
+
+
+def test_retries_transient_errors(paged_server):
+    PagedHandler.failures_left = 2
+    pages = fetch(paged_server, page_size=10, backoff=0.01)
+    assert pages == [RECORDS]
+
+
+def test_gives_up_after_max_retries(paged_server):
+    PagedHandler.failures_left = 5
+    with pytest.raises(PMSConnectionError):
+        fetch(paged_server, max_retries=1, backoff=0.01)
+
+
+def test_missing_resource_not_retried(mock_data_server):
+    with pytest.raises(PMSConnectionError, match="HTTP 404"):
+        fetch(f"{mock_data_server}/missing.json", backoff=10)
+
+
+def test_not_modified_response_has_no_body():
+    server = serve(NotModifiedHandler)
+    url = f"http://127.0.0.1:{server.server_port}/bookings"
+
+    async def run():
+        async with HTTPSession(timeout=2) as session:
+            responses = [await session.get(url) for _ in range(2)]
+            return responses, sum(map(len, session._idle.values()))
+
+    try:
+        responses, idle = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    assert [(r.status, r.body) for r in responses] == [(304, b""), (304, b"")]
+    assert idle == 1  # the connection was reused, not read until timeout
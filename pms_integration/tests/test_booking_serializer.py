@@ -0,0 +1,60 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from pms_integration.models.booking import Booking
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.serializers.booking_serializer import (
+    BookingSerializer,
+    FastBookingSerializer,
+)
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+AMOUNTS = ["0", "0.5", "120.50", "-10", "1E+2", "99999999.99", "0.005", "12.345"]
+NAMES = ["John Doe", 'Zoë "Z" Müller', "李雷", "Tab\tand\nnewline", "</script>"]
+
+
+@pytest.fixture
+def hotel(db):
+    pms_config = PMSConfig.objects.create(
+        name="sample", version="v1", config_file_path="pms_configs/sample.json"
+    )
+    hotel = Hotel.objects.create(name="Hotel Test", pms_config=pms_config)
+    Booking.objects.bulk_create(
+        Booking(
+            hotel=hotel,
+            booking_id=f"B{i:03}",
+            guest_name=NAMES[i % len(NAMES)],
+            check_in=date(1999, 12, 31) + timedelta(days=i * 37),
+            check_out=date(2000, 1, 2) + timedelta(days=i * 37),
+            status=["confirmed", "cancelled", "pending"][i % 3],
+            total_amount=Decimal(AMOUNTS[i % len(AMOUNTS)]),
+        )
+        for i in range(40)
+    )
+    return hotel
+
+
+def test_fast_serializer_output_is_byte_identical(hotel):
+    bookings = Booking.objects.filter(hotel=hotel).order_by("-updated_at", "-id")
+    fast = FastBookingSerializer()
+
+    expected = JSONRenderer().render(BookingSerializer(bookings, many=True).data)
+    actual = JSONRenderer().render(fast.serialize(fast.values(bookings)))
+
+    assert actual == expected
+
+
+def test_bookings_api_uses_fast_path(hotel):
+    cache.clear()
+    bookings = Booking.objects.filter(hotel=hotel).order_by("-updated_at", "-id")
+    response = APIClient().get(
+        reverse("booking-list"), {"hotel_id": hotel.id, "page_size": 25}
+    )
+
+    expected = BookingSerializer(bookings[:25], many=True).data
+    assert response.content == JSONRenderer().render(expected)
+    assert "Link" in response
@@ -0,0 +1,75 @@
+import pytest
+from pms_integration.models.booking import Booking
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.services.change_detector import ChangeDetector, content_hash
+from pms_integration.services.mapper import GenericJsonMapper
+
+CONFIG = {"field_mappings": {"booking_id": "$.reservation.confirmationNumber"}}
+
+
+def raw_booking(booking_id, status="CONFIRMED"):
+    return {
+        "reservation": {
+            "confirmationNumber": booking_id,
+            "reservationStatus": {"code": status},
+        }
+    }
+
+
+@pytest.fixture
+def hotel(db):
+    pms_config = PMSConfig.objects.create(
+        name="sample", version="v1", config_file_path="pms_configs/sample_pms_v1.json"
+    )
+    return Hotel.objects.create(name="Hotel Test", pms_config=pms_config)
+
+
+def store(hotel, detector, raw):
+    Booking.objects.create(
+        hotel=hotel,
+        booking_id=raw["reservation"]["confirmationNumber"],
+        guest_name="John Doe",
+        check_in="2025-07-05",
+        check_out="2025-07-07",
+        status="confirmed",
+        source_hash=content_hash(raw, detector.salt),
+    )
+
+
+def test_content_hash_is_key_order_independent():
+    assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+
+def test_skips_unchanged_records(hotel):
+    detector = ChangeDetector(hotel.id, GenericJsonMapper(CONFIG), batch_size=2)
+    store(hotel, detector, raw_booking("B001"))
+    store(hotel, detector, raw_booking("B002"))
+
+    raws = [
+        raw_booking("B001"),
+        raw_booking("B002", status="CANCELLED"),
+        raw_booking("B003"),
+    ]
+    changed = [(raw, exists) for raw, _, exists in detector.changed(raws)]
+
+    assert changed == [(raws[1], True), (raws[2], False)]
+    assert detector.skipped == 1
+
+
+def test_full_resync_passes_everything(hotel):
+    detector = ChangeDetector(hotel.id, GenericJsonMapper(CONFIG), skip_unchanged=False)
+    store(hotel, detector, raw_booking("B001"))
+
+    assert len(list(detector.changed([raw_booking("B001")]))) == 1
+    assert detector.skipped == 0
+
+
+def test_config_change_invalidates_hashes(hotel):
+    old = ChangeDetector(hotel.id, GenericJsonMapper(CONFIG))
+    store(hotel, old, raw_booking("B001"))
+
+    new_config = dict(CONFIG, status_mappings={"CONFIRMED": "confirmed"})
+    new = ChangeDetector(hotel.id, GenericJsonMapper(new_config))
+
+    assert len(list(new.changed([raw_booking("B001")]))) == 1
@@ -0,0 +1,58 @@
+import json
+import os
+
+import pytest
+from pms_integration.models.hotel import PMSConfig
+from pms_integration.services.config_registry import MapperRegistry
+
+from .mock_data.sample_config import CONFIG
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "pms.json"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    return path
+
+
+def test_mapper_shared_across_lookups(config_file):
+    registry = MapperRegistry()
+    pms_config = PMSConfig(id=1, config_file_path=str(config_file))
+
+    first = registry.get_mapper(pms_config)
+    second = registry.get_mapper(pms_config)
+
+    assert first is second
+    assert registry.stats()["hits"] == 1
+    assert registry.stats()["misses"] == 1
+
+
+def test_mapper_rebuilt_when_file_changes(config_file):
+    registry = MapperRegistry()
+    pms_config = PMSConfig(id=1, config_file_path=str(config_file))
+    first = registry.get_mapper(pms_config)
+
+    changed = dict(CONFIG, status_mappings={"CONFIRMED": "confirmed"})
+    config_file.write_text(json.dumps(changed), encoding="utf-8")
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    second = registry.get_mapper(pms_config)
+    assert second is not first
+    assert second.status_mappings == {"CONFIRMED": "confirmed"}
+
+
+def test_lru_eviction(config_file):
+    registry = MapperRegistry(max_entries=1)
+    registry.get_mapper(PMSConfig(id=1, config_file_path=str(config_file)))
+    registry.get_mapper(PMSConfig(id=2, config_file_path=str(config_file)))
+
+    stats = registry.stats()
+    assert stats["size"] == 1
+    assert stats["evictions"] == 1
+
+
+def test_missing_config_file(tmp_path):
+    registry = MapperRegistry()
+    with pytest.raises(FileNotFoundError):
+        registry.get_mapper(PMSConfig(id=1, config_file_path=str(tmp_path / "x")))
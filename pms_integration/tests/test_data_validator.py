@@ -0,0 +1,150 @@
+from datetime import date, datetime
+
+import jsonschema
+import pytest
+from pms_integration.exceptions import PMSBusinessRuleError, PMSDataValidationError
+from pms_integration.services.data_validator import DataValidator, date_parser
+
+RULES = {
+    "validation_rules": {
+        "required_fields": ["booking_id", "guest_name"],
+        "fields": {
+            "check_in": {"type": "date"},
+            "check_out": {"type": "date", "format": "ISO8601"},
+            "total_amount": {"type": "decimal", "min": 0, "max": 999999.99},
+            "status": {"type": "enum", "allowed": ["confirmed", "cancelled"]},
+            "guest_email": {"type": "email"},
+        },
+        "business_rules": {"max_booking_days": 30},
+    }
+}
+
+VALID = {
+    "booking_id": "B001",
+    "guest_name": "John Doe",
+    "check_in": "2025-07-05T14:00:00",
+    "check_out": "2025-07-07T10:00:00",
+    "total_amount": "200.00",
+    "status": "confirmed",
+    "guest_email": "john@example.com",
+}
+
+
+def errors_for(**overrides):
+    with pytest.raises(PMSBusinessRuleError) as exc_info:
+        DataValidator(RULES).validate_business_rules({**VALID, **overrides})
+    return str(exc_info.value).split("; ")
+
+
+def test_valid_record_passes():
+    assert DataValidator(RULES).validate_business_rules(dict(VALID)) == VALID
+
+
+def test_error_messages():
+    assert errors_for(booking_id="", guest_email="not-an-email") == [
+        "Required field 'booking_id' is missing or empty",
+        "Invalid email format: not-an-email",
+    ]
+    assert errors_for(total_amount="-1", status="pending") == [
+        "total_amount below minimum value",
+        "Invalid value for 'status': pending",
+    ]
+    assert errors_for(total_amount="1000000", check_in="07/05/2025") == [
+        "Invalid date format for field 'check_in': 07/05/2025",
+        "total_amount exceeds maximum value",
+    ]
+    assert errors_for(total_amount=None, status=["confirmed"]) == [
+        "total_amount must be a valid decimal",
+        "Invalid value for 'status': ['confirmed']",
+    ]
+    assert errors_for(guest_email=123) == ["Invalid email format: 123"]
+
+
+def test_stay_rules():
+    assert errors_for(check_out="2025-07-01T10:00:00") == [
+        "Check-out date must be after check-in date"
+    ]
+    assert errors_for(check_out="2025-09-01T10:00:00") == [
+        "Booking duration exceeds 30 days"
+    ]
+
+
+def test_parsed_datetimes_accepted():
+    # Fields mapped with the `parse_date` transform
+    check_in = datetime(2025, 7, 5, 14)
+    valid = {**VALID, "check_in": check_in, "check_out": datetime(2025, 7, 7, 10)}
+    assert DataValidator(RULES).validate_business_rules(dict(valid)) == valid
+
+    assert errors_for(check_in=check_in, check_out=datetime(2025, 7, 1, 10)) == [
+        "Check-out date must be after check-in date"
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2025-07-05T14:00:00",
+        "2025-7-5T1:2:3",
+        "2025-02-30T00:00:00",
+        "2025-07-05T14:00:60",
+        "2025-07-05T14:00:00Z",
+        "2025-07-05",
+        "２０２５-07-05T14:00:00",
+        "",
+        None,
+    ],
+)
+def test_iso_fast_path_matches_strptime(value):
+    try:
+        expected = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S").date()
+    except (TypeError, ValueError):
+        expected = None
+    assert date_parser("ISO8601")(value) == expected
+
+
+def test_other_date_formats():
+    assert date_parser("DD/MM/YYYY")("07/05/2025") == date(2025, 5, 7)
+    assert date_parser("YYYY-MM-DD")("2025-05-07") == date(2025, 5, 7)
+    assert date_parser("unknown")("2025-05-07") is None
+
+
+SCHEMA = {
+    "type": "object",
+    "required": ["reservation"],
+    "properties": {
+        "reservation": {
+            "type": "object",
+            "required": ["confirmationNumber"],
+            "properties": {"confirmationNumber": {"type": "string"}},
+        }
+    },
+}
+
+
+def test_raw_schema_error_matches_jsonschema():
+    raw = {"reservation": {"confirmationNumber": 123}}
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(instance=raw, schema=SCHEMA)
+
+    with pytest.raises(PMSDataValidationError) as exc_info:
+        DataValidator({"raw_data_schema": SCHEMA}).validate_raw_schema(raw)
+    assert str(exc_info.value) == f"Raw schema validation failed: {expected.value}"
+
+
+def test_raw_schema_batch_returns_errors_per_index():
+    records = [
+        {"reservation": {"confirmationNumber": "B001"}},
+        {},
+        {"reservation": {"confirmationNumber": "B003"}},
+        {"reservation": {}},
+    ]
+    errors = DataValidator({"raw_data_schema": SCHEMA}).validate_raw_schema_many(
+        records
+    )
+    assert sorted(errors) == [1, 3]
+    assert all(isinstance(e, PMSDataValidationError) for e in errors.values())
+
+
+def test_invalid_raw_schema_rejected_up_front():
+    with pytest.raises(PMSDataValidationError):
+        DataValidator({"raw_data_schema": {"type": "not-a-type"}})
@@ -0,0 +1,91 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from django.db import IntegrityError
+from pms_integration.dtos.booking_dto import BookingDTO
+from pms_integration.models.booking import Booking
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.services.db_writer import DBWriter
+from pms_integration.services.ingestor import BookingIngestor
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def pms_config():
+    return PMSConfig.objects.create(
+        name="sample", version="v1", config_file_path="pms_configs/sample_pms_v1.json"
+    )
+
+
+def make_dto(booking_id, guest_name="John Doe"):
+    check_in = datetime(2025, 7, 5, 14)
+    return BookingDTO(
+        booking_id=booking_id,
+        guest_name=guest_name,
+        check_in=check_in,
+        check_out=check_in + timedelta(days=2),
+        status="confirmed",
+    )
+
+
+def test_writes_from_concurrent_workers_are_grouped(pms_config):
+    hotels = [
+        Hotel.objects.create(name=f"Hotel {i}", pms_config=pms_config) for i in range(4)
+    ]
+    holding, release = threading.Event(), threading.Event()
+
+    def hold():
+        holding.set()
+        release.wait()
+
+    with DBWriter() as writer:
+        # Hold the writer so the workers' batches queue up behind it
+        blocker = writer.submit(hold)
+        holding.wait(5)
+
+        def sync(hotel):
+            ingestor = BookingIngestor(hotel.id, writer=writer)
+            for batch in range(3):
+                dtos = [make_dto(f"B{batch}{i:02}") for i in range(10)]
+                assert ingestor.save_bookings(dtos) == (10, [])
+
+        workers = [threading.Thread(target=sync, args=(h,)) for h in hotels]
+        try:
+            for worker in workers:
+                worker.start()
+            while writer.depth < len(hotels):
+                threading.Event().wait(0.01)
+        finally:
+            release.set()
+        for worker in workers:
+            worker.join()
+        blocker.result()
+
+    for hotel in hotels:
+        assert Booking.objects.filter(hotel=hotel).count() == 30
+    stats = writer.stats()
+    assert stats["jobs"] == 13
+    assert stats["groups"] < stats["jobs"]
+    assert stats["max_depth"] >= len(hotels)
+    assert stats["depth"] == 0
+
+
+def test_failing_job_only_rolls_back_itself(pms_config):
+    def create_hotel(name):
+        return Hotel.objects.create(name=name, pms_config=pms_config).name
+
+    def fail():
+        Hotel.objects.create(name="Rolled back", pms_config=pms_config)
+        raise IntegrityError("constraint failed")
+
+    with DBWriter() as writer:
+        futures = [writer.submit(create_hotel, "A"), writer.submit(fail)]
+        futures.append(writer.submit(create_hotel, "B"))
+
+    assert futures[0].result() == "A"
+    with pytest.raises(IntegrityError):
+        futures[1].result()
+    assert futures[2].result() == "B"
+    assert sorted(Hotel.objects.values_list("name", flat=True)) == ["A", "B"]
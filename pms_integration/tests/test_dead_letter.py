@@ -0,0 +1,154 @@
+import json
+import os
+
+import pytest
+from django.core.management import call_command
+from pms_integration.models.booking import Booking
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.models.rejected_booking import RejectedBooking
+from pms_integration.services.change_detector import content_hash
+from pms_integration.services.dead_letter import DeadLetterStore, config_version
+from pms_integration.services.ingestor import BookingIngestor
+from pms_integration.services.mapper import GenericJsonMapper, MappingReject
+from pms_integration.services.metrics import StageTimer
+
+CONFIG = {
+    "field_mappings": {
+        "booking_id": "$.id",
+        "guest_name": "$.guest",
+        "check_in": {"path": "$.start", "transform": "parse_date"},
+        "check_out": {"path": "$.end", "transform": "parse_date"},
+        "status": {"path": "$.status", "transform": "map_status"},
+    },
+    "status_mappings": {"CONFIRMED": "confirmed"},
+}
+FIXED_CONFIG = dict(
+    CONFIG, status_mappings={"CONFIRMED": "confirmed", "PENDING": "pending"}
+)
+
+
+def raw_booking(booking_id, status="PENDING"):
+    return {
+        "id": booking_id,
+        "guest": f"Guest {booking_id}",
+        "start": "2025-07-05T14:00:00",
+        "end": "2025-07-07T10:00:00",
+        "status": status,
+    }
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "pms.json"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def hotel(db, config_file):
+    pms_config = PMSConfig.objects.create(
+        name="sample", version="v1", config_file_path=str(config_file)
+    )
+    return Hotel.objects.create(name="Hotel Test", pms_config=pms_config)
+
+
+def dead_letter(hotel, raws, config=CONFIG):
+    mapper = GenericJsonMapper(config)
+    store = DeadLetterStore(hotel.id, config_version(config))
+    _, rejects = mapper.map_many(raws)
+    for reject in rejects:
+        store.add(raws[reject.index], reject)
+    store.flush()
+    return rejects
+
+
+def test_rejects_stored_once_per_payload(hotel):
+    raws = [raw_booking("B1"), raw_booking("B2", "CONFIRMED")]
+
+    dead_letter(hotel, raws)
+    dead_letter(hotel, raws)
+
+    reject = RejectedBooking.objects.get()
+    assert reject.booking_id == "B1"
+    assert reject.raw_data == raws[0]
+    assert reject.payload_hash == content_hash(raws[0])
+    assert reject.config_version == config_version(CONFIG)
+    assert reject.error == "PMSMappingError"
+
+
+def test_duplicate_rejects_in_one_batch_write_one_row(hotel):
+    # PostgreSQL rejects an upsert that touches the same row twice
+    raw = raw_booking("B1")
+    timer = StageTimer()
+    store = DeadLetterStore(hotel.id, config_version(CONFIG), timer=timer)
+    store.add(raw, MappingReject(0, "B1", "PMSMappingError", "first"))
+    store.add(raw, MappingReject(1, "B1", "PMSMappingError", "second"))
+    store.flush()
+
+    assert timer.as_dict()["dead_letter"]["records"] == 1
+    reject = RejectedBooking.objects.get()
+    assert reject.payload_hash == content_hash(raw)
+    assert reject.message == "second"
+
+
+def test_replay_only_runs_after_config_change(hotel):
+    dead_letter(hotel, [raw_booking("B1"), raw_booking("B2")])
+    store = DeadLetterStore(hotel.id)
+    ingestor = BookingIngestor(hotel.id)
+
+    counts = store.replay(GenericJsonMapper(CONFIG), ingestor)
+    assert counts == {"replayed": 0, "superseded": 0, "rejected": 0, "failed": 0}
+
+    counts = store.replay(GenericJsonMapper(FIXED_CONFIG), ingestor)
+    assert counts == {"replayed": 2, "superseded": 0, "rejected": 0, "failed": 0}
+    assert not RejectedBooking.objects.exists()
+
+    booking = Booking.objects.get(booking_id="B1")
+    assert booking.status == "pending"
+    # The next sync sees the record as unchanged
+    assert booking.source_hash == content_hash(
+        raw_booking("B1"), config_version(FIXED_CONFIG)
+    )
+
+
+def test_replay_keeps_records_that_still_fail(hotel):
+    dead_letter(hotel, [raw_booking("B1"), raw_booking("B2", "UNKNOWN")])
+
+    counts = DeadLetterStore(hotel.id).replay(
+        GenericJsonMapper(FIXED_CONFIG), BookingIngestor(hotel.id)
+    )
+
+    assert counts == {"replayed": 1, "superseded": 0, "rejected": 1, "failed": 0}
+    reject = RejectedBooking.objects.get()
+    assert reject.booking_id == "B2"
+    assert reject.config_version == config_version(FIXED_CONFIG)
+
+
+def test_replay_drops_superseded_records(hotel):
+    dead_letter(hotel, [raw_booking("B1")])
+    # A later sync ingested a newer version of the booking
+    mapper = GenericJsonMapper(CONFIG)
+    BookingIngestor(hotel.id).save_bookings(
+        [mapper.map(raw_booking("B1", "CONFIRMED"))]
+    )
+
+    counts = DeadLetterStore(hotel.id).replay(
+        GenericJsonMapper(FIXED_CONFIG), BookingIngestor(hotel.id)
+    )
+
+    assert counts["superseded"] == 1
+    assert Booking.objects.get(booking_id="B1").status == "confirmed"
+    assert not RejectedBooking.objects.exists()
+
+
+def test_replay_command_uses_current_config(hotel, config_file, capsys):
+    dead_letter(hotel, [raw_booking("B1"), raw_booking("B2")])
+    config_file.write_text(json.dumps(FIXED_CONFIG), encoding="utf-8")
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    call_command("replay_rejected_bookings")
+
+    assert f"[Hotel {hotel.id}] Replayed: 2" in capsys.readouterr().out
+    assert Booking.objects.filter(hotel=hotel).count() == 2
+    assert not RejectedBooking.objects.exists()
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+import pytest
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.models.sync_state import get_account_watermark, set_watermark
+from pms_integration.services.fetch_coalescer import FetchCoalescer, partition
+from pms_integration.services.mapper import GenericJsonMapper
+
+CONFIG = {
+    "property_key": "$.property.code",
+    "field_mappings": {"booking_id": "$.id"},
+}
+
+
+def records():
+    return [{"id": f"B{i}", "property": {"code": f"P{i % 3}"}} for i in range(9)]
+
+
+class CountingLoader:
+    def __init__(self, delay=0.0, error=None):
+        self.calls = 0
+        self.delay = delay
+        self.error = error
+        self.started = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        threading.Event().wait(self.delay)
+        if self.error:
+            raise self.error
+        return records()
+
+
+def test_concurrent_fetches_share_one_load():
+    fetcher = FetchCoalescer()
+    load = CountingLoader(delay=0.1)
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(fetcher.fetch("src", load)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert load.calls == 1
+    assert all(result == results[0] for result in results)
+    assert results[0][0] is results[1][0]
+    assert fetcher.fetch("src", load) == results[0]  # cached for the run
+    assert fetcher.stats() == {"loads": 1, "shared": 5}
+
+
+def test_failed_loads_are_not_cached():
+    fetcher = FetchCoalescer()
+    with pytest.raises(ConnectionError):
+        fetcher.fetch("src", CountingLoader(error=ConnectionError("down")))
+
+    load = CountingLoader()
+    payload, _ = fetcher.fetch("src", load)
+    assert len(payload) == 9
+    assert load.calls == 1
+
+
+def test_cache_expires_after_ttl():
+    now = [0.0]
+    fetcher = FetchCoalescer(ttl=60, clock=lambda: now[0])
+    load = CountingLoader()
+
+    fetcher.fetch("src", load)
+    now[0] = 30
+    fetcher.fetch("src", load)
+    now[0] = 61
+    fetcher.fetch("src", load)
+
+    assert load.calls == 2
+
+
+def test_cached_fetch_reports_when_it_was_loaded():
+    fetcher = FetchCoalescer()
+    before = datetime.now(timezone.utc)
+    _, fetched_at = fetcher.fetch("src", CountingLoader())
+
+    _, cached_at = fetcher.fetch("src", CountingLoader())
+
+    assert before <= fetched_at <= datetime.now(timezone.utc)
+    assert cached_at == fetched_at
+
+
+def test_partition_splits_stream_by_property():
+    mapper = GenericJsonMapper(CONFIG)
+
+    partitions = partition(iter(records()), mapper.extract_property_id)
+    kept = partition(iter(records()), mapper.extract_property_id, keep={"P1"})
+
+    assert [r["id"] for r in partitions["P1"]] == ["B1", "B4", "B7"]
+    assert list(kept) == ["P1"]
+    assert kept["P1"] == partitions["P1"]
+
+
+def test_async_fetches_share_one_load():
+    fetcher = FetchCoalescer()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return records()
+
+    async def main():
+        return await asyncio.gather(*(fetcher.afetch("src", load) for _ in range(4)))
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert all(result[0] is results[0][0] for result in results)
+    assert len({fetched_at for _, fetched_at in results}) == 1
+
+
+@pytest.mark.django_db
+def test_account_watermark_is_oldest_of_routed_hotels():
+    pms_config = PMSConfig.objects.create(
+        name="chain", version="v1", config_file_path="pms_configs/chain.json"
+    )
+    hotels = [
+        Hotel.objects.create(
+            name=f"Hotel {i}", pms_config=pms_config, pms_property_id=f"P{i}"
+        )
+        for i in range(2)
+    ]
+    Hotel.objects.create(name="Unrouted", pms_config=pms_config)
+
+    set_watermark(hotels[0].id, datetime(2025, 7, 2, tzinfo=timezone.utc))
+    assert get_account_watermark(pms_config.id) is None  # hotel 1 never synced
+
+    set_watermark(hotels[1].id, datetime(2025, 7, 1, tzinfo=timezone.utc))
+    assert get_account_watermark(pms_config.id) == datetime(
+        2025, 7, 1, tzinfo=timezone.utc
+    )
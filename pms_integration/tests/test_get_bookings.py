@@ -1,8 +1,16 @@
-from datetime import datetime, timedelta
+import json
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from urllib.parse import parse_qs, urlsplit
 
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
+from pms_integration.dtos.booking_dto import BookingDTO
 from pms_integration.models.booking import Booking
-from pms_integration.models.hotel import Hotel
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.serializers.booking_serializer import BookingSerializer
+from pms_integration.services.ingestor import BookingIngestor
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -37,3 +45,170 @@ class BookingAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 2)
         self.assertEqual(response.data[0]["booking_id"], "B001")
+
+
+class BookingListPaginationTestCase(APITestCase):
+    def setUp(self):
+        pms_config = PMSConfig.objects.create(
+            name="sample", version="v1", config_file_path="pms_configs/sample.json"
+        )
+        self.hotel = Hotel.objects.create(name="Hotel Test", pms_config=pms_config)
+        statuses = ["confirmed", "cancelled", "pending"]
+        for i in range(7):
+            Booking.objects.create(
+                booking_id=f"B{i:03}",
+                hotel=self.hotel,
+                guest_name="John Doe",
+                check_in=date(2025, 7, 1) + timedelta(days=i),
+                check_out=date(2025, 7, 3) + timedelta(days=i),
+                status=statuses[i % 3],
+            )
+        self.url = reverse("booking-list")
+        cache.clear()
+
+    def get(self, **params):
+        return self.client.get(self.url, {"hotel_id": self.hotel.id, **params})
+
+    def test_pages_follow_cursor(self):
+        seen, params = [], {"page_size": 3}
+        while True:
+            response = self.get(**params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen += [row["booking_id"] for row in response.data]
+            if "Link" not in response:
+                break
+            next_url = response["Link"].split(";")[0].strip("<>")
+            cursor = parse_qs(urlsplit(next_url).query)["cursor"][0]
+            params = {"page_size": 3, "cursor": cursor}
+
+        self.assertEqual(seen, [f"B{i:03}" for i in reversed(range(7))])
+
+    @override_settings(ALLOWED_HOSTS=["a.example", "b.example"])
+    def test_cached_page_links_to_requesting_host(self):
+        for host in ("a.example", "b.example"):
+            response = self.client.get(
+                self.url, {"hotel_id": self.hotel.id, "page_size": 3}, HTTP_HOST=host
+            )
+            self.assertTrue(response["Link"].startswith(f"<http://{host}/"))
+
+    def test_filters(self):
+        response = self.get(status="cancelled")
+        self.assertEqual([r["booking_id"] for r in response.data], ["B004", "B001"])
+
+        response = self.get(check_in_from="2025-07-03", check_out_to="2025-07-06")
+        self.assertEqual([r["booking_id"] for r in response.data], ["B003", "B002"])
+
+    def test_invalid_params(self):
+        self.assertEqual(self.get(status="bogus").status_code, 400)
+        self.assertEqual(self.get(cursor="not-a-cursor").status_code, 400)
+        self.assertEqual(self.get(page_size=0).status_code, 400)
+
+
+class BookingConditionalGetTestCase(APITestCase):
+    def setUp(self):
+        pms_config = PMSConfig.objects.create(
+            name="sample", version="v1", config_file_path="pms_configs/sample.json"
+        )
+        self.hotel = Hotel.objects.create(name="Hotel Test", pms_config=pms_config)
+        self.ingestor = BookingIngestor(self.hotel.id)
+        self.ingestor.save_bookings([self.dto("B001")])
+        self.url = reverse("booking-list")
+        cache.clear()
+
+    @staticmethod
+    def dto(booking_id, status="confirmed"):
+        return BookingDTO(
+            booking_id=booking_id,
+            guest_name="John Doe",
+            check_in=datetime(2025, 7, 5),
+            check_out=datetime(2025, 7, 7),
+            status=status,
+        )
+
+    def get(self, **headers):
+        return self.client.get(self.url, {"hotel_id": self.hotel.id}, headers=headers)
+
+    def test_not_modified_until_next_sync(self):
+        response = self.get()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+        self.assertIn("Last-Modified", response)
+
+        response = self.get(if_none_match=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.ingestor.save_bookings([self.dto("B001", status="cancelled")])
+        response = self.get(if_none_match=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data[0]["status"], "cancelled")
+
+    def test_serialized_page_cached_per_version(self):
+        self.get()
+        with self.assertNumQueries(3):  # hotel + data version + last modified
+            response = self.get()
+        self.assertEqual([r["booking_id"] for r in response.data], ["B001"])
+
+    def test_unknown_hotel_is_not_found_despite_etag(self):
+        response = self.client.get(
+            self.url, {"hotel_id": 999}, headers={"if_none_match": '"999-0"'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class BookingExportTestCase(APITestCase):
+    def setUp(self):
+        pms_config = PMSConfig.objects.create(
+            name="sample", version="v1", config_file_path="pms_configs/sample.json"
+        )
+        self.hotel = Hotel.objects.create(name="Hotel Test", pms_config=pms_config)
+        for i in range(5):
+            Booking.objects.create(
+                booking_id=f"B{i:03}",
+                hotel=self.hotel,
+                guest_name='Zoë "Z" Müller' if i == 0 else "John Doe",
+                check_in=date(2025, 7, 1) + timedelta(days=i),
+                check_out=date(2025, 7, 3) + timedelta(days=i),
+                status="cancelled" if i % 2 else "confirmed",
+                total_amount=Decimal("120.5") * i,
+            )
+        self.url = reverse("booking-export")
+
+    def get(self, **params):
+        return self.client.get(self.url, {"hotel_id": self.hotel.id, **params})
+
+    def expected(self, bookings):
+        return json.loads(
+            json.dumps(
+                BookingSerializer(
+                    bookings.order_by("-updated_at", "-id"), many=True
+                ).data
+            )
+        )
+
+    @override_settings(BOOKINGS_EXPORT_CHUNK_SIZE=2)
+    def test_json_matches_serializer(self):
+        response = self.get()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        body = b"".join(response.streaming_content)
+        self.assertEqual(json.loads(body), self.expected(Booking.objects.all()))
+
+    @override_settings(BOOKINGS_EXPORT_CHUNK_SIZE=2)
+    def test_ndjson_filtered(self):
+        response = self.get(format="ndjson", status="cancelled")
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            self.expected(Booking.objects.filter(status="cancelled")),
+        )
+
+    def test_empty_export(self):
+        response = self.get(status="pending")
+        self.assertEqual(b"".join(response.streaming_content), b"[]")
+
+    def test_invalid_params(self):
+        self.assertEqual(self.get(format="xml").status_code, 400)
+        self.assertEqual(self.get(status="bogus").status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"hotel_id": 999}).status_code, 404)
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from pms_integration.dtos.booking_dto import BookingDTO
+from pms_integration.models.booking import Booking
+from pms_integration.models.guest import Guest
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.models.room import Room
+from pms_integration.services.identity_cache import IdentityCache
+from pms_integration.services.ingestor import BookingIngestor
+
+
+@pytest.fixture
+def hotel(db):
+    pms_config = PMSConfig.objects.create(
+        name="sample", version="v1", config_file_path="pms_configs/sample_pms_v1.json"
+    )
+    return Hotel.objects.create(name="Hotel Test", pms_config=pms_config)
+
+
+def make_dto(booking_id, guest_name="John Doe", room_type="STD", status="confirmed"):
+    check_in = datetime(2025, 7, 5, 14)
+    return BookingDTO(
+        booking_id=booking_id,
+        guest_name=guest_name,
+        room_type=room_type,
+        check_in=check_in,
+        check_out=check_in + timedelta(days=2),
+        total_amount=Decimal("200.00"),
+        status=status,
+    )
+
+
+def test_save_bookings_bulk_upsert(hotel, django_assert_max_num_queries):
+    dtos = [make_dto(f"B{i:03}", guest_name=f"Guest {i % 3}") for i in range(10)]
+
+    # Includes the two identity cache warm-up queries
+    with django_assert_max_num_queries(16):
+        saved, failed = BookingIngestor(hotel.id).save_bookings(dtos)
+
+    assert (saved, failed) == (10, [])
+    assert Booking.objects.filter(hotel=hotel).count() == 10
+    assert Guest.objects.count() == 3
+    assert Room.objects.filter(hotel=hotel).count() == 1
+
+
+def test_save_bookings_updates_existing(hotel):
+    ingestor = BookingIngestor(hotel.id)
+    ingestor.save_bookings([make_dto("B001")])
+    ingestor.save_bookings([make_dto("B001", status="cancelled", room_type="DLX")])
+
+    booking = Booking.objects.get(hotel=hotel, booking_id="B001")
+    assert booking.status == "cancelled"
+    assert booking.room.room_type == "DLX"
+    assert booking.guest_name == "John Doe"
+
+
+def test_save_bookings_reports_per_record_errors(hotel):
+    dtos = [make_dto("B001"), make_dto("B002")]
+    dtos[1].guest_name = None  # violates NOT NULL on write
+
+    saved, failed = BookingIngestor(hotel.id).save_bookings(dtos)
+
+    assert saved == 1
+    assert [dto.booking_id for dto, _ in failed] == ["B002"]
+
+
+def test_identity_cache_skips_guest_and_room_queries(
+    hotel, django_assert_max_num_queries
+):
+    dtos = [make_dto(f"B{i:03}", guest_name=f"Guest {i % 3}") for i in range(10)]
+    BookingIngestor(hotel.id).save_bookings(dtos)
+
+    # A later sync warms the cache from the hotel's bookings and rooms
+    ingestor = BookingIngestor(hotel.id)
+    with django_assert_max_num_queries(2) as warm_up:
+        ingestor.identities.warm()
+    with django_assert_max_num_queries(10) as captured:
+        saved, _ = ingestor.save_bookings(dtos + [make_dto("B100", "Guest 1")])
+
+    assert saved == 11
+    assert len(warm_up.captured_queries) == 2
+    tables = ("pms_integration_guest", "pms_integration_room")
+    assert not [
+        q for q in captured.captured_queries if any(t in q["sql"] for t in tables)
+    ]
+    assert ingestor.identities.misses == 0
+
+
+def test_identity_cache_evicts_least_recently_used_guest():
+    cache = IdentityCache(hotel_id=1, max_guests=2)
+    cache._warmed = True
+    cache.add_guests({("A", None): 1, ("B", None): 2})
+    cache.get_guests([("A", None)])
+    cache.add_guests({("C", None): 3})
+
+    found, missing = cache.get_guests([("A", None), ("B", None), ("C", None)])
+    assert found == {("A", None): 1, ("C", None): 3}
+    assert missing == {("B", None)}
+
+
+def test_failed_write_does_not_cache_rolled_back_ids(hotel):
+    ingestor = BookingIngestor(hotel.id)
+    dtos = [make_dto("B001", room_type="DLX"), make_dto("B002", room_type="DLX")]
+    dtos[1].guest_name = None  # batch write fails and rolls back its new room
+
+    saved, failed = ingestor.save_bookings(dtos)
+    assert (saved, len(failed)) == (1, 1)
+
+    # No id from the rolled back transaction is reused
+    saved, failed = ingestor.save_bookings([make_dto("B003", room_type="DLX")])
+    assert (saved, failed) == (1, [])
+    assert Booking.objects.get(booking_id="B003").room.room_type == "DLX"
@@ -1,7 +1,12 @@
+import json
+from datetime import date
+from decimal import Decimal
+
 import pytest
 from pms_integration.exceptions import (
     PMSBusinessRuleError,
     PMSDataValidationError,
+    PMSIntegrationError,
     PMSMappingError,
 )
 from pms_integration.services.mapper import GenericJsonMapper
@@ -59,3 +64,148 @@ def test_invalid_business_rules():
     msg = str(exc_info.value)
     assert "Check-out date must be after check-in date" in msg
     assert "Invalid value for 'status'" in msg
+
+
+def test_simple_paths_match_jsonpath():
+    from jsonpath_ng import parse as jsonpath_parse
+    from pms_integration.services.mapper import compile_path
+
+    paths = [
+        "$.reservation.confirmationNumber",
+        "$.reservation.roomStay.timeSpan.start",
+        "$.reservation.missing.key",
+        "$.guest.profile.firstName.nested",
+    ]
+    for path in paths:
+        found = jsonpath_parse(path).find(VALID_RAW_PAYLOAD)
+        expected = found[0].value if found else None
+        assert compile_path(path)(VALID_RAW_PAYLOAD) == expected
+
+
+def test_field_mappings_compiled_once():
+    config = {
+        "field_mappings": {
+            "booking_id": "$.reservation.confirmationNumber",
+            "guest_name": {
+                "template": "{first} {last}",
+                "fields": {
+                    "first": "$.guest.profile.firstName",
+                    "last": "$.guest.profile.lastName",
+                },
+            },
+            "check_in": {
+                "path": "$.reservation.roomStay.timeSpan.start",
+                "transform": "parse_date",
+            },
+        }
+    }
+    mapper = GenericJsonMapper(config)
+    assert [field.name for field in mapper.plan] == [
+        "booking_id",
+        "guest_name",
+        "check_in",
+    ]
+
+    raw = {
+        "reservation": {
+            "confirmationNumber": "ABC123",
+            "roomStay": {"timeSpan": {"start": "2025-07-01T14:00:00"}},
+        },
+        "guest": {"profile": {"firstName": "John", "lastName": "Doe"}},
+    }
+    mapped = mapper._map_fields(raw)
+    assert mapped["booking_id"] == "ABC123"
+    assert mapped["guest_name"] == "John Doe"
+    assert mapped["check_in"].isoformat() == "2025-07-01T14:00:00"
+
+
+def test_invalid_mapping_config_rejected_on_init():
+    with pytest.raises(PMSMappingError):
+        GenericJsonMapper({"field_mappings": {"booking_id": {"unknown": "x"}}})
+
+
+def test_map_many_collects_rejects():
+    mapper = GenericJsonMapper(
+        {
+            "field_mappings": {
+                "booking_id": "$.id",
+                "guest_name": "$.guest",
+                "check_in": {"path": "$.start", "transform": "parse_date"},
+                "check_out": {"path": "$.end", "transform": "parse_date"},
+                "status": {"path": "$.status", "transform": "map_status"},
+            },
+            "status_mappings": {"CONFIRMED": "confirmed"},
+            "raw_data_schema": {"type": "object", "required": ["id"]},
+        }
+    )
+    stay = {"start": "2025-07-01T14:00:00", "end": "2025-07-03T10:00:00"}
+    raws = [
+        {"id": "A1", "guest": "Ann", "status": "CONFIRMED", **stay},
+        {"guest": "No Id", "status": "CONFIRMED", **stay},
+        {"id": "A3", "guest": "Bob", "status": "CONFIRMED", **stay, "end": "x"},
+        {"id": "A4", "guest": "Cy", "status": "CONFIRMED", **stay},
+    ]
+
+    dtos, rejects = mapper.map_many(raws)
+
+    assert [dto.booking_id for dto in dtos] == ["A1", "A4"]
+    assert [(r.index, r.booking_id, r.error) for r in rejects] == [
+        (1, None, "PMSDataValidationError"),
+        (2, "A3", "PMSMappingError"),
+    ]
+    for reject in rejects:
+        with pytest.raises(PMSIntegrationError) as exc_info:
+            mapper.map(raws[reject.index])
+        assert str(exc_info.value) == reject.message
+
+
+def test_map_many_rejects_record_that_fails_unexpectedly():
+    mapper = GenericJsonMapper(
+        {
+            "field_mappings": {
+                "booking_id": "$.id",
+                "guest_name": "$.guest",
+                "guest_email": "$.email",
+                "check_in": {"path": "$.start", "transform": "parse_date"},
+                "check_out": {"path": "$.end", "transform": "parse_date"},
+                "status": {"path": "$.status", "transform": "map_status"},
+            },
+            "status_mappings": {"CONFIRMED": "confirmed"},
+            "validation_rules": {"fields": {"guest_email": {"type": "email"}}},
+        }
+    )
+    stay = {"start": "2025-07-01T14:00:00", "end": "2025-07-03T10:00:00"}
+    raws = [
+        {"id": "A1", "guest": "Ann", "status": "CONFIRMED", **stay},
+        {"id": "A2", "guest": "Bob", "status": "CONFIRMED", **stay, "email": 123},
+        {"id": "A3", "guest": "Cy", "status": "CONFIRMED", **stay},
+    ]
+
+    dtos, rejects = mapper.map_many(raws)
+
+    assert [dto.booking_id for dto in dtos] == ["A1", "A3"]
+    assert [(r.index, r.booking_id, r.error) for r in rejects] == [
+        (1, "A2", "PMSBusinessRuleError")
+    ]
+
+    mapper._map_validated = lambda raw: raw["missing"]
+    dtos, rejects = mapper.map_many(raws)
+    assert dtos == []
+    assert [r.error for r in rejects] == ["KeyError"] * 3
+
+
+def test_sample_config_maps_sample_payload():
+    # parse_date yields datetimes, which the config's date rules must accept
+    with open("pms_configs/sample_pms_v1.json", encoding="utf-8") as f:
+        mapper = GenericJsonMapper(json.load(f))
+    with open("mock_data/mock_pms_bookings_payload.json", encoding="utf-8") as f:
+        (raw,) = json.load(f)
+
+    dto = mapper.map(raw)
+
+    assert dto.booking_id == "ABC123"
+    assert (dto.check_in.date(), dto.check_out.date()) == (
+        date(2025, 7, 5),
+        date(2025, 7, 7),
+    )
+    assert (dto.room_type, dto.total_amount) == ("STD", Decimal("200.00"))
@@ -0,0 +1,60 @@
+import pytest
+from pms_integration.services.mapper import GenericJsonMapper
+from pms_integration.services.parallel_mapper import (
+    ParallelMapper,
+    create_process_pool,
+    map_in_chunks,
+)
+
+CONFIG = {
+    "field_mappings": {
+        "booking_id": "$.reservation.confirmationNumber",
+        "guest_name": "$.guest.name",
+        "check_in": {"path": "$.stay.start", "transform": "parse_date"},
+        "check_out": {"path": "$.stay.end", "transform": "parse_date"},
+        "status": {"path": "$.reservation.status", "transform": "map_status"},
+    },
+    "status_mappings": {"CONFIRMED": "confirmed", "BAD": "bogus"},
+    "validation_rules": {
+        "fields": {"status": {"type": "enum", "allowed": ["confirmed"]}},
+    },
+}
+
+
+def raw_booking(i):
+    return {
+        "reservation": {
+            "confirmationNumber": f"B{i:03}",
+            "status": "BAD" if i % 5 == 0 else "CONFIRMED",
+        },
+        "guest": {"name": f"Guest {i}"},
+        "stay": {"start": "2025-07-05T14:00:00", "end": "2025-07-07T10:00:00"},
+    }
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    with create_process_pool(2) as pool:
+        yield pool
+
+
+def test_matches_serial_mapping_in_order(process_pool):
+    mapper = GenericJsonMapper(CONFIG)
+    raws = [raw_booking(i) for i in range(23)]
+
+    serial = list(map_in_chunks(mapper, raws, chunk_size=4))
+    parallel = list(
+        ParallelMapper(process_pool, mapper, chunk_size=4, max_pending=2).map(raws)
+    )
+
+    assert len(parallel) == len(serial) == 6
+    for (s_accepted, s_rejects), (p_accepted, p_rejects) in zip(serial, parallel):
+        assert p_rejects == s_rejects
+        assert [item for item, _ in p_accepted] == [item for item, _ in s_accepted]
+        assert [dto.model_dump() for _, dto in p_accepted] == [
+            dto.model_dump() for _, dto in s_accepted
+        ]
+
+    rejects = [reject for _, rejected in parallel for _, reject in rejected]
+    assert [r.booking_id for r in rejects] == ["B000", "B005", "B010", "B015", "B020"]
+    assert {r.error for r in rejects} == {"PMSBusinessRuleError"}
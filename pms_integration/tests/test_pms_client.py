@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from pms_integration.exceptions import PMSConnectionError
+from pms_integration.services.pms_client import PMSClient
+
+RECORDS = [
+    {"reservation": {"confirmationNumber": f"B{i:03}", "notes": "x, ]} [{" * i}}
+    for i in range(25)
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_streams_json_array(tmp_path, chunk_size):
+    path = tmp_path / "bookings.json"
+    path.write_text(json.dumps(RECORDS, indent=2), encoding="utf-8")
+
+    client = PMSClient(str(path), chunk_size=chunk_size)
+    assert list(client.iter_bookings()) == RECORDS
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7])
+def test_json_array_after_leading_whitespace_and_bom(tmp_path, chunk_size):
+    path = tmp_path / "bookings.json"
+    path.write_text("\n" * 20 + json.dumps(RECORDS), encoding="utf-8-sig")
+
+    client = PMSClient(str(path), chunk_size=chunk_size)
+    assert list(client.iter_bookings()) == RECORDS
+
+
+def test_streams_ndjson(tmp_path):
+    path = tmp_path / "bookings.ndjson"
+    path.write_text("\n".join(json.dumps(r) for r in RECORDS) + "\n\n")
+
+    assert PMSClient(str(path)).fetch_bookings() == RECORDS
+
+
+def test_empty_array(tmp_path):
+    path = tmp_path / "bookings.json"
+    path.write_text(" [ ] ")
+
+    assert PMSClient(str(path)).fetch_bookings() == []
+
+
+def test_truncated_array(tmp_path):
+    path = tmp_path / "bookings.json"
+    path.write_text(json.dumps(RECORDS)[:-20])
+
+    with pytest.raises(PMSConnectionError):
+        list(PMSClient(str(path), chunk_size=16).iter_bookings())
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(PMSConnectionError):
+        PMSClient(str(tmp_path / "missing.json")).fetch_bookings()
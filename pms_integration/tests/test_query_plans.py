@@ -0,0 +1,76 @@
+"""
+EXPLAIN QUERY PLAN checks for the hot queries of the ingestion pipeline and
+the bookings API. A query that falls back to a full table (or full index)
+scan, or sorts in a temp b-tree, fails the test.
+"""
+
+from datetime import date, datetime, timezone
+
+import pytest
+from django.db import connection
+from pms_integration.models.booking import Booking, get_bookings_for_hotel
+from pms_integration.models.guest import Guest
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.models.room import Room
+from pms_integration.views.pagination import KeysetPaginator
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != "sqlite", reason="EXPLAIN QUERY PLAN is SQLite specific"
+)
+
+CURSOR = KeysetPaginator.encode(datetime(2025, 7, 1, tzinfo=timezone.utc), 100)
+
+
+def hot_queries(hotel_id):
+    bookings = Booking.objects.filter(hotel_id=hotel_id)
+    return {
+        "bookings_first_page": lambda: get_bookings_for_hotel(hotel_id)[0][:100],
+        "bookings_keyset_page": lambda: KeysetPaginator(100).page_queryset(
+            bookings, CURSOR
+        )[:101],
+        "bookings_by_status": lambda: KeysetPaginator(100).page_queryset(
+            bookings.filter(status="confirmed"), CURSOR
+        )[:101],
+        "bookings_updated_since": lambda: bookings.filter(
+            updated_at__gte=datetime(2025, 7, 1, tzinfo=timezone.utc)
+        ).order_by("-updated_at", "-id")[:101],
+        "bookings_check_in_range": lambda: bookings.filter(
+            check_in__gte=date(2025, 7, 1), check_in__lte=date(2025, 7, 31)
+        ),
+        "bookings_check_out_range": lambda: bookings.filter(
+            check_out__gte=date(2025, 7, 1), check_out__lte=date(2025, 7, 31)
+        ),
+        "bookings_status_check_in": lambda: bookings.filter(
+            status="confirmed", check_in__gte=date(2025, 7, 1)
+        ),
+        "stored_hashes": lambda: bookings.filter(
+            booking_id__in=["B001", "B002"]
+        ).values_list("booking_id", "source_hash"),
+        "guests_by_name": lambda: Guest.objects.filter(
+            name__in=["John Doe", "Jane Doe"]
+        ).values_list("pk", "name", "email"),
+        "rooms_by_type": lambda: Room.objects.filter(
+            hotel_id=hotel_id, room_type__in=["STD", "DLX"]
+        ).values_list("pk", "room_type"),
+    }
+
+
+@pytest.fixture
+def hotel(db):
+    pms_config = PMSConfig.objects.create(
+        name="sample", version="v1", config_file_path="pms_configs/sample_pms_v1.json"
+    )
+    return Hotel.objects.create(name="Hotel Test", pms_config=pms_config)
+
+
+def query_plan(queryset) -> list:
+    return [line.split(" ", 3)[-1] for line in queryset.explain().splitlines()]
+
+
+@pytest.mark.parametrize("name", list(hot_queries(0)))
+def test_hot_query_uses_index(hotel, name):
+    plan = query_plan(hot_queries(hotel.id)[name]())
+
+    full_scans = [step for step in plan if step.startswith("SCAN ")]
+    temp_sorts = [step for step in plan if "TEMP B-TREE" in step]
+    assert not full_scans and not temp_sorts, f"{name}: {plan}"
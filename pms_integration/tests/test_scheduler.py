@@ -0,0 +1,113 @@
+import threading
+import time
+
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.models.sync_run import SyncRun
+from pms_integration.services.scheduler import SyncScheduler
+
+
+def make_hotel(hotel_id, vendor="opera"):
+    return Hotel(
+        id=hotel_id, name=f"Hotel {hotel_id}", pms_config=PMSConfig(name=vendor)
+    )
+
+
+def make_run(duration=1.0, changed=0):
+    return SyncRun(duration_seconds=duration, inserted=changed, updated=0)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_due_hotels_start_largest_first():
+    order = []
+
+    def sync(hotel):
+        order.append(hotel.id)
+        return make_run()
+
+    scheduler = SyncScheduler(sync, workers=1, clock=Clock())
+    for hotel_id, duration in [(1, 1.0), (2, 5.0), (3, 3.0)]:
+        scheduler.add(make_hotel(hotel_id), last_duration=duration)
+
+    assert scheduler.run(threading.Event(), max_syncs=3) == 3
+    assert order == [2, 3, 1]
+
+
+def test_vendor_concurrency_cap():
+    lock = threading.Lock()
+    active = {"opera": 0, "mews": 0}
+    peak = {"opera": 0, "mews": 0}
+
+    def sync(hotel):
+        vendor = hotel.pms_config.name
+        with lock:
+            active[vendor] += 1
+            peak[vendor] = max(peak[vendor], active[vendor])
+        time.sleep(0.02)
+        with lock:
+            active[vendor] -= 1
+        return make_run()
+
+    scheduler = SyncScheduler(
+        sync, workers=4, vendor_limits={"opera": 1}, default_vendor_limit=2
+    )
+    for hotel_id in range(3):
+        scheduler.add(make_hotel(hotel_id, "opera"))
+    for hotel_id in range(3, 6):
+        scheduler.add(make_hotel(hotel_id, "mews"))
+
+    assert scheduler.run(threading.Event(), max_syncs=6) == 6
+    assert peak == {"opera": 1, "mews": 2}
+
+
+def test_interval_adapts_to_changes_and_duration():
+    scheduler = SyncScheduler(
+        lambda hotel: None, min_interval=60, max_interval=3600, duration_factor=4
+    )
+    scheduler.add(make_hotel(1))
+    schedule = scheduler.schedules[1]
+    schedule.interval = 480
+
+    assert scheduler.next_interval(schedule, make_run(changed=5)) == 240
+    assert scheduler.next_interval(schedule, make_run(changed=0)) == 480
+    # Never re-synced more often than 4x its own duration
+    assert scheduler.next_interval(schedule, make_run(duration=300, changed=3)) == 1200
+
+    schedule.interval = 60
+    assert scheduler.next_interval(schedule, make_run(changed=1)) == 60
+
+
+def test_failing_hotel_backs_off():
+    clock = Clock()
+    errors = []
+
+    def sync(hotel):
+        raise RuntimeError("PMS down")
+
+    scheduler = SyncScheduler(
+        sync,
+        workers=1,
+        min_interval=60,
+        max_backoff=200,
+        clock=clock,
+        on_error=lambda hotel, e: errors.append(str(e)),
+    )
+    scheduler.add(make_hotel(1))
+    schedule = scheduler.schedules[1]
+
+    delays = []
+    for _ in range(4):
+        clock.now = schedule.next_due
+        scheduler.run(threading.Event(), max_syncs=1)
+        delays.append(schedule.next_due - clock.now)
+
+    assert schedule.failures == 4
+    assert errors == ["PMS down"] * 4
+    for delay, cap in zip(delays, [60, 120, 200, 200]):
+        assert cap / 2 <= delay <= cap
@@ -0,0 +1,140 @@
+import json
+import multiprocessing
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from pms_integration.exceptions import SyncLeaseError
+from pms_integration.management.commands.sync_hotel_bookings import Command
+from pms_integration.models.booking import Booking
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.models.sync_lease import SyncLease
+from pms_integration.services.leases import LeaseManager
+from pms_integration.tests import lease_nodes
+
+CONFIG = {
+    "field_mappings": {
+        "booking_id": "$.id",
+        "guest_name": "$.guest",
+        "check_in": {"path": "$.start", "transform": "parse_date"},
+        "check_out": {"path": "$.end", "transform": "parse_date"},
+    },
+}
+
+
+@pytest.fixture
+def hotel(db, tmp_path):
+    path = tmp_path / "pms.json"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    pms_config = PMSConfig.objects.create(
+        name="sample", version="v1", config_file_path=str(path)
+    )
+    return Hotel.objects.create(name="Hotel Test", pms_config=pms_config)
+
+
+def expire(hotel):
+    SyncLease.objects.filter(hotel=hotel).update(
+        expires_at=timezone.now() - timedelta(seconds=1)
+    )
+
+
+def test_claim_is_exclusive_until_released(hotel):
+    node_a, node_b = LeaseManager("a"), LeaseManager("b")
+
+    lease = node_a.claim(hotel.id)
+    assert lease is not None
+    assert node_b.claim(hotel.id) is None
+    assert node_a.claim(hotel.id) is None  # not twice by one worker either
+
+    node_a.release(lease)
+    assert node_b.claim(hotel.id) is not None
+    assert SyncLease.objects.get(hotel=hotel).owner == "b"
+
+
+def test_expired_lease_is_taken_over_and_lost_by_its_holder(hotel):
+    node_a, node_b = LeaseManager("a", ttl=30), LeaseManager("b", ttl=30)
+    lease = node_a.claim(hotel.id)
+    lease.check()
+
+    expire(hotel)
+    taken = node_b.claim(hotel.id)
+    assert taken is not None
+
+    node_a.heartbeat()
+    assert lease.lost.is_set()
+    with pytest.raises(SyncLeaseError):
+        lease.check()
+
+    # The former holder can no longer release the new holder's lease
+    node_a.release(lease)
+    assert SyncLease.objects.get(hotel=hotel).owner == "b"
+    taken.check()
+
+
+def test_heartbeat_renews_held_leases(hotel):
+    node = LeaseManager("a", ttl=30)
+    lease = node.claim(hotel.id)
+    expire(hotel)
+
+    node.heartbeat()
+
+    assert not lease.lost.is_set()
+    row = SyncLease.objects.get(hotel=hotel)
+    assert row.expires_at > timezone.now() + timedelta(seconds=20)
+    assert lease.expires_at == row.expires_at
+    assert LeaseManager("b").claim(hotel.id) is None
+
+
+def test_claimed_after_skips_hotels_claimed_since(hotel):
+    started_at = timezone.now()
+    node_a, node_b = LeaseManager("a"), LeaseManager("b")
+    node_a.release(node_a.claim(hotel.id, claimed_after=started_at))
+
+    assert node_b.claim(hotel.id, claimed_after=started_at) is None
+    assert node_b.claim(hotel.id, claimed_after=timezone.now()) is not None
+
+
+def test_close_releases_held_leases(hotel):
+    node = LeaseManager("a", heartbeat_interval=0.01).start()
+    node.claim(hotel.id)
+    node.close()
+
+    assert SyncLease.objects.get(hotel=hotel).owner == ""
+    with LeaseManager("b").hold(hotel.id):
+        with pytest.raises(SyncLeaseError):
+            with LeaseManager("c").hold(hotel.id):
+                pass
+
+
+def test_sync_stops_writing_when_its_lease_is_lost(hotel):
+    command = Command()
+    command.full = False
+    command.mode = "thread"
+    command.process_pool = None
+    command.runs = {}
+    lease = LeaseManager("a").claim(hotel.id)
+    sync = command.start_sync(hotel, lease)
+    lease.lost.set()
+
+    raws = [{"id": "B1", "guest": "Ann", "start": "2025-07-05", "end": "2025-07-07"}]
+    with pytest.raises(SyncLeaseError):
+        command.ingest(sync, raws)
+    assert not Booking.objects.exists()
+
+
+def test_nodes_in_separate_processes_never_sync_a_hotel_twice(tmp_path):
+    db_path = str(tmp_path / "leases.sqlite3")
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        hotel_ids = pool.apply(lease_nodes.create_hotels, (db_path, 12))
+
+    started_at = timezone.now()
+    with context.Pool(3) as pool:
+        results = pool.starmap(
+            lease_nodes.run_node,
+            [(db_path, f"node-{n}", hotel_ids, started_at, 0.1) for n in range(3)],
+        )
+
+    synced = [hotel_id for node in results for hotel_id in node]
+    assert sorted(synced) == sorted(hotel_ids)  # each hotel once, by one node
+    assert sum(1 for node in results if node) > 1
@@ -0,0 +1,226 @@
+import json
+
+import pytest
+from django.db import IntegrityError
+from django.test import Client
+from pms_integration.management.commands.sync_hotel_bookings import Command
+from pms_integration.models.hotel import Hotel, PMSConfig
+from pms_integration.models.sync_run import SyncRun
+from pms_integration.models.sync_state import get_watermark
+from pms_integration.services.db_writer import DBWriter
+from pms_integration.services.fetch_coalescer import FetchCoalescer
+from pms_integration.services.metrics import StageTimer
+
+CONFIG = {
+    "field_mappings": {
+        "booking_id": "$.id",
+        "guest_name": "$.guest",
+        "check_in": {"path": "$.start", "transform": "parse_date"},
+        "check_out": {"path": "$.end", "transform": "parse_date"},
+        "status": {"path": "$.status", "transform": "map_status"},
+    },
+    "status_mappings": {"CONFIRMED": "confirmed"},
+}
+
+
+def raw_booking(i, status="CONFIRMED"):
+    return {
+        "id": f"B{i:03}",
+        "guest": f"Guest {i}",
+        "start": "2025-07-05T14:00:00",
+        "end": "2025-07-07T10:00:00",
+        "status": status,
+    }
+
+
+@pytest.fixture
+def hotel(db, tmp_path):
+    path = tmp_path / "pms.json"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    pms_config = PMSConfig.objects.create(
+        name="sample", version="v1", config_file_path=str(path)
+    )
+    return Hotel.objects.create(name="Hotel Test", pms_config=pms_config)
+
+
+def run_sync(hotel, raws, writer=None):
+    command = Command()
+    command.full = False
+    command.mode = "thread"
+    command.process_pool = None
+    command.runs = {}
+    command.writer = writer
+    sync = command.start_sync(hotel)
+    command.ingest(sync, sync.timer.iterate("fetch", raws))
+    return command.record_run(sync)
+
+
+def test_stage_timer_iterate_counts_items():
+    timer = StageTimer()
+    assert list(timer.iterate("fetch", [[1, 2], [3]], size=len)) == [[1, 2], [3]]
+
+    other = StageTimer()
+    other.add("write", 0.5, 3)
+    timer.merge(other.as_dict())
+
+    stages = timer.as_dict()
+    assert list(stages) == ["fetch", "write"]
+    assert stages["fetch"]["records"] == 3
+    assert stages["write"] == {"seconds": 0.5, "records": 3}
+
+
+def test_sync_run_records_stages_and_counts(hotel):
+    raws = [raw_booking(i) for i in range(4)] + [raw_booking(9, status="UNKNOWN")]
+
+    run = run_sync(hotel, raws)
+
+    assert run.status == SyncRun.Status.SUCCESS
+    assert (run.inserted, run.updated, run.skipped, run.failed) == (4, 0, 0, 1)
+    assert run.query_count > 0
+    assert set(run.stages) == {
+        "fetch",
+        "detect",
+        "schema",
+        "extract",
+        "rules",
+        "dto",
+        "write",
+        "dead_letter",
+    }
+    assert run.stages["extract"]["records"] == 5
+    assert run.stages["write"]["records"] == 4
+    assert run.summary()["stages"] == run.stages
+
+
+def test_metrics_endpoint_reports_latest_run(hotel):
+    run_sync(hotel, [raw_booking(1)])
+    latest = run_sync(hotel, [raw_booking(1), raw_booking(2)])
+
+    response = Client().get("/metrics/")
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain")
+    body = response.content.decode()
+    assert f'pms_sync_success{{hotel="{hotel.id}"}} 1' in body
+    assert f'pms_sync_records{{hotel="{hotel.id}",result="inserted"}} 1' in body
+    assert f'pms_sync_records{{hotel="{hotel.id}",result="skipped"}} 1' in body
+    assert f'pms_sync_queries{{hotel="{hotel.id}"}} {latest.query_count}' in body
+    assert f'pms_sync_stage_seconds{{hotel="{hotel.id}",stage="write"}}' in body
+
+
+@pytest.fixture
+def committed_hotel(transactional_db, tmp_path):
+    # Visible to the connections of other threads
+    path = tmp_path / "pms.json"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    pms_config = PMSConfig.objects.create(
+        name="sample", version="v1", config_file_path=str(path)
+    )
+    return Hotel.objects.create(name="Hotel Test", pms_config=pms_config)
+
+
+def test_query_count_includes_writes_on_the_writer(committed_hotel):
+    other = Hotel.objects.create(
+        name="Hotel Other", pms_config=committed_hotel.pms_config
+    )
+    raws = [raw_booking(i) for i in range(5)]
+    plain = run_sync(committed_hotel, raws)
+
+    with DBWriter() as writer:
+        small = run_sync(other, raws, writer)
+        large = run_sync(other, [raw_booking(i) for i in range(5, 1505)], writer)
+
+    assert small.query_count >= plain.query_count
+    assert large.query_count > small.query_count
+
+
+def test_pipelined_sync_matches_sequential(committed_hotel):
+    hotel = committed_hotel
+    raws = [raw_booking(i) for i in range(1200)] + [raw_booking(9, "UNKNOWN")]
+
+    command = Command()
+    command.full = False
+    command.mode = "thread"
+    command.process_pool = None
+    command.runs = {}
+    sync = command.start_sync(hotel)
+    command.ingest_pipelined(sync, sync.timer.iterate("fetch", raws))
+    run = command.record_run(sync)
+
+    assert (run.inserted, run.updated, run.skipped, run.failed) == (1200, 0, 0, 1)
+    assert run.stages["write"]["records"] == 1200
+    assert run.stages["write_wait"]["records"] == 3  # chunks of 500
+    assert run.query_count > 0
+    assert hotel.bookings.count() == 1200
+
+
+def test_watermark_kept_when_bookings_fail_to_write(hotel):
+    command = Command()
+    command.full = False
+    command.mode = "thread"
+    command.process_pool = None
+    command.runs = {}
+    sync = command.start_sync(hotel)
+
+    def save_bookings(dtos):
+        return 0, [(dto, IntegrityError("write failed")) for dto in dtos]
+
+    sync.ingestor.save_bookings = save_bookings
+    command.ingest(sync, [raw_booking(1)])
+    command.advance_watermark(sync)
+    assert sync.counts["failed"] == 1
+    assert get_watermark(hotel.id) is None
+
+    retry = command.start_sync(hotel)
+    command.ingest(retry, [raw_booking(1)])
+    command.advance_watermark(retry)
+    assert get_watermark(hotel.id) == retry.started_at
+
+
+def test_shared_fetch_sets_watermark_from_fetch_time(hotel):
+    other = Hotel.objects.create(name="Hotel Other", pms_config=hotel.pms_config)
+    command = Command()
+    command.full = False
+    command.mode = "thread"
+    command.process_pool = None
+    command.runs = {}
+    command.fetcher = FetchCoalescer()
+    command.plan_fetches([hotel, other])
+    source = ("file", "bookings.json")
+
+    first = command.start_sync(hotel)
+    command.ingest(
+        first, command.fetch_records(first, source, lambda: [raw_booking(1)])
+    )
+    command.advance_watermark(first)
+
+    # Served from the first hotel's cached payload
+    second = command.start_sync(other)
+    records = command.fetch_records(second, source, lambda: [raw_booking(2)])
+    assert [raw["id"] for raw in records] == ["B001"]
+    command.ingest(second, records)
+    command.advance_watermark(second)
+
+    assert command.fetcher.stats() == {"loads": 1, "shared": 1}
+    assert get_watermark(hotel.id) == first.started_at
+    assert second.fetched_at < second.started_at
+    assert get_watermark(other.id) == second.fetched_at
+
+
+def test_unshared_source_is_streamed(hotel):
+    command = Command()
+    command.full = False
+    command.mode = "thread"
+    command.process_pool = None
+    command.runs = {}
+    command.fetcher = FetchCoalescer()
+    command.plan_fetches([hotel])
+    sync = command.start_sync(hotel)
+
+    records = command.fetch_records(
+        sync, ("file", "bookings.json"), lambda: iter([raw_booking(1)])
+    )
+
+    assert not isinstance(records, list)
+    assert [raw["id"] for raw in records] == ["B001"]
+    assert command.fetcher.stats() == {"loads": 0, "shared": 0}
@@ -18,10 +18,18 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 from pms_integration.views.bookings import BookingListView
+from pms_integration.views.export import BookingExportView
+from pms_integration.views.metrics import SyncMetricsView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path(
         "api/integrations/pms/bookings/", BookingListView.as_view(), name="booking-list"
     ),
+    path(
+        "api/integrations/pms/bookings/export/",
+        BookingExportView.as_view(),
+        name="booking-export",
+    ),
+    path("metrics/", SyncMetricsView.as_view(), name="sync-metrics"),
 ]
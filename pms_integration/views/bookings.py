@@ -1,11 +1,35 @@
-from pms_integration.serializers.booking_serializer import BookingSerializer
-from pms_integration.models.booking import get_bookings_for_hotel
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.db.models import Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from pms_integration.models.booking import Booking, get_bookings_for_hotel
+from pms_integration.models.sync_state import get_data_version
+from pms_integration.serializers.booking_query_serializer import (
+    BookingQuerySerializer,
+)
+from pms_integration.serializers.booking_serializer import FastBookingSerializer
+from pms_integration.services.booking_cache import BookingPageCache
+from pms_integration.views.pagination import InvalidCursor, KeysetPaginator
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+FILTER_LOOKUPS = {
+    "status": "status",
+    "check_in_from": "check_in__gte",
+    "check_in_to": "check_in__lte",
+    "check_out_from": "check_out__gte",
+    "check_out_to": "check_out__lte",
+    "updated_since": "updated_at__gte",
+}
+
 
 class BookingListView(APIView):
+    page_cache = BookingPageCache()
+    serializer = FastBookingSerializer()
+
     def get(self, request):
         hotel_id = request.query_params.get("hotel_id")
 
@@ -15,9 +39,85 @@ class BookingListView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        bookings, error = get_bookings_for_hotel(int(hotel_id))
+        query = BookingQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response({"error": query.errors}, status=status.HTTP_400_BAD_REQUEST)
+        params = query.validated_data
+
+        hotel_id = int(hotel_id)
+        bookings, error = get_bookings_for_hotel(hotel_id)
         if error:
             return Response({"error": error}, status=status.HTTP_404_NOT_FOUND)
 
-        serializer = BookingSerializer(bookings, many=True)
-        return Response(serializer.data)
+        # Conditional GET: the ETag follows the hotel's data version, which
+        # the ingestor bumps on every write
+        version = get_data_version(hotel_id)
+        last_modified = Booking.objects.filter(hotel_id=hotel_id).aggregate(
+            Max("updated_at")
+        )["updated_at__max"]
+        validators = {
+            "ETag": f'"{hotel_id}-{version}"',
+            "Cache-Control": "no-cache",
+        }
+        if last_modified:
+            validators["Last-Modified"] = http_date(last_modified.timestamp())
+
+        not_modified = get_conditional_response(
+            request._request,
+            etag=validators["ETag"],
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+        if not_modified is not None:
+            for header, value in validators.items():
+                not_modified[header] = value
+            return not_modified
+
+        query_key = urlencode(sorted(request.query_params.lists()), doseq=True)
+        page = self.page_cache.get(hotel_id, version, query_key)
+        if page is None:
+            page, error = self.render_page(bookings, params)
+            if error:
+                return error
+            self.page_cache.set(hotel_id, version, query_key, page)
+
+        headers = dict(validators)
+        if page["next_cursor"]:
+            # Built per request: the cached page is shared across hosts
+            next_url = request.build_absolute_uri(
+                self.page_url(request, cursor=page["next_cursor"])
+            )
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return Response(page["data"], headers=headers)
+
+    def render_page(self, bookings, params):
+        """Returns ({"data": [...], "next_cursor": str or None}, error response)."""
+        bookings = bookings.filter(
+            **{
+                lookup: params[name]
+                for name, lookup in FILTER_LOOKUPS.items()
+                if name in params
+            }
+        )
+
+        paginator = KeysetPaginator(
+            params.get("page_size", settings.BOOKINGS_PAGE_SIZE)
+        )
+        try:
+            rows, next_cursor = paginator.paginate(
+                self.serializer.values(bookings, "updated_at", "id"),
+                params.get("cursor"),
+            )
+        except InvalidCursor as e:
+            return None, Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return {
+            "data": self.serializer.serialize(rows),
+            "next_cursor": next_cursor,
+        }, None
+
+    @staticmethod
+    def page_url(request, **overrides) -> str:
+        params = request.query_params.copy()
+        for key, value in overrides.items():
+            params[key] = value
+        return f"{request.path}?{params.urlencode()}"
@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from pms_integration.models.booking import get_bookings_for_hotel
+from pms_integration.serializers.booking_export import stream_json, stream_ndjson
+from pms_integration.serializers.booking_query_serializer import (
+    BookingQuerySerializer,
+)
+from pms_integration.views.bookings import FILTER_LOOKUPS
+
+EXPORT_FORMATS = {
+    "json": (stream_json, "application/json"),
+    "ndjson": (stream_ndjson, "application/x-ndjson"),
+}
+
+
+class BookingExportView(View):
+    """
+    Full export of a hotel's bookings, newest updates first, as a streamed
+    JSON array (`format=json`, the default) or NDJSON (`format=ndjson`).
+
+    Rows are read with a chunked `values_list` iterator and encoded by hand,
+    so memory stays flat and the first bytes go out before the last rows
+    are read. Takes the same filters as the bookings list.
+    """
+
+    def get(self, request):
+        hotel_id = request.GET.get("hotel_id")
+        if not hotel_id or not hotel_id.isdigit():
+            return JsonResponse({"error": "Invalid or missing hotel_id"}, status=400)
+
+        export_format = request.GET.get("format", "json")
+        if export_format not in EXPORT_FORMATS:
+            return JsonResponse(
+                {"error": f"Unsupported format {export_format!r}"}, status=400
+            )
+
+        query = BookingQuerySerializer(data=request.GET)
+        if not query.is_valid():
+            return JsonResponse({"error": query.errors}, status=400)
+        params = query.validated_data
+
+        bookings, error = get_bookings_for_hotel(int(hotel_id))
+        if error:
+            return JsonResponse({"error": error}, status=404)
+        bookings = bookings.filter(
+            **{
+                lookup: params[name]
+                for name, lookup in FILTER_LOOKUPS.items()
+                if name in params
+            }
+        )
+
+        stream, content_type = EXPORT_FORMATS[export_format]
+        response = StreamingHttpResponse(
+            stream(bookings, settings.BOOKINGS_EXPORT_CHUNK_SIZE),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="bookings-{hotel_id}.{export_format}"'
+        )
+        return response
@@ -0,0 +1,88 @@
+from django.http import HttpResponse
+from django.views import View
+from pms_integration.models.sync_run import SyncRun, latest_sync_runs
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+RUN_METRICS = [
+    ("pms_sync_duration_seconds", "Duration of the last sync", "duration_seconds"),
+    ("pms_sync_queries", "Database queries issued by the last sync", "query_count"),
+    (
+        "pms_sync_peak_memory_bytes",
+        "Peak RSS of the process that ran the last sync",
+        "peak_memory_kb",
+    ),
+]
+RECORD_RESULTS = ("inserted", "updated", "skipped", "failed")
+
+
+class SyncMetricsView(View):
+    """Latest sync run of every hotel, in the Prometheus text format."""
+
+    def get(self, request):
+        runs = list(latest_sync_runs().order_by("hotel_id"))
+        return HttpResponse(render_metrics(runs), content_type=CONTENT_TYPE)
+
+
+def render_metrics(runs):
+    lines = []
+
+    def metric(name, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for labels, value in samples:
+            label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}")
+
+    metric(
+        "pms_sync_success",
+        "1 if the last sync succeeded, 0 if it failed",
+        [
+            ({"hotel": run.hotel_id}, int(run.status == SyncRun.Status.SUCCESS))
+            for run in runs
+        ],
+    )
+    metric(
+        "pms_sync_last_run_timestamp_seconds",
+        "Start time of the last sync",
+        [({"hotel": run.hotel_id}, run.started_at.timestamp()) for run in runs],
+    )
+    for name, help_text, attr in RUN_METRICS:
+        scale = 1024 if attr == "peak_memory_kb" else 1
+        metric(
+            name,
+            help_text,
+            [
+                ({"hotel": run.hotel_id}, getattr(run, attr) * scale)
+                for run in runs
+                if getattr(run, attr) is not None
+            ],
+        )
+    metric(
+        "pms_sync_records",
+        "Records of the last sync, by result",
+        [
+            ({"hotel": run.hotel_id, "result": result}, getattr(run, result))
+            for run in runs
+            for result in RECORD_RESULTS
+        ],
+    )
+    metric(
+        "pms_sync_stage_seconds",
+        "Time spent in each pipeline stage during the last sync",
+        [
+            ({"hotel": run.hotel_id, "stage": stage}, values["seconds"])
+            for run in runs
+            for stage, values in run.stages.items()
+        ],
+    )
+    metric(
+        "pms_sync_stage_records",
+        "Records processed by each pipeline stage during the last sync",
+        [
+            ({"hotel": run.hotel_id, "stage": stage}, values["records"])
+            for run in runs
+            for stage, values in run.stages.items()
+        ],
+    )
+    return "\n".join(lines) + "\n"